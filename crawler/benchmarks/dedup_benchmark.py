@@ -0,0 +1,89 @@
+"""
+중복 제거 벤치마크
+저장된 enhanced_news 데이터로 중복 제거 방식별 소요 시간과 남은 항목 수를 측정하고,
+기존 전체 쌍 비교(pairwise) 대비 속도 향상과 결과 일치 여부를 출력
+
+사용법 (crawler 디렉토리에서):
+    python benchmarks/dedup_benchmark.py
+    python benchmarks/dedup_benchmark.py --limit 3000 --method exact --method tfidf
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+
+CRAWLER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CRAWLER_DIR)
+
+import config  # noqa: E402
+from enhanced_crawler import EnhancedSongdoCrawler  # noqa: E402
+
+METHODS = ["pairwise", "exact", "minhash", "tfidf"]
+# 기존 비교와 결과가 반드시 같아야 하는 방식
+EXACT_METHODS = {"exact"}
+
+
+def load_items(limit):
+    """enhanced_news 파일의 항목을 파일명 순서대로 limit개까지 읽기"""
+    items = []
+    for file_path in sorted(glob.glob(f"{config.DATA_DIR}/enhanced_news/*_enhanced_news_*.json")):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            items.extend(json.load(f))
+        if limit and len(items) >= limit:
+            return items[:limit]
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description='중복 제거 방식 벤치마크')
+    parser.add_argument('--limit', type=int, default=1000, help='사용할 항목 수 (0이면 전체, pairwise는 항목 수의 제곱에 비례)')
+    parser.add_argument('--method', action='append', choices=METHODS, help='측정할 방식 (여러 번 지정 가능, 기본: 전체)')
+    args = parser.parse_args()
+
+    os.chdir(CRAWLER_DIR)
+    items = load_items(args.limit)
+    if not items:
+        print("❌ 벤치마크할 enhanced_news 데이터가 없습니다.")
+        return 1
+
+    methods = args.method or METHODS
+    if "pairwise" not in methods:
+        methods = ["pairwise"] + methods
+
+    print(f"🧪 중복 제거 벤치마크 - 항목 {len(items)}개, 방식: {', '.join(methods)}\n")
+    crawler = EnhancedSongdoCrawler()
+    results = {}
+    try:
+        for method in methods:
+            started = time.perf_counter()
+            unique_items = crawler.remove_duplicates(items, method=method)
+            results[method] = (time.perf_counter() - started, unique_items)
+    finally:
+        crawler.close()
+
+    baseline_seconds, baseline_items = results["pairwise"]
+    baseline_ids = [id(item) for item in baseline_items]
+    mismatches = []
+
+    print(f"{'방식':<10} {'시간(초)':>10} {'유니크':>8} {'속도 향상':>10}  결과")
+    for method in methods:
+        seconds, unique_items = results[method]
+        identical = [id(item) for item in unique_items] == baseline_ids
+        speedup = baseline_seconds / seconds if seconds else float('inf')
+        print(f"{method:<10} {seconds:>10.3f} {len(unique_items):>8} {speedup:>9.1f}x  {'동일' if identical else '다름'}")
+        if method in EXACT_METHODS and not identical:
+            mismatches.append(method)
+
+    if mismatches:
+        print(f"\n❌ 기존 비교와 결과가 다른 방식: {', '.join(mismatches)}")
+        return 1
+
+    print("\n✅ 정확 비교 방식의 결과가 기존 전체 쌍 비교와 동일합니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+검색 결과 파서 마이크로 벤치마크
+저장된 HTML 픽스처로 백엔드(html.parser / lxml / selectolax)별 추출 속도와 최대 메모리를 측정하고,
+모든 백엔드가 동일한 항목을 추출하는지 검증
+
+사용법 (crawler 디렉토리에서):
+    python benchmarks/parser_benchmark.py
+    python benchmarks/parser_benchmark.py --iterations 50 --backend lxml --backend selectolax
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+CRAWLER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CRAWLER_DIR)
+
+import parsers  # noqa: E402
+from html_backends import available_backends  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 픽스처 파일 -> (파서 함수, 검색 키워드)
+FIXTURES = {
+    "naver_news_legacy.html": (parsers.parse_naver_news, "인천 송도"),
+    "naver_news_2025_07.html": (parsers.parse_naver_news, "송도국제도시"),
+    "naver_blog.html": (parsers.parse_naver_blog, "인천 송도 맛집"),
+    "naver_cafe.html": (parsers.parse_naver_cafe, "송도국제도시"),
+    "youtube_rendered.html": (parsers.parse_youtube, "송도국제도시"),
+}
+
+# 백엔드와 무관한 JSON 추출 경로 (참고용으로 함께 측정)
+JSON_FIXTURES = {
+    "youtube_initial_data.html": "송도국제도시",
+}
+
+# 픽스처의 모든 항목을 추출하도록 충분히 큰 limit 사용
+ITEM_LIMIT = 100
+
+
+def load_fixture(name):
+    """픽스처 HTML 읽기"""
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def parse_initial_data(html, keyword):
+    """ytInitialData 추출 + 영상 항목 변환"""
+    return parsers.parse_youtube_initial_data(parsers.extract_yt_initial_data(html), keyword, limit=ITEM_LIMIT)
+
+
+def measure(func, iterations):
+    """func를 반복 실행해 (결과, 1회 평균 시간, 최대 메모리 bytes) 반환"""
+    result = func()  # 워밍업
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = (time.perf_counter() - started) / iterations
+
+    # tracemalloc은 실행 속도를 떨어뜨리므로 시간 측정과 분리해 1회만 실행
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def print_row(fixture, backend, items, elapsed, peak):
+    items_per_sec = items / elapsed if elapsed > 0 else 0
+    print(f"{fixture:<28} {backend:<12} {items:>5} {elapsed * 1000:>10.2f} {items_per_sec:>12.0f} {peak / 1024:>10.0f}")
+
+
+def run_benchmark(backends, iterations, fixtures=None):
+    """벤치마크 실행 - 백엔드 간 결과가 다르면 불일치 목록 반환"""
+    mismatches = []
+
+    print(f"{'fixture':<28} {'backend':<12} {'items':>5} {'ms/page':>10} {'items/sec':>12} {'peak KiB':>10}")
+    print("-" * 82)
+
+    for name, (parse_func, keyword) in FIXTURES.items():
+        if fixtures and name not in fixtures:
+            continue
+        html = load_fixture(name)
+
+        reference = None
+        for backend in backends:
+            items, elapsed, peak = measure(
+                lambda: parse_func(html, keyword, limit=ITEM_LIMIT, backend=backend), iterations
+            )
+            print_row(name, backend, len(items), elapsed, peak)
+
+            if not items:
+                mismatches.append(f"{name}: {backend} 백엔드가 항목을 하나도 추출하지 못함")
+            if reference is None:
+                reference = (backend, items)
+            elif items != reference[1]:
+                mismatches.append(f"{name}: {backend} 결과가 {reference[0]} 결과와 다름")
+
+    for name, keyword in JSON_FIXTURES.items():
+        if fixtures and name not in fixtures:
+            continue
+        html = load_fixture(name)
+        items, elapsed, peak = measure(lambda: parse_initial_data(html, keyword), iterations)
+        print_row(name, "json", len(items), elapsed, peak)
+        if not items:
+            mismatches.append(f"{name}: ytInitialData에서 항목을 추출하지 못함")
+
+    print("-" * 82)
+    print("※ peak KiB는 tracemalloc 기준 파이썬 힙 사용량 (lxml/selectolax의 C 메모리는 포함되지 않음)")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검색 결과 파서 벤치마크')
+    parser.add_argument('--iterations', type=int, default=20, help='픽스처당 반복 횟수')
+    parser.add_argument('--backend', action='append', choices=['html.parser', 'lxml', 'selectolax'],
+                        help='측정할 백엔드 (여러 번 지정 가능, 기본: 사용 가능한 전체)')
+    parser.add_argument('--fixture', action='append', help='측정할 픽스처 파일명 (여러 번 지정 가능)')
+    args = parser.parse_args()
+
+    available = available_backends()
+    backends = args.backend or available
+    missing = [backend for backend in backends if backend not in available]
+    if missing:
+        print(f"❌ 설치되지 않은 백엔드: {', '.join(missing)}")
+        return 1
+
+    print(f"🧪 파서 벤치마크 - 백엔드: {', '.join(backends)}, 반복: {args.iterations}회\n")
+    mismatches = run_benchmark(backends, args.iterations, args.fixture)
+
+    if mismatches:
+        print("\n❌ 백엔드 간 결과 불일치:")
+        for mismatch in mismatches:
+            print(f"  - {mismatch}")
+        return 1
+
+    print("\n✅ 모든 백엔드가 동일한 항목을 추출했습니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
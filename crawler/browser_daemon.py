@@ -0,0 +1,312 @@
+"""
+브라우저 데몬
+원격 디버깅 포트로 미리 띄워둔 Chrome에 크롤러가 연결해 실행할 때마다 브라우저를 새로 띄우지 않도록 함
+ChromeDriver 경로는 Chrome 버전별로 캐시해 두고 네트워크 조회 없이 재사용
+
+사용법 (crawler 디렉토리에서):
+    python browser_daemon.py start     # Chrome 세션 시작 (기본: DRIVER_POOL_SIZE개)
+    python browser_daemon.py status    # 실행 상태 확인
+    python browser_daemon.py stop      # 종료
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import signal
+import argparse
+import threading
+import subprocess
+from urllib.request import Request, urlopen
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from loguru import logger
+import config
+from network_profiles import configure_options
+
+CHROME_COMMANDS = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+WINDOWS_CHROME_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
+]
+
+_chrome_version = None
+
+
+def find_chrome_binary():
+    """설치된 Chrome 실행 파일 경로 (없으면 None)"""
+    if config.CHROME_BINARY:
+        return config.CHROME_BINARY
+    for command in CHROME_COMMANDS:
+        path = shutil.which(command)
+        if path:
+            return path
+    for path in WINDOWS_CHROME_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def get_chrome_version():
+    """설치된 Chrome 버전 문자열 (예: '126.0.6478.126', 확인 불가 시 None) - 프로세스당 한 번만 조회"""
+    global _chrome_version
+    if _chrome_version:
+        return _chrome_version
+
+    binary = find_chrome_binary()
+    if not binary:
+        return None
+
+    try:
+        output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+        match = re.search(r'(\d+\.\d+\.\d+\.\d+)', output or "")
+        if match:
+            _chrome_version = match.group(1)
+    except Exception as e:
+        logger.debug(f"Chrome 버전 확인 실패: {str(e)}")
+
+    # Windows의 chrome.exe는 --version을 출력하지 않으므로 설치 폴더의 버전 디렉토리명 사용
+    if not _chrome_version:
+        try:
+            versions = [name for name in os.listdir(os.path.dirname(binary)) if re.fullmatch(r'\d+\.\d+\.\d+\.\d+', name)]
+            if versions:
+                _chrome_version = max(versions, key=lambda v: [int(part) for part in v.split('.')])
+        except OSError:
+            pass
+
+    return _chrome_version
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_json(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def resolve_chromedriver():
+    """Chrome 버전에 맞는 ChromeDriver 경로 - 캐시에 있으면 네트워크 조회 없이 반환"""
+    version = get_chrome_version()
+    cache = _load_json(config.CHROMEDRIVER_CACHE_FILE)
+
+    cached_path = cache.get(version) if version else None
+    if cached_path and os.path.exists(cached_path):
+        return cached_path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    if version:
+        cache[version] = path
+        _save_json(config.CHROMEDRIVER_CACHE_FILE, cache)
+        logger.info(f"ChromeDriver 경로 캐시 저장 (Chrome {version}): {path}")
+    return path
+
+
+def is_port_alive(port):
+    """원격 디버깅 포트에서 Chrome이 응답하는지 확인"""
+    try:
+        with urlopen(f"http://127.0.0.1:{port}/json/version", timeout=1) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def reset_targets(port):
+    """데몬 Chrome의 탭을 새 빈 탭 하나로 교체 - 닫은 탭의 렌더러 프로세스 메모리 회수 (닫은 탭 수 반환)"""
+    base = f"http://127.0.0.1:{port}"
+    with urlopen(f"{base}/json/list", timeout=5) as response:
+        pages = [target for target in json.load(response) if target.get("type") == "page"]
+
+    # 마지막 탭이 닫히면 Chrome이 종료될 수 있으므로 빈 탭을 먼저 열고 기존 탭 닫기
+    with urlopen(Request(f"{base}/json/new?about:blank", method="PUT"), timeout=5):
+        pass
+    for target in pages:
+        with urlopen(f"{base}/json/close/{target['id']}", timeout=5):
+            pass
+    return len(pages)
+
+
+def load_state():
+    """데몬 상태 파일 ({ports, pids, chrome_version, started_at})"""
+    return _load_json(config.BROWSER_DAEMON_STATE_FILE)
+
+
+def running_ports():
+    """응답 중인 데몬 Chrome의 원격 디버깅 포트 목록"""
+    return [port for port in load_state().get("ports", []) if is_port_alive(port)]
+
+
+def start_daemon(size=None):
+    """원격 디버깅 포트를 연 Chrome 세션들을 백그라운드로 시작 (이미 떠 있는 포트는 그대로 사용)"""
+    binary = find_chrome_binary()
+    if not binary:
+        logger.error("Chrome 실행 파일을 찾을 수 없습니다 (CRAWLER_CHROME_BINARY로 지정 가능)")
+        return False
+
+    size = size or config.DRIVER_POOL_SIZE
+    state = load_state()
+    pids = dict(zip(map(str, state.get("ports", [])), state.get("pids", [])))
+    ports = []
+
+    for index in range(size):
+        port = config.BROWSER_DAEMON_BASE_PORT + index
+        ports.append(port)
+        if is_port_alive(port):
+            continue
+
+        profile_dir = os.path.abspath(os.path.join(config.BROWSER_DAEMON_PROFILE_DIR, str(port)))
+        os.makedirs(profile_dir, exist_ok=True)
+        command = [
+            binary,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-notifications",
+            *config.get_chrome_options(),
+            "about:blank",
+        ]
+        # 크롤러/스케줄러 프로세스가 끝나도 Chrome은 계속 실행되도록 분리
+        if os.name == "nt":
+            process = subprocess.Popen(
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            process = subprocess.Popen(
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+            )
+        pids[str(port)] = process.pid
+
+    deadline = time.monotonic() + config.BROWSER_DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline and not all(is_port_alive(port) for port in ports):
+        time.sleep(0.2)
+
+    alive = [port for port in ports if is_port_alive(port)]
+    _save_json(config.BROWSER_DAEMON_STATE_FILE, {
+        "ports": alive,
+        "pids": [pids.get(str(port)) for port in alive],
+        "chrome_version": get_chrome_version(),
+        "started_at": time.time(),
+    })
+
+    if len(alive) < len(ports):
+        logger.warning(f"브라우저 데몬 일부 시작 실패: {len(alive)}/{len(ports)}개 응답")
+    else:
+        logger.info(f"브라우저 데몬 시작: 포트 {alive}")
+    return bool(alive)
+
+
+def stop_daemon():
+    """데몬 Chrome 세션 종료 및 상태 파일 삭제"""
+    state = load_state()
+    for pid in state.get("pids", []):
+        if not pid:
+            continue
+        try:
+            if os.name == "nt":
+                subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+            else:
+                os.killpg(pid, signal.SIGTERM)
+        except Exception as e:
+            logger.debug(f"데몬 Chrome 종료 중 오류 (PID {pid}): {str(e)}")
+
+    try:
+        os.remove(config.BROWSER_DAEMON_STATE_FILE)
+    except OSError:
+        pass
+    logger.info("브라우저 데몬 종료")
+
+
+class BrowserDaemonClient:
+    """실행 중인 데몬 Chrome에 웹드라이버로 연결 - 포트 하나당 세션 하나만 대여"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_use = set()
+
+    def attach(self):
+        """비어 있는 데몬 Chrome에 연결한 웹드라이버 (데몬이 없거나 모두 사용 중이면 None)"""
+        if not os.path.exists(config.BROWSER_DAEMON_STATE_FILE):
+            return None
+
+        with self.lock:
+            free_ports = [port for port in running_ports() if port not in self.in_use]
+            if not free_ports:
+                return None
+            port = free_ports[0]
+            self.in_use.add(port)
+
+        try:
+            options = webdriver.ChromeOptions()
+            options.debugger_address = f"127.0.0.1:{port}"
+            configure_options(options)
+            if os.getenv('GITHUB_ACTIONS') == 'true':
+                driver = webdriver.Chrome(options=options)
+            else:
+                driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+            driver.daemon_port = port
+            return driver
+        except Exception as e:
+            logger.warning(f"데몬 Chrome 연결 실패 (포트 {port}): {str(e)}")
+            self.release(port)
+            return None
+
+    def release(self, port):
+        """포트 반납"""
+        with self.lock:
+            self.in_use.discard(port)
+
+    def release_driver(self, driver):
+        """드라이버 종료 시 데몬 Chrome의 탭을 정리해 메모리를 회수하고 포트 반납 (데몬 세션이 아니면 무시)"""
+        port = getattr(driver, "daemon_port", None)
+        if port is None:
+            return
+        # 데몬에 연결한 드라이버는 quit()해도 연결만 끊기고 Chrome은 그대로 남으므로 탭을 직접 닫음
+        try:
+            closed = reset_targets(port)
+            logger.debug(f"데몬 Chrome 탭 정리 (포트 {port}): {closed}개 닫음")
+        except Exception as e:
+            logger.warning(f"데몬 Chrome 탭 정리 실패 (포트 {port}): {str(e)}")
+        self.release(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러용 브라우저 데몬')
+    parser.add_argument('command', choices=['start', 'stop', 'status'], help='실행할 작업')
+    parser.add_argument('--size', type=int, help='띄울 Chrome 세션 수 (기본: DRIVER_POOL_SIZE)')
+    args = parser.parse_args()
+
+    if args.command == 'start':
+        print("🚀 브라우저 데몬 시작 중...")
+        if not start_daemon(args.size):
+            print("❌ 브라우저 데몬 시작 실패")
+            return 1
+        print(f"✅ 브라우저 데몬 실행 중: 포트 {running_ports()}")
+    elif args.command == 'stop':
+        stop_daemon()
+        print("✅ 브라우저 데몬 종료")
+    else:
+        state = load_state()
+        ports = running_ports()
+        print(f"📊 브라우저 데몬: {'실행 중' if ports else '중지됨'}")
+        print(f"   응답 포트: {ports}")
+        print(f"   Chrome 버전: {state.get('chrome_version') or get_chrome_version() or '확인 불가'}")
+        print(f"   캐시된 ChromeDriver: {_load_json(config.CHROMEDRIVER_CACHE_FILE)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
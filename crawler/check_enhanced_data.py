@@ -5,6 +5,7 @@
 import json
 import os
 from datetime import datetime
+from item_store import ItemStore
 
 def check_enhanced_data():
     """개선된 크롤링 데이터 확인"""
@@ -99,6 +100,30 @@ def check_summary():
     else:
         print("❌ 크롤링 요약 파일을 찾을 수 없습니다.")
 
+def check_item_store():
+    """항목 저장소 확인 (플랫폼별 항목 수와 최근 실행)"""
+    print("\n🗄️ 항목 저장소 확인:")
+    
+    store = ItemStore()
+    if not store.enabled:
+        print("❌ 항목 저장소를 사용할 수 없습니다.")
+        return
+    
+    try:
+        stats = store.get_stats()
+        print(f"📊 저장된 항목 수: {stats.get('entries', 0)}개")
+        for platform in ['news', 'blog', 'youtube', 'cafe']:
+            latest = store.latest(platform, limit=1, days=3650)
+            if latest:
+                print(f"   {platform}: 최신 항목 {latest[0].get('date', '날짜 없음')} - {latest[0].get('title', '제목 없음')[:50]}")
+        
+        run_id = store.latest_run_id()
+        if run_id is not None:
+            print(f"🕒 최근 실행 #{run_id}: {len(store.query(run_id=run_id))}개 항목")
+    finally:
+        store.close()
+
 if __name__ == "__main__":
     check_enhanced_data()
-    check_summary() 
\ No newline at end of file
+    check_summary()
+    check_item_store() 
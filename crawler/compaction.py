@@ -0,0 +1,254 @@
+"""
+데이터 보존 기간 적용 및 압축 (compaction)
+COMPACTION_AFTER_DAYS일이 지난 실행별 enhanced_news 파일을 접두어(키워드/플랫폼/all_platforms)별로 중복 제거한 일별/주별 롤업 파일로 합치고,
+DATA_RETENTION_DAYS일이 지난 파일/요약 파일/저장소 항목/아카이브 날짜를 삭제 (저장소는 삭제 후 VACUUM으로 인덱스 재작성)
+크롤링이 끝날 때마다 새로 오래된 파일만 처리하며, 회수한 용량과 전체 파일 로드 시간 변화를 보고
+
+사용법 (crawler 디렉토리에서):
+    python compaction.py
+    python compaction.py --retention-days 60 --period weekly
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import time
+import argparse
+from datetime import datetime, timedelta, timezone
+from loguru import logger
+import config
+from url_canonical import UrlCanonicalizer
+
+# 한국시간 타임존 설정
+KST = timezone(timedelta(hours=9))
+
+RUN_FILE_PATTERN = re.compile(r'^(.+)_enhanced_news_(\d{8})_(\d{6})\.json$')
+SUMMARY_FILE_PATTERN = re.compile(r'^enhanced_crawl_summary_(\d{8})_(\d{6})\.json$')
+# 롤업 파일은 접두어를 유지하고 기간 시작일 00:00:00 실행 파일 이름으로 기록 ({접두어}_enhanced_news_YYYYMMDD_000000.json)
+ROLLUP_TIME = "000000"
+
+
+def _directory_bytes(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def load_all_files(directory):
+    """enhanced_news 전체 파일 로드 (glob + json.load) - (소요 시간(초), 항목 수)"""
+    started = time.perf_counter()
+    count = 0
+    for file_path in glob.glob(f"{directory}/*_enhanced_news_*.json"):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                count += len(json.load(f))
+        except Exception:
+            continue
+    return time.perf_counter() - started, count
+
+
+class DataCompactor:
+    """실행별 파일 롤업 병합 + 보존 기간 적용
+    (stores: purge(before)를 가진 저장소, archives: drop_before(day)/compact(day)를 가진 날짜별 아카이브)"""
+
+    def __init__(self, data_dir=None, retention_days=None, after_days=None, period=None,
+                 deduplicate=None, stores=None, archives=None):
+        self.data_dir = data_dir or config.DATA_DIR
+        self.news_dir = f"{self.data_dir}/enhanced_news"
+        self.retention_days = config.DATA_RETENTION_DAYS if retention_days is None else retention_days
+        self.after_days = config.COMPACTION_AFTER_DAYS if after_days is None else after_days
+        self.period = period or config.COMPACTION_ROLLUP_PERIOD
+        self.deduplicate = deduplicate or UrlCanonicalizer().deduplicate
+        self.stores = stores or {}
+        self.archives = archives or {}
+
+    def _period_start(self, day):
+        return day - timedelta(days=day.weekday()) if self.period == "weekly" else day
+
+    def _period_end(self, day):
+        return self._period_start(day) + timedelta(days=6 if self.period == "weekly" else 0)
+
+    def _scan(self):
+        """enhanced_news 파일 목록 - (경로, 접두어, 실행 시각)"""
+        files = []
+        for path in glob.glob(f"{self.news_dir}/*_enhanced_news_*.json"):
+            match = RUN_FILE_PATTERN.match(os.path.basename(path))
+            if match:
+                timestamp = datetime.strptime(match.group(2) + match.group(3), "%Y%m%d%H%M%S")
+                files.append((path, match.group(1), timestamp))
+        return sorted(files, key=lambda entry: entry[2])
+
+    def _is_rollup(self, timestamp):
+        return timestamp.strftime('%H%M%S') == ROLLUP_TIME and self._period_start(timestamp.date()) == timestamp.date()
+
+    def _merge(self, prefix, period_start, rollup_path, run_files):
+        """같은 접두어의 기존 롤업 + 실행별 파일 항목을 최신 수집 우선으로 중복 제거해 롤업 파일에 기록 - 남은 항목 수"""
+        items = []
+        for path in ([rollup_path] if rollup_path else []) + run_files:
+            with open(path, 'r', encoding='utf-8') as f:
+                items.extend(json.load(f))
+
+        # 같은 항목은 가장 나중에 수집한 것을 남기고, 기록 순서는 시간순 유지
+        unique_items = list(reversed(self.deduplicate(list(reversed(items)))))
+
+        target = rollup_path or f"{self.news_dir}/{prefix}_enhanced_news_{period_start.strftime('%Y%m%d')}_{ROLLUP_TIME}.json"
+        tmp_path = f"{target}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(unique_items, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, target)
+        for path in run_files:
+            os.remove(path)
+        return len(items), len(unique_items)
+
+    def run(self, now=None):
+        """압축/보존 기간 적용 실행 - 결과 보고 딕셔너리"""
+        now = now or datetime.now(KST).replace(tzinfo=None)
+        retention_cutoff = (now - timedelta(days=self.retention_days)).date()
+        compact_cutoff = (now - timedelta(days=self.after_days)).date()
+        report = {
+            "period": self.period, "retention_days": self.retention_days,
+            "run_files_merged": 0, "rollups_written": 0, "items_before": 0, "items_after": 0,
+            "expired_files": 0, "expired_summaries": 0, "expired_index_entries": {},
+            "reclaimed_bytes": 0,
+        }
+        if not os.path.isdir(self.news_dir):
+            return report
+
+        files = self._scan()
+        # 프론트엔드가 읽는 최신 통합 파일은 항상 유지
+        latest_all = max((entry for entry in files if entry[1] == "all_platforms"), key=lambda entry: entry[2], default=None)
+
+        expired, rollups, pending = [], {}, {}
+        for path, prefix, timestamp in files:
+            day = timestamp.date()
+            if latest_all and path == latest_all[0]:
+                continue
+            # 롤업은 접두어별로 따로 만들어 플랫폼/키워드 구분 유지
+            period = (prefix, self._period_start(day))
+            if self._period_end(day) < retention_cutoff:
+                expired.append(path)
+            elif self._is_rollup(timestamp):
+                rollups[period] = path
+            elif self._period_end(day) < compact_cutoff:
+                pending.setdefault(period, []).append(path)
+
+        summaries = sorted(glob.glob(f"{self.data_dir}/enhanced_crawl_summary_*.json"))
+        expired_summaries = [
+            path for path in summaries[:-1]
+            if SUMMARY_FILE_PATTERN.match(os.path.basename(path))
+            and datetime.strptime(SUMMARY_FILE_PATTERN.match(os.path.basename(path)).group(1), "%Y%m%d").date() < retention_cutoff
+        ]
+
+        bytes_before = _directory_bytes(self.data_dir)
+        report["archives"] = self._compact_archives(retention_cutoff, compact_cutoff)
+        if not (expired or pending or expired_summaries):
+            report["expired_index_entries"] = self._purge_indexes(retention_cutoff)
+            report["reclaimed_bytes"] = bytes_before - _directory_bytes(self.data_dir)
+            return report
+
+        load_before, _ = load_all_files(self.news_dir)
+
+        for (prefix, period_start), run_files in sorted(pending.items()):
+            try:
+                before, after = self._merge(prefix, period_start, rollups.get((prefix, period_start)), run_files)
+                report["run_files_merged"] += len(run_files)
+                report["rollups_written"] += 1
+                report["items_before"] += before
+                report["items_after"] += after
+            except Exception as e:
+                logger.error(f"롤업 병합 실패 ({prefix}, {period_start}): {str(e)}")
+
+        for path in expired + expired_summaries:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"만료 파일 삭제 실패 ({os.path.basename(path)}): {str(e)}")
+        report["expired_files"] = len(expired)
+        report["expired_summaries"] = len(expired_summaries)
+        report["expired_index_entries"] = self._purge_indexes(retention_cutoff)
+
+        load_after, _ = load_all_files(self.news_dir)
+        report["reclaimed_bytes"] = bytes_before - _directory_bytes(self.data_dir)
+        report["load_seconds_before"] = round(load_before, 4)
+        report["load_seconds_after"] = round(load_after, 4)
+        report["load_speedup"] = round(load_before / load_after, 1) if load_after else None
+
+        logger.info(
+            f"데이터 압축 완료: 실행 파일 {report['run_files_merged']}개 → 롤업 {report['rollups_written']}개, "
+            f"만료 파일 {report['expired_files']}개, 요약 {report['expired_summaries']}개 삭제, "
+            f"{report['reclaimed_bytes']:,}바이트 회수, 로드 {report['load_speedup']}배 빨라짐"
+        )
+        return report
+
+    def _purge_indexes(self, retention_cutoff):
+        """저장소의 만료 항목 삭제 - 저장소 이름별 삭제 수"""
+        purged = {}
+        before = datetime.combine(retention_cutoff, datetime.min.time(), KST).isoformat()
+        for name, store in self.stores.items():
+            purged[name] = store.purge(before)
+        return purged
+
+    def _compact_archives(self, retention_cutoff, compact_cutoff):
+        """날짜별 아카이브의 만료 날짜 삭제와 지난 날짜 압축 - 아카이브 이름별 (삭제, 압축) 수"""
+        result = {}
+        for name, archive in self.archives.items():
+            try:
+                result[name] = {
+                    "dropped": archive.drop_before(retention_cutoff.strftime('%Y%m%d')),
+                    "compacted": archive.compact(compact_cutoff.strftime('%Y%m%d')),
+                }
+            except Exception as e:
+                logger.error(f"아카이브 압축 실패 ({name}): {str(e)}")
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='데이터 보존 기간 적용 및 압축')
+    parser.add_argument('--retention-days', type=int, help=f'보존 기간 (기본: {config.DATA_RETENTION_DAYS}일)')
+    parser.add_argument('--after-days', type=int, help=f'롤업으로 합칠 파일 기준 (기본: {config.COMPACTION_AFTER_DAYS}일 지난 파일)')
+    parser.add_argument('--period', choices=['daily', 'weekly'], help=f'롤업 단위 (기본: {config.COMPACTION_ROLLUP_PERIOD})')
+    args = parser.parse_args()
+
+    from item_store import ItemStore
+    from seen_store import SeenStore
+    from simhash_index import SimHashStore
+    from jsonl_archive import JsonlArchive
+    from parquet_archive import ParquetArchive
+
+    # 크롤러(웹드라이버 풀 등) 없이 저장소만 직접 열기
+    stores = {"item_store": ItemStore(), "seen_store": SeenStore(), "simhash_store": SimHashStore()}
+    archives = {}
+    if os.path.isdir(config.JSONL_ARCHIVE_DIR):
+        archives["jsonl_archive"] = JsonlArchive()
+    if os.path.isdir(config.PARQUET_ARCHIVE_DIR):
+        archives["parquet_archive"] = ParquetArchive()
+    try:
+        print("🗜️ 데이터 압축 및 보존 기간 적용 중...")
+        report = DataCompactor(
+            retention_days=args.retention_days, after_days=args.after_days, period=args.period,
+            stores=stores, archives=archives
+        ).run()
+    finally:
+        for store in list(stores.values()) + list(archives.values()):
+            store.close()
+
+    print(f"✅ 실행 파일 {report['run_files_merged']}개 → 롤업 {report['rollups_written']}개 "
+          f"(항목 {report['items_before']}개 → {report['items_after']}개)")
+    print(f"   🗑️ 만료 파일 {report['expired_files']}개, 요약 파일 {report['expired_summaries']}개 삭제, 저장소 {report['expired_index_entries']}")
+    if report.get("archives"):
+        print(f"   📚 아카이브: {report['archives']}")
+    print(f"   💾 회수한 용량: {report['reclaimed_bytes']:,}바이트")
+    if report.get("load_speedup"):
+        print(f"   ⚡ 전체 파일 로드: {report['load_seconds_before']}초 → {report['load_seconds_after']}초 ({report['load_speedup']}배)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -80,6 +80,178 @@ LOGS_DIR = "../data/logs"
 MAX_PAGES = 5  # 최대 페이지 수
 DELAY_BETWEEN_REQUESTS = 2  # 요청 간 대기시간 (초)
 
+# 검색 결과 페이지네이션 (네이버 뉴스/블로그/카페, start 파라미터 사용)
+SEARCH_PAGE_SIZE = {"news": 10, "blog": 30, "cafe": 10}  # 페이지당 결과 수 (start 증가폭)
+MAX_ITEMS_PER_KEYWORD = {"news": 30, "blog": 30, "cafe": 20}  # 키워드당 최대 수집 항목 수
+PAGE_FETCH_CONCURRENCY = 2  # 첫 페이지 이후 동시에 가져올 페이지 수
+
+# 동시 크롤링 설정 (asyncio 오케스트레이터)
+MAX_CONCURRENT_CRAWLS = 4  # 동시에 진행할 키워드 작업 수
+
+# 웹드라이버 풀 설정 (Chrome 세션 병렬 사용)
+DRIVER_POOL_SIZE = int(os.getenv('CRAWLER_DRIVER_POOL_SIZE', '2'))  # 동시에 띄울 Chrome 세션 수
+DRIVER_MAX_PAGES = 50  # 세션당 최대 페이지 수 (초과 시 재생성)
+DRIVER_MAX_MEMORY_MB = 512  # 페이지 JS 힙 사용량 한도 (초과 시 재생성)
+DRIVER_CHECKOUT_TIMEOUT = 120  # 세션 대여 대기 최대 시간 (초)
+
+# 브라우저 데몬 (원격 디버깅 포트로 미리 띄워둔 Chrome에 연결해 실행마다 브라우저 기동 생략)
+BROWSER_DAEMON_ENABLED = os.getenv('CRAWLER_BROWSER_DAEMON', 'false').lower() == 'true'  # 스케줄러 시작 시 데몬 자동 실행
+BROWSER_DAEMON_BASE_PORT = 9222  # 첫 번째 Chrome 세션의 원격 디버깅 포트 (세션마다 1씩 증가)
+BROWSER_DAEMON_START_TIMEOUT = 15  # Chrome 기동 대기 최대 시간 (초)
+BROWSER_DAEMON_STATE_FILE = f"{DATA_DIR}/browser_daemon.json"
+BROWSER_DAEMON_PROFILE_DIR = f"{DATA_DIR}/browser_profiles"
+CHROME_BINARY = os.getenv('CRAWLER_CHROME_BINARY', '')  # 비우면 자동 탐색
+CHROMEDRIVER_CACHE_FILE = f"{DATA_DIR}/chromedriver_cache.json"  # Chrome 버전별 ChromeDriver 경로 캐시
+
+# 호스트별 요청 속도 제한 (rate: 초당 요청 수, burst: 연속 허용 요청 수)
+HOST_RATE_LIMITS = {
+    "search.naver.com": {"rate": 1.0, "burst": 2},
+    "www.youtube.com": {"rate": 0.5, "burst": 1},
+}
+DEFAULT_HOST_RATE_LIMIT = {"rate": 1.0 / DELAY_BETWEEN_REQUESTS, "burst": 1}
+
+# HTTP 수집 설정 (브라우저 없이 가벼운 요청 우선, 결과가 없으면 Selenium 사용)
+HTTP_FETCH_ENABLED = os.getenv('CRAWLER_HTTP_FETCH', 'true').lower() == 'true'
+HTTP_FETCH_PLATFORMS = ["news", "blog"]  # HTTP 수집을 먼저 시도할 플랫폼
+HTTP_TIMEOUT = 10  # HTTP 요청 타임아웃 (초)
+HTTP_POOL_SIZE = 10  # 호스트별 커넥션 풀 크기
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+# 유튜브 수집 방식 ("initial_data": 검색 응답의 ytInitialData JSON 사용, "browser": 렌더링된 DOM 사용)
+YOUTUBE_FETCH_MODE = os.getenv('CRAWLER_YOUTUBE_MODE', 'initial_data')
+YOUTUBE_MAX_RESULTS = 7  # 키워드당 수집할 영상 수
+YOUTUBE_MAX_CONTINUATIONS = 2  # 결과가 부족할 때 추가로 요청할 continuation 페이지 수
+YOUTUBE_INNERTUBE_SEARCH_URL = "https://www.youtube.com/youtubei/v1/search"
+
+# 플랫폼별 검색 결과 컨테이너 (HTTP 응답 검증 및 Selenium 대체 판단에 사용)
+RESULT_CONTAINER_SELECTORS = {
+    "news": ["div.news_area", "div.sds-comps-vertical-layout"],
+    "blog": ["div.view_wrap"],
+    "cafe": [".api_subject_bx"],
+}
+
+# 파싱 프로세스 풀 (수집 스레드는 HTML만 넘기고 별도 프로세스에서 파싱, 0이면 수집 스레드에서 직접 파싱)
+PARSE_WORKERS = int(os.getenv('CRAWLER_PARSE_WORKERS', str(min(4, max((os.cpu_count() or 1) - 1, 0)))))
+PARSE_QUEUE_SIZE = 16  # 파싱 대기 중인 HTML 스냅샷 최대 수 (초과 시 수집 스레드가 대기)
+
+# HTML 파서 백엔드 ("html.parser", "lxml", "selectolax" - 비우면 lxml 설치 시 lxml 사용)
+HTML_PARSER_BACKEND = os.getenv('CRAWLER_HTML_PARSER') or None
+
+# 페이지 준비 대기 (고정 대기 대신 결과 컨테이너가 나타나고 개수가 안정될 때까지 대기)
+READINESS_SELECTORS = {  # 플랫폼별 결과 컨테이너 CSS 선택자
+    "news": "div.news_area, span.sds-comps-text-type-headline1",
+    "blog": "div.view_wrap",
+    "cafe": ".total_wrap .api_subject_bx",
+    "youtube": "div#contents ytd-video-renderer",
+}
+READINESS_EMPTY_SELECTORS = {  # '검색 결과 없음' 표시 (나타나면 바로 대기 종료)
+    "news": ".api_noresult_wrap",
+    "blog": ".api_noresult_wrap",
+    "cafe": ".api_noresult_wrap",
+    "youtube": "ytd-background-promo-renderer",
+}
+READINESS_TIMEOUT = 10  # 최대 대기 시간 (초)
+READINESS_STABLE_SECONDS = 0.5  # 결과 개수가 이 시간 동안 변하지 않으면 준비 완료
+READINESS_POLL_INTERVAL = 0.2  # 확인 주기 (초)
+YOUTUBE_SCROLL_WAIT_TIMEOUT = 3  # 스크롤 후 추가 영상 로딩 대기 최대 시간 (초)
+
+# 검색 결과 응답 캐시 (재실행 시 같은 페이지를 다시 받지 않도록)
+RESPONSE_CACHE_ENABLED = os.getenv('CRAWLER_RESPONSE_CACHE', 'true').lower() == 'true'
+RESPONSE_CACHE_DIR = f"{DATA_DIR}/http_cache"
+RESPONSE_CACHE_MAX_MB = 200  # 캐시 최대 용량 (초과 시 LRU 삭제)
+RESPONSE_CACHE_DEFAULT_TTL = 3600  # 기본 유효 시간 (초) - 스케줄러 재시도 간격(30분)보다 길게
+RESPONSE_CACHE_TTL = {  # 플랫폼별 유효 시간 (초)
+    "news": 3600,
+    "blog": 3600,
+    "youtube": 3600,
+    "cafe": 3600,
+}
+
+# 수집 이력 저장소 (이미 수집한 URL의 처음/마지막 수집 시각 기록)
+SEEN_STORE_ENABLED = os.getenv('CRAWLER_SEEN_STORE', 'true').lower() == 'true'
+SEEN_STORE_PATH = f"{DATA_DIR}/seen_items.sqlite3"
+# 증분 크롤링: 이미 수집한 항목은 건너뛰고 새 항목만 저장 (프론트엔드는 최신 파일만 읽으므로 기본 비활성화)
+INCREMENTAL_CRAWL = os.getenv('CRAWLER_INCREMENTAL', 'false').lower() == 'true'
+
+# SimHash 지문 저장소 (항목마다 제목+요약 SimHash를 기록하고 실행 간 유사 항목 조회)
+SIMHASH_STORE_ENABLED = os.getenv('CRAWLER_SIMHASH_STORE', 'true').lower() == 'true'
+SIMHASH_STORE_PATH = f"{DATA_DIR}/fingerprints.sqlite3"
+SIMHASH_MAX_DISTANCE = 3  # 유사 항목으로 볼 최대 해밍 거리 (최대 3)
+# 실행 간 중복 제거: 과거 실행에서 수집한 항목과 SimHash가 가까운 항목은 저장하지 않음 (증분 크롤링과 같은 이유로 기본 비활성화)
+CROSS_RUN_DEDUP = os.getenv('CRAWLER_CROSS_RUN_DEDUP', 'false').lower() == 'true'
+
+# 수집 항목 저장소 (대표 URL 기준 upsert, 플랫폼/키워드/날짜/실행별 조회 - JSON 파일은 내보내기 형식)
+ITEM_STORE_ENABLED = os.getenv('CRAWLER_ITEM_STORE', 'true').lower() == 'true'
+ITEM_STORE_PATH = f"{DATA_DIR}/items.sqlite3"
+
+# 날짜별 JSONL 아카이브 (수집일 세그먼트에 항목을 한 줄씩 추가, 지난 세그먼트는 압축 봉인)
+# 활성화하면 실행마다 플랫폼별 JSON 파일을 쓰지 않음 (프론트엔드용 all_platforms 파일은 유지)
+JSONL_ARCHIVE_ENABLED = os.getenv('CRAWLER_JSONL_ARCHIVE', 'false').lower() == 'true'
+JSONL_ARCHIVE_DIR = f"{DATA_DIR}/archive"
+JSONL_ARCHIVE_COMPRESSION = os.getenv('CRAWLER_JSONL_ARCHIVE_COMPRESSION', 'gzip')  # "gzip" 또는 "zstd" (zstandard 설치 필요)
+JSONL_ARCHIVE_COMPRESSION_LEVEL = 6
+JSONL_ARCHIVE_BLOCK_BYTES = 64 * 1024  # 압축 블록 크기 (항목 하나를 조회할 때 풀어야 하는 최대 크기)
+
+# 분석용 Parquet 데이터셋 (플랫폼/수집일 파티션, pyarrow 설치 시 사용 - 분석기가 필요한 컬럼과 파티션만 읽음)
+PARQUET_ARCHIVE_ENABLED = os.getenv('CRAWLER_PARQUET_ARCHIVE', 'true').lower() == 'true'
+PARQUET_ARCHIVE_DIR = f"{DATA_DIR}/parquet"
+
+# 프론트엔드 동기화 매니페스트 (동기화한 파일의 내용 해시 - 바뀐 파일만 쓰고 지우기 위해 사용)
+SYNC_MANIFEST_PATH = f"{DATA_DIR}/sync_manifest.json"
+
+# 페이지 로드 전략 ("eager": DOMContentLoaded 시점에 반환, "normal": 모든 리소스 로드까지 대기)
+PAGE_LOAD_STRATEGY = "eager"
+
+# DevTools Protocol 네트워크 차단 (파싱에 쓰지 않는 리소스를 받지 않음, 페이지별 요청/차단 통계 기록)
+NETWORK_BLOCKING_ENABLED = os.getenv('CRAWLER_NETWORK_BLOCKING', 'true').lower() == 'true'
+# 페이지별 요청 수/전송 바이트 기록 (차단을 꺼도 기록 - 차단을 켜고 끈 실행의 페이지당 전송량으로 절약량 비교)
+NETWORK_STATS_ENABLED = os.getenv('CRAWLER_NETWORK_STATS', 'true').lower() == 'true'
+BLOCKED_RESOURCE_PATTERNS = {  # 리소스 종류별 URL 패턴 (Network.setBlockedURLs 와일드카드 형식)
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.ts", "*googlevideo.com/*"],
+    "stylesheet": ["*.css"],
+}
+NAVER_TRACKER_PATTERNS = [
+    "*lcs.naver.com/*",
+    "*tivan.naver.com/*",
+    "*siape.veta.naver.com/*",
+    "*nam.veta.naver.com/*",
+    "*ssl.pstatic.net/tveta/*",
+]
+YOUTUBE_TRACKER_PATTERNS = [
+    "*youtube.com/api/stats/*",
+    "*youtube.com/ptracking*",
+    "*youtube.com/pagead/*",
+    "*doubleclick.net/*",
+    "*googlesyndication.com/*",
+    "*googleadservices.com/*",
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+]
+NETWORK_BLOCK_PROFILES = {  # 플랫폼별 차단 프로필
+    "news": {"resource_types": ["image", "font", "media", "stylesheet"], "url_patterns": NAVER_TRACKER_PATTERNS},
+    "blog": {"resource_types": ["image", "font", "media", "stylesheet"], "url_patterns": NAVER_TRACKER_PATTERNS},
+    "cafe": {"resource_types": ["image", "font", "media", "stylesheet"], "url_patterns": NAVER_TRACKER_PATTERNS},
+    # 유튜브는 레이아웃 기반 지연 로딩이 있어 CSS는 허용
+    "youtube": {"resource_types": ["image", "font", "media"], "url_patterns": YOUTUBE_TRACKER_PATTERNS},
+}
+
+# 유튜브 쿠키 동의 화면을 건너뛰기 위한 동의 쿠키 (세션마다 미리 설정)
+YOUTUBE_CONSENT_COOKIES = [
+    {"name": "SOCS", "value": "CAI", "domain": ".youtube.com"},
+    {"name": "CONSENT", "value": "YES+cb", "domain": ".youtube.com"},
+]
+
 # 브라우저 설정 (환경별 자동 감지)
 def get_chrome_options():
     """환경에 따른 Chrome 옵션 반환"""
@@ -112,9 +284,43 @@ def get_chrome_options():
 # 기존 호환성을 위한 CHROME_OPTIONS (기본값)
 CHROME_OPTIONS = get_chrome_options()
 
+# 중복 제거 방식: exact(전체 쌍 비교 + 상한 가지치기, 기존과 결과 동일, 기본값),
+#                minhash(MinHash LSH 후보만 비교 - 근사, 놓치는 쌍이 있을 수 있어 선택 사용),
+#                tfidf(문자 n-gram TF-IDF 코사인 일괄 처리), pairwise(기존 전체 쌍 비교)
+DEDUP_METHOD = os.getenv('CRAWLER_DEDUP_METHOD', 'exact')
+DEDUP_BLOCK_BY_TYPE = False  # exact: 같은 플랫폼(type) 항목끼리만 비교
+DEDUP_DATE_WINDOW_DAYS = None  # exact: 날짜 차이가 이 일수 이내인 항목끼리만 비교 (None이면 제한 없음)
+DEDUP_TFIDF_NGRAM_RANGE = (1, 2)  # tfidf: 문자 n-gram 범위
+DEDUP_TFIDF_CHUNK_SIZE = 1000  # tfidf: 한 번에 유사도를 계산할 행 수 (메모리 상한)
+DEDUP_SHINGLE_SIZE = 2  # 제목 shingle 길이 (한글 음절 기준)
+DEDUP_MINHASH_PERMUTATIONS = 128
+DEDUP_LSH_BANDS = 64  # 밴드당 행 수 = PERMUTATIONS / BANDS (작을수록 후보가 늘고 누락이 줄어듦)
+DEDUP_MINHASH_VERIFY = os.getenv('CRAWLER_DEDUP_VERIFY', 'true').lower() == 'true'  # 후보를 SequenceMatcher로 확인
+
+# 스트리밍 중복 제거 (remove_duplicates.py --stream) - 파일을 항목 단위로 읽고 디스크 인덱스와 비교
+STREAM_DEDUP_MEMORY_MB = int(os.getenv('CRAWLER_STREAM_DEDUP_MEMORY_MB', '64'))  # 읽기 버퍼 + 인덱스 캐시 상한
+STREAM_DEDUP_READ_CHUNK_BYTES = 1024 * 1024  # 기본 읽기 단위 (바이트)
+STREAM_DEDUP_INDEX_PATH = f"{DATA_DIR}/stream_dedup_index.sqlite3"  # 작업 중에만 쓰는 임시 인덱스
+
 # 데이터 보존 기간 (일)
 DATA_RETENTION_DAYS = 30
 
+# 데이터 압축 (크롤링 후 실행) - 지난 실행별 파일을 중복 제거한 롤업 파일로 합치고 보존 기간이 지난 데이터 삭제
+COMPACTION_ENABLED = os.getenv('CRAWLER_COMPACTION', 'true').lower() == 'true'
+COMPACTION_AFTER_DAYS = 1  # 이 일수가 지난 실행별 파일을 롤업으로 합침 (오늘 파일은 유지)
+COMPACTION_ROLLUP_PERIOD = os.getenv('CRAWLER_COMPACTION_PERIOD', 'daily')  # "daily" 또는 "weekly"
+
+# URL 정규화 - 대표 URL을 만들 때 제거할 추적 파라미터 (블로그/카페/뉴스/유튜브는 글 ID 형식으로 별도 처리)
+URL_TRACKING_PARAM_PREFIXES = ["utm_"]
+URL_TRACKING_PARAMS = ["fbclid", "gclid", "igshid", "mc_cid", "mc_eid"]  # 알려진 추적 파라미터만 (ref 등 일반 이름은 글 키로 쓰는 사이트가 있어 제외)
+URL_DOMAIN_TRACKING_PARAMS = {  # 도메인별 추적 파라미터
+    "yna.co.kr": ["input"],
+}
+
+# 광고/홍보 필터 규칙 파일 (제목/본문/URL 패턴, 실행 중 수정하면 자동으로 다시 로드)
+FILTER_RULES_FILE = "filter_rules.json"
+FILTER_RULES_RELOAD_INTERVAL = 5  # 규칙 파일 변경 확인 간격 (초)
+
 # 필터링 키워드 (제외할 내용)
 EXCLUDE_KEYWORDS = [
     "광고",
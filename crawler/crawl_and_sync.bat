@@ -50,8 +50,12 @@ echo 🔄 프론트엔드 데이터 동기화를 시작합니다...
 echo.
 
 python sync_to_frontend.py --sync
+set SYNC_RESULT=%errorlevel%
 
-if %errorlevel% neq 0 (
+rem 종료 코드 3 = 변경 없음 (오류 아님, 호출한 스크립트가 커밋/푸시를 생략하도록 그대로 전달)
+if %SYNC_RESULT% equ 3 (
+    echo ℹ️ 프론트엔드 데이터 변경 없음 - 동기화 생략
+) else if %SYNC_RESULT% neq 0 (
     echo ❌ 동기화 중 오류가 발생했습니다.
     pause
     exit /b 1
@@ -69,4 +73,6 @@ echo   - 프론트엔드: frontend/public/data/ 폴더
 echo.
 echo 🌐 웹사이트에서 최신 데이터를 확인해보세요!
 echo.
-echo 아무 키나 누르면 종료합니다...
\ No newline at end of file
+echo 아무 키나 누르면 종료합니다...
+
+if %SYNC_RESULT% equ 3 exit /b 3
\ No newline at end of file
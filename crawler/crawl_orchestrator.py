@@ -0,0 +1,93 @@
+"""
+비동기 크롤링 오케스트레이터
+뉴스/블로그/유튜브/카페 키워드를 asyncio로 동시에 크롤링하고 단계별 소요 시간을 기록
+"""
+
+import time
+import asyncio
+import statistics
+from loguru import logger
+import config
+
+
+class CrawlOrchestrator:
+    """플랫폼별 키워드 크롤링을 동시에 실행 (요청 속도는 크롤러의 호스트별 제한기가 조절)"""
+
+    PLATFORM_METHODS = {
+        "news": "crawl_enhanced_naver_news",
+        "blog": "crawl_naver_blog_search",
+        "youtube": "crawl_youtube_search",
+        "cafe": "crawl_naver_cafe_search",
+    }
+
+    def __init__(self, crawler, max_concurrency=None):
+        self.crawler = crawler
+        self.max_concurrency = max_concurrency or config.MAX_CONCURRENT_CRAWLS
+        self.keyword_latencies = {}  # 플랫폼별 키워드 크롤링 소요 시간 (초)
+
+    def run(self, platform_keywords):
+        """플랫폼별 키워드 크롤링 실행 - (플랫폼별 결과, 단계별 소요 시간) 반환"""
+        return asyncio.run(self._run_all(platform_keywords))
+
+    async def _run_all(self, platform_keywords):
+        """모든 플랫폼을 동시에 실행하고 결과를 플랫폼 순서대로 모음"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+
+        tasks = {
+            platform: asyncio.create_task(self._run_platform(platform, keywords, semaphore))
+            for platform, keywords in platform_keywords.items()
+        }
+
+        platform_results = {}
+        stage_timings = {}
+        for platform, task in tasks.items():
+            items, elapsed = await task
+            platform_results[platform] = items
+            stage_timings[platform] = round(elapsed, 2)
+
+        stage_timings["crawl_total"] = round(time.perf_counter() - started, 2)
+        return platform_results, stage_timings
+
+    async def _run_platform(self, platform, keywords, semaphore):
+        """한 플랫폼의 키워드들을 동시에 실행 - 결과는 키워드 순서 유지"""
+        started = time.perf_counter()
+        method = getattr(self.crawler, self.PLATFORM_METHODS[platform])
+
+        keyword_results = await asyncio.gather(*[
+            self._run_keyword(method, platform, keyword, semaphore)
+            for keyword in keywords
+        ])
+
+        items = []
+        for result in keyword_results:
+            items.extend(result)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"{platform} 단계 완료: {len(items)}개 항목 ({elapsed:.2f}초)")
+        return items, elapsed
+
+    async def _run_keyword(self, method, platform, keyword, semaphore):
+        """키워드 하나를 작업 스레드에서 크롤링"""
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await asyncio.to_thread(method, keyword)
+                print(f"   [{platform}] '{keyword}' 완료: {len(result)}개 항목")
+                return result
+            except Exception as e:
+                logger.error(f"{platform} 키워드 '{keyword}' 크롤링 오류: {str(e)}")
+                return []
+            finally:
+                self.keyword_latencies.setdefault(platform, []).append(time.perf_counter() - started)
+
+    def latency_summary(self):
+        """플랫폼별 키워드당 소요 시간 중앙값/최댓값 (초)"""
+        return {
+            platform: {
+                "keywords": len(latencies),
+                "median_seconds": round(statistics.median(latencies), 2),
+                "max_seconds": round(max(latencies), 2),
+            }
+            for platform, latencies in self.keyword_latencies.items() if latencies
+        }
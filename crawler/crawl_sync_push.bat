@@ -10,6 +10,12 @@ echo.
 
 rem 1) 기존 크롤링 + 동기화 스크립트 실행
 call "%~dp0crawl_and_sync.bat"
+rem 종료 코드 3 = 프론트엔드 데이터 변경 없음 -> 커밋/푸시 생략
+if %errorlevel% equ 3 (
+    echo ℹ️ 프론트엔드 데이터 변경 사항이 없습니다. 커밋/푸시를 생략합니다.
+    pause
+    exit /b 0
+)
 if %errorlevel% neq 0 (
     echo ❌ 크롤링/동기화 단계에서 오류가 발생하여 Git 작업을 중단합니다.
     pause
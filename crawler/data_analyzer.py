@@ -11,6 +11,8 @@ from collections import Counter
 import re
 from loguru import logger
 import config
+from item_store import ItemStore, KST
+from parquet_archive import ParquetArchive
 
 class SongdoDataAnalyzer:
     def __init__(self):
@@ -28,9 +30,22 @@ class SongdoDataAnalyzer:
         )
         
     def load_recent_data(self, data_type, days=7):
-        """최근 N일간의 데이터 로드"""
+        """최근 N일간 수집된 데이터 로드 (항목 저장소가 있으면 수집 시각(last_seen) 인덱스로 조회, 없으면 JSON 파일 생성 시각 기준)"""
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
+            
+            # 분석기는 읽기 전용 - 저장소 파일이 없으면 새로 만들지 않음
+            if os.path.exists(config.ITEM_STORE_PATH):
+                store = ItemStore()
+                try:
+                    seen_since = (datetime.now(KST) - timedelta(days=days)).isoformat()
+                    stored_data = store.query(platform=data_type, seen_since=seen_since)
+                finally:
+                    store.close()
+                if stored_data:
+                    logger.info(f"{data_type} 데이터 로드 완료 (항목 저장소): {len(stored_data)}개 항목")
+                    return stored_data
+            
             all_data = []
             
             data_path = f"{self.data_dir}/{data_type}"
@@ -61,18 +76,32 @@ class SongdoDataAnalyzer:
             logger.error(f"데이터 로드 오류: {str(e)}")
             return []
 
+    def load_recent_frame(self, data_type, days=7, columns=None):
+        """최근 N일간의 데이터를 DataFrame으로 로드 (Parquet 데이터셋이 있으면 필요한 컬럼과 파티션만 읽음)"""
+        try:
+            since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            df = ParquetArchive().read(columns=columns, platforms=[data_type], since=since)
+            if df is not None:
+                for column in df.select_dtypes('category').columns:
+                    df[column] = df[column].cat.remove_unused_categories()
+                logger.info(f"{data_type} 데이터 로드 완료 (Parquet): {len(df)}개 항목")
+                return df
+        except Exception as e:
+            logger.warning(f"Parquet 데이터셋 로드 실패 - JSON 데이터 사용: {str(e)}")
+        
+        data = self.load_recent_data(data_type, days)
+        return pd.DataFrame(data) if data else None
+
     def analyze_news_trends(self, days=7):
         """뉴스 트렌드 분석"""
         try:
             logger.info(f"최근 {days}일간 뉴스 트렌드 분석 시작")
             
-            news_data = self.load_recent_data("news", days)
-            if not news_data:
+            # 분석에 쓰는 컬럼만 로드
+            df = self.load_recent_frame("news", days, columns=['keyword', 'press', 'title', 'crawled_at'])
+            if df is None or df.empty:
                 return {"error": "분석할 뉴스 데이터가 없습니다."}
             
-            # 데이터프레임 생성
-            df = pd.DataFrame(news_data)
-            
             # 기본 통계
             total_articles = len(df)
             unique_sources = df['press'].nunique() if 'press' in df.columns else 0
@@ -115,12 +144,10 @@ class SongdoDataAnalyzer:
         try:
             logger.info(f"최근 {days}일간 카페 트렌드 분석 시작")
             
-            cafe_data = self.load_recent_data("cafe", days)
-            if not cafe_data:
+            df = self.load_recent_frame("cafe", days, columns=['keyword', 'cafe_name', 'title', 'content_preview'])
+            if df is None or df.empty:
                 return {"error": "분석할 카페 데이터가 없습니다."}
             
-            df = pd.DataFrame(cafe_data)
-            
             # 기본 통계
             total_posts = len(df)
             unique_cafes = df['cafe_name'].nunique() if 'cafe_name' in df.columns else 0
@@ -0,0 +1,158 @@
+"""
+정확 중복 제거 엔진
+항목마다 정규화 텍스트/길이/SequenceMatcher를 한 번만 준비해 두고, 길이 비율과 quick_ratio 상한으로
+기준에 못 미치는 쌍을 먼저 걸러낸 뒤 남은 쌍만 ratio를 계산 (기존 전체 쌍 비교와 결과 동일)
+플랫폼/날짜 구간 블로킹은 선택 사항 - 켜면 다른 플랫폼이나 구간 밖의 항목과는 비교하지 않음
+"""
+
+import re
+import time
+import difflib
+from datetime import date
+from collections import defaultdict
+import config
+from near_duplicates import normalize_text, item_content
+
+DATE_PATTERN = re.compile(r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})')
+
+
+def _bound(matches, length):
+    # difflib과 같은 식으로 계산해야 경계값에서 ratio와 상한의 대소가 뒤집히지 않음
+    return 2.0 * matches / length if length else 1.0
+
+
+def item_date_ordinal(item):
+    """항목 날짜 (date, 없으면 crawled_at)의 ordinal - 형식을 알 수 없으면 None"""
+    for key in ('date', 'crawled_at'):
+        match = DATE_PATTERN.search(str(item.get(key) or ''))
+        if match:
+            try:
+                return date(*map(int, match.groups())).toordinal()
+            except ValueError:
+                continue
+    return None
+
+
+class DedupRecord:
+    """항목 하나의 비교용 특징 (정규화 텍스트와 길이, 재사용하는 SequenceMatcher)"""
+
+    __slots__ = ("url", "title", "content", "title_matcher", "content_matcher")
+
+    def __init__(self, item):
+        self.url = item.get('url')
+        self.title = normalize_text(item.get('title', ''))
+        self.content = normalize_text(item_content(item))
+        self.title_matcher = None
+        self.content_matcher = None
+
+
+class ExactDedupEngine:
+    """먼저 남긴 항목과 중복인 항목을 제외 - 판정 기준과 결과는 기존 _is_duplicate_content 비교와 동일"""
+
+    def __init__(self, title_threshold=0.8, content_threshold=0.7, title_floor=0.6, block_by_type=None, date_window_days=None):
+        self.title_threshold = title_threshold
+        self.content_threshold = content_threshold
+        self.title_floor = title_floor
+        self.block_by_type = config.DEDUP_BLOCK_BY_TYPE if block_by_type is None else block_by_type
+        self.date_window_days = config.DEDUP_DATE_WINDOW_DAYS if date_window_days is None else date_window_days
+
+        self.urls = set()
+        self.blocks = defaultdict(list)
+        self.stats = {
+            "items": 0,
+            "unique": 0,
+            "url_matches": 0,
+            "pairs": 0,
+            "length_pruned": 0,
+            "quick_ratio_pruned": 0,
+            "full_ratios": 0,
+            "seconds": 0.0,
+        }
+
+    def _block_keys(self, item, for_insert):
+        """비교 대상 블록 키 - 블로킹을 끄면 전체가 하나의 블록"""
+        block = item.get('type') if self.block_by_type else None
+        if not self.date_window_days:
+            return [(block, None)]
+
+        ordinal = item_date_ordinal(item)
+        if for_insert:
+            return [(block, ordinal)]
+        if ordinal is None:
+            # 날짜를 알 수 없는 항목은 블록 안의 모든 항목과 비교
+            return [key for key in self.blocks if key[0] == block]
+        # 날짜를 알 수 없는 기존 항목은 항상 비교
+        window = self.date_window_days
+        return [(block, None)] + [(block, day) for day in range(ordinal - window, ordinal + window + 1)]
+
+    def _similarity(self, text, other_text, other, attribute, threshold):
+        """other 텍스트와의 SequenceMatcher 유사도 - 상한이 threshold 미만이면 계산을 생략하고 0 반환"""
+        if not text or not other_text:
+            return 0.0
+
+        length = len(text) + len(other_text)
+        if _bound(min(len(text), len(other_text)), length) < threshold:
+            self.stats["length_pruned"] += 1
+            return 0.0
+
+        # 기존 항목 쪽(b)을 고정해 두면 b2j/fullbcount를 새 항목마다 다시 만들지 않음
+        matcher = getattr(other, attribute)
+        if matcher is None:
+            matcher = difflib.SequenceMatcher(None, "", other_text)
+            setattr(other, attribute, matcher)
+        matcher.set_seq1(text)
+
+        if matcher.quick_ratio() < threshold:
+            self.stats["quick_ratio_pruned"] += 1
+            return 0.0
+
+        self.stats["full_ratios"] += 1
+        return matcher.ratio()
+
+    def _is_duplicate(self, record, other):
+        self.stats["pairs"] += 1
+        title_similarity = self._similarity(record.title, other.title, other, "title_matcher", self.title_floor)
+        if title_similarity >= self.title_threshold:
+            return True
+        if title_similarity < self.title_floor:
+            return False
+        content_similarity = self._similarity(record.content, other.content, other, "content_matcher", self.content_threshold)
+        return content_similarity >= self.content_threshold
+
+    def deduplicate(self, items):
+        """입력 순서대로 앞서 남긴 항목과 중복인 항목을 제외한 목록"""
+        started = time.perf_counter()
+        unique_items = []
+
+        for item in items:
+            self.stats["items"] += 1
+            record = DedupRecord(item)
+
+            # URL이 같으면 (둘 다 없는 경우 포함) 기존 비교와 마찬가지로 중복
+            if record.url in self.urls:
+                self.stats["url_matches"] += 1
+                continue
+
+            is_duplicate = any(
+                self._is_duplicate(record, other)
+                for key in self._block_keys(item, for_insert=False)
+                for other in self.blocks.get(key, ())
+            )
+            if is_duplicate:
+                continue
+
+            self.urls.add(record.url)
+            for key in self._block_keys(item, for_insert=True):
+                self.blocks[key].append(record)
+            unique_items.append(item)
+
+        self.stats["unique"] += len(unique_items)
+        self.stats["seconds"] += time.perf_counter() - started
+        return unique_items
+
+    def get_stats(self):
+        """비교 쌍 수와 단계별로 걸러낸 수, 소요 시간"""
+        stats = dict(self.stats)
+        stats["seconds"] = round(stats["seconds"], 3)
+        stats["pruned_ratio"] = round(1 - stats["full_ratios"] / stats["pairs"], 3) if stats["pairs"] else 0.0
+        return stats
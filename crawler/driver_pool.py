@@ -0,0 +1,177 @@
+"""
+웹드라이버 풀
+크기가 제한된 Chrome 세션을 대여/반납 방식으로 여러 작업 스레드가 나눠 쓰도록 관리
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from loguru import logger
+import config
+
+
+class PooledDriver:
+    """풀에 들어있는 웹드라이버와 사용 이력"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.monotonic()
+
+
+class WebDriverPool:
+    """Chrome 세션 풀 - 상태 점검 및 페이지 수/메모리 한도 초과 시 재생성"""
+
+    def __init__(self, factory, size=None, max_pages=None, max_memory_mb=None, disposer=None):
+        # factory: 새 웹드라이버를 만들어 반환하는 함수 (실패 시 예외 발생)
+        # disposer: 드라이버 종료 후 호출할 함수 (예: 브라우저 데몬 포트 반납)
+        self.factory = factory
+        self.disposer = disposer
+        self.size = size or config.DRIVER_POOL_SIZE
+        self.max_pages = max_pages or config.DRIVER_MAX_PAGES
+        self.max_memory_mb = max_memory_mb or config.DRIVER_MAX_MEMORY_MB
+
+        self._idle = []
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.stats = {"created": 0, "recycled": 0, "unhealthy": 0, "checkouts": 0}
+
+    @contextmanager
+    def checkout(self, timeout=None):
+        """웹드라이버 대여 - with 블록이 끝나면 자동 반납"""
+        entry = self._acquire(timeout or config.DRIVER_CHECKOUT_TIMEOUT)
+        broken = False
+        try:
+            yield entry.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self._release(entry, broken)
+
+    def _acquire(self, timeout):
+        """유휴 드라이버를 꺼내거나, 한도 내에서 새로 생성"""
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._condition:
+                entry = None
+                while True:
+                    if self._closed:
+                        raise RuntimeError("웹드라이버 풀이 이미 종료되었습니다")
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._created < self.size:
+                        self._created += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        raise TimeoutError(f"웹드라이버 대여 대기 시간 초과 ({timeout}초)")
+                self.stats["checkouts"] += 1
+
+            if entry is None:
+                return self._create()
+
+            if self._is_healthy(entry):
+                return entry
+
+            logger.warning("응답 없는 웹드라이버 발견 - 새 세션으로 교체")
+            with self._condition:
+                self.stats["unhealthy"] += 1
+            self._discard(entry)
+
+    def _create(self):
+        """새 웹드라이버 생성 (실패 시 생성 카운트 복구)"""
+        try:
+            entry = PooledDriver(self.factory())
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self.stats["created"] += 1
+        logger.info(f"웹드라이버 풀: 새 세션 생성 ({self._created}/{self.size})")
+        return entry
+
+    def _release(self, entry, broken=False):
+        """웹드라이버 반납 - 한도를 넘었거나 고장난 경우 종료"""
+        entry.pages += 1
+
+        if broken:
+            logger.warning("오류가 발생한 웹드라이버 폐기")
+            self._discard(entry)
+            return
+
+        if entry.pages >= self.max_pages:
+            logger.info(f"웹드라이버 재생성: 페이지 한도 도달 ({entry.pages}페이지)")
+            with self._condition:
+                self.stats["recycled"] += 1
+            self._discard(entry)
+            return
+
+        memory_mb = self._get_memory_mb(entry)
+        if memory_mb > self.max_memory_mb:
+            logger.info(f"웹드라이버 재생성: 메모리 한도 초과 ({memory_mb:.0f}MB)")
+            with self._condition:
+                self.stats["recycled"] += 1
+            self._discard(entry)
+            return
+
+        with self._condition:
+            if self._closed:
+                self._quit(entry)
+                return
+            self._idle.append(entry)
+            self._condition.notify()
+
+    def _discard(self, entry):
+        """드라이버 종료 후 빈 자리를 대기 중인 스레드에 알림"""
+        self._quit(entry)
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    def _quit(self, entry):
+        """드라이버 종료 (오류 무시)"""
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            logger.debug(f"웹드라이버 종료 중 오류: {str(e)}")
+        if self.disposer:
+            self.disposer(entry.driver)
+
+    def _is_healthy(self, entry):
+        """간단한 스크립트 실행으로 세션 상태 확인"""
+        try:
+            return entry.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _get_memory_mb(self, entry):
+        """현재 페이지의 JS 힙 사용량 (MB) - 측정 불가 시 0"""
+        try:
+            used = entry.driver.execute_script(
+                "return (performance.memory && performance.memory.usedJSHeapSize) || 0"
+            )
+            return (used or 0) / (1024 * 1024)
+        except Exception:
+            return 0
+
+    def close(self):
+        """유휴 드라이버 모두 종료 (대여 중인 드라이버는 반납 시 종료)"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._condition.notify_all()
+
+        for entry in idle:
+            self._quit(entry)
+
+        if self.stats["created"]:
+            logger.info(f"웹드라이버 풀 종료: {self.stats}")
@@ -5,20 +5,37 @@
 
 import os
 import json
+import glob
 import time
-import requests
+import threading
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 from loguru import logger
 import config
+from fetchers import HttpFetcher, SeleniumFetcher, has_result_containers
+from rate_limiter import HostRateLimiter
+from driver_pool import WebDriverPool
+from browser_daemon import BrowserDaemonClient, resolve_chromedriver
+from readiness import ReadinessWaiter
+from parse_pipeline import ParsePipeline
+from filter_rules import FilterEngine
+from near_duplicates import NearDuplicateIndex, normalize_text
+from dedup_engine import ExactDedupEngine
+from url_canonical import UrlCanonicalizer, canonical_url
+import tfidf_dedup
+from network_profiles import NetworkMonitor, configure_options, apply_network_profile, seed_consent_cookies, read_page_stats
+from response_cache import ResponseCache
+from seen_store import SeenStore
+from simhash_index import SimHashStore
+from item_store import ItemStore
+from jsonl_archive import JsonlArchive
+from compaction import DataCompactor
+from parquet_archive import ParquetArchive
+import parsers
+from crawl_orchestrator import CrawlOrchestrator
 import difflib
 import re
 
@@ -29,8 +46,28 @@ class EnhancedSongdoCrawler:
     def __init__(self):
         """개선된 크롤러 초기화"""
         self.setup_logging()
-        self.driver = None
         self.data_dir = self.ensure_data_directory()
+        self.http_fetcher = HttpFetcher() if config.HTTP_FETCH_ENABLED else None
+        # Chrome 세션은 풀에서 대여 (필요한 시점에 생성, 작업 스레드 간 병렬 사용)
+        # 브라우저 데몬이 실행 중이면 새로 띄우지 않고 데몬 Chrome에 연결
+        self.browser_daemon = BrowserDaemonClient()
+        self.browser_startup = {"attached": 0, "launched": 0, "seconds": []}
+        self.driver_pool = WebDriverPool(self.create_webdriver, disposer=self.browser_daemon.release_driver)
+        self.network_monitor = NetworkMonitor()
+        self.readiness = ReadinessWaiter()
+        self.selenium_fetcher = SeleniumFetcher(self.driver_pool, self.network_monitor, self.readiness)
+        self.rate_limiter = HostRateLimiter()
+        self.response_cache = ResponseCache()
+        self.seen_store = SeenStore()
+        self.simhash_store = SimHashStore()
+        self.item_store = ItemStore()
+        self.jsonl_archive = JsonlArchive() if config.JSONL_ARCHIVE_ENABLED else None
+        self.parquet_archive = ParquetArchive() if config.PARQUET_ARCHIVE_ENABLED else None
+        self.url_canonicalizer = UrlCanonicalizer()
+        self.pagination_stats = {"pages": 0, "early_stops": 0}
+        self.parse_pipeline = ParsePipeline()
+        self.filter_engine = FilterEngine()
+        self._stats_lock = threading.Lock()
         
     def setup_logging(self):
         """로깅 설정"""
@@ -53,7 +90,15 @@ class EnhancedSongdoCrawler:
         return config.DATA_DIR
 
     def create_webdriver(self):
-        """안전한 웹드라이버 생성"""
+        """웹드라이버 생성 - 웹드라이버 풀의 세션 생성 함수 (실패 시 예외 발생)"""
+        started = time.perf_counter()
+        driver = self.browser_daemon.attach()
+        if driver:
+            self._record_browser_startup("attached", started)
+            driver.set_page_load_timeout(30)
+            logger.info(f"브라우저 데몬 연결 완료 (포트 {driver.daemon_port})")
+            return driver
+        
         try:
             options = webdriver.ChromeOptions()
             # 동적으로 환경에 맞는 Chrome 옵션 가져오기
@@ -70,21 +115,160 @@ class EnhancedSongdoCrawler:
             }
             options.add_experimental_option("prefs", prefs)
             
+            # eager 페이지 로드 + 네트워크 통계용 성능 로그
+            configure_options(options)
+            
             # GitHub Actions 환경에서는 시스템 ChromeDriver 사용
             if os.getenv('GITHUB_ACTIONS') == 'true':
                 # 시스템에 설치된 ChromeDriver 사용
-                self.driver = webdriver.Chrome(options=options)
+                driver = webdriver.Chrome(options=options)
             else:
-                # 로컬 환경에서는 webdriver-manager 사용
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.set_page_load_timeout(30)
+                # 로컬 환경에서는 Chrome 버전별로 캐시된 ChromeDriver 사용 (없을 때만 webdriver-manager로 설치)
+                service = Service(resolve_chromedriver())
+                driver = webdriver.Chrome(service=service, options=options)
+            driver.set_page_load_timeout(30)
+            self._record_browser_startup("launched", started)
             logger.info("웹드라이버 생성 완료")
-            return True
+            return driver
             
         except Exception as e:
             logger.error(f"웹드라이버 생성 실패: {str(e)}")
-            return False
+            raise
+
+    def _record_browser_startup(self, mode, started):
+        """웹드라이버 준비 시간 기록 (mode: "attached" 데몬 연결, "launched" 새 Chrome 실행)"""
+        with self._stats_lock:
+            self.browser_startup[mode] += 1
+            self.browser_startup["seconds"].append(round(time.perf_counter() - started, 3))
+
+    def _browser_startup_summary(self):
+        """실행 요약용 웹드라이버 준비 시간 통계"""
+        seconds = self.browser_startup["seconds"]
+        return {
+            "attached": self.browser_startup["attached"],
+            "launched": self.browser_startup["launched"],
+            "first_seconds": seconds[0] if seconds else None,
+            "avg_seconds": round(sum(seconds) / len(seconds), 3) if seconds else None,
+        }
+
+    def _fetch_search_html(self, url, platform):
+        """검색 결과 HTML 수집 - 캐시 확인 후 HTTP 우선, 결과 컨테이너가 없으면 Selenium으로 대체"""
+        cached = self.response_cache.get(url, platform)
+        if cached and cached['fresh']:
+            logger.debug(f"{platform} 검색 결과 캐시 사용: {url}")
+            return cached['html']
+        
+        fetchers = []
+        if self.http_fetcher and platform in config.HTTP_FETCH_PLATFORMS:
+            fetchers.append(self.http_fetcher)
+        fetchers.append(self.selenium_fetcher)
+
+        html = None
+        for fetcher in fetchers:
+            self.rate_limiter.acquire(url)
+            etag = last_modified = None
+            
+            if fetcher is self.http_fetcher:
+                # 만료된 캐시가 있으면 ETag/Last-Modified로 조건부 요청
+                response = self.http_fetcher.fetch_response(url, self.response_cache.validators(cached))
+                if response is not None and response.status_code == 304 and cached:
+                    logger.debug(f"{platform} 검색 결과 변경 없음 (304): {url}")
+                    self.response_cache.mark_revalidated(url)
+                    return cached['html']
+                html = response.text if response is not None else None
+                if response is not None:
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+            else:
+                html = fetcher.fetch(url, platform)
+            
+            if has_result_containers(html, platform):
+                logger.debug(f"{platform} 검색 결과 수집 ({fetcher.name}): {url}")
+                self.response_cache.put(url, platform, html, etag, last_modified)
+                return html
+            logger.debug(f"{fetcher.name} 응답에 {platform} 결과 컨테이너 없음: {url}")
+
+        return html
+
+    def _skip_known_items(self, items):
+        """증분 크롤링 모드에서 이전 실행에서 이미 수집한 항목 제외"""
+        if not config.INCREMENTAL_CRAWL:
+            return items
+        
+        new_items = self.seen_store.filter_new(items)
+        if len(new_items) < len(items):
+            logger.debug(f"이미 수집한 항목 {len(items) - len(new_items)}개 건너뜀")
+        return new_items
+
+    def _page_url(self, url, page, page_size):
+        """검색 URL의 start 파라미터를 page 번째 페이지로 설정"""
+        start = (page - 1) * page_size + 1
+        if re.search(r'[?&]start=\d+', url):
+            return re.sub(r'([?&])start=\d+', rf'\g<1>start={start}', url)
+        return url if page == 1 else f"{url}&start={start}"
+
+    def _fetch_and_submit(self, url, platform, keyword, parse_kwargs):
+        """페이지 HTML을 수집해 바로 파서 파이프라인에 넘김 - 항목 목록 Future 반환 (수집 실패 시 None)"""
+        started = time.perf_counter()
+        html = self._fetch_search_html(url, platform)
+        self.parse_pipeline.record_fetch(time.perf_counter() - started)
+        if not html:
+            return None
+        return self.parse_pipeline.submit(platform, html, keyword, **parse_kwargs)
+
+    def _crawl_paginated(self, search_url, platform, keyword, page_kwargs):
+        """검색 결과 여러 페이지 수집 - 첫 페이지 이후는 묶음 단위로 동시에 가져오고 새 항목이 없는 페이지에서 중단"""
+        # page_kwargs(start_rank): 페이지별 파서 인자 (limit, backend 등) 를 반환하는 함수
+        page_size = config.SEARCH_PAGE_SIZE[platform]
+        max_items = config.MAX_ITEMS_PER_KEYWORD[platform]
+        
+        items = []
+        seen_urls = set()
+        fetched_pages = 0
+        page = 1
+        while page <= config.MAX_PAGES and len(items) < max_items:
+            # 첫 페이지는 단독으로, 이후 페이지는 PAGE_FETCH_CONCURRENCY개씩 동시에 (속도는 호스트별 제한기가 조절)
+            last_page = page if page == 1 else min(page + config.PAGE_FETCH_CONCURRENCY - 1, config.MAX_PAGES)
+            pages = list(range(page, last_page + 1))
+            urls = [self._page_url(search_url, p, page_size) for p in pages]
+            
+            # 각 페이지는 도착하는 즉시 파서 프로세스로 넘어가고, 그동안 다른 페이지/키워드 수집이 계속됨
+            starts = [(p - 1) * page_size + 1 for p in pages]
+            if len(urls) == 1:
+                futures = [self._fetch_and_submit(urls[0], platform, keyword, page_kwargs(starts[0]))]
+            else:
+                with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                    futures = list(executor.map(
+                        lambda args: self._fetch_and_submit(args[0], platform, keyword, page_kwargs(args[1])),
+                        zip(urls, starts)
+                    ))
+            
+            fetched_pages += len(urls)
+            with self._stats_lock:
+                self.pagination_stats["pages"] += len(urls)
+            
+            exhausted = False
+            for current_page, future in zip(pages, futures):
+                page_items = future.result() if future else []
+                new_items = [item for item in page_items if canonical_url(item['url']) not in seen_urls]
+                new_items = self._skip_known_items(new_items)
+                
+                if not new_items:
+                    logger.debug(f"{platform} {current_page}페이지에 새 항목 없음 - 페이지네이션 중단")
+                    exhausted = True
+                    break
+                
+                seen_urls.update(canonical_url(item['url']) for item in new_items)
+                items.extend(new_items)
+            
+            if exhausted:
+                with self._stats_lock:
+                    self.pagination_stats["early_stops"] += 1
+                break
+            page = last_page + 1
+        
+        logger.debug(f"{platform} 페이지네이션: {fetched_pages}페이지 수집, 후보 {len(items)}개")
+        return items
 
     def extract_article_content(self, url):
         """실제 뉴스 기사 URL에서 상세 내용 추출 - 현재 사용하지 않음"""
@@ -106,12 +290,13 @@ class EnhancedSongdoCrawler:
             unique_news = []
             seen_urls = set()
             for article in news_data:
-                if article['url'] not in seen_urls:
+                url_key = canonical_url(article['url'])
+                if url_key not in seen_urls:
                     unique_news.append(article)
-                    seen_urls.add(article['url'])
+                    seen_urls.add(url_key)
             
-            # 상위 5개만 유지
-            news_data = unique_news[:5]
+            # 키워드당 최대 수집 수만큼 유지
+            news_data = unique_news[:config.MAX_ITEMS_PER_KEYWORD['news']]
             
             logger.info(f"네이버 뉴스 직접 수집 완료: {len(news_data)}개 기사")
             return news_data
@@ -135,115 +320,17 @@ class EnhancedSongdoCrawler:
             )
             
             logger.debug(f"검색 URL: {search_url}")
-            self.driver.get(search_url)
-            time.sleep(config.DELAY_BETWEEN_REQUESTS)
-
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
             
-            news_data = []
+            # 여러 페이지에서 후보 기사를 모아 중복 제거 단계로 넘김
+            candidates = self._crawl_paginated(
+                search_url, "news", keyword,
+                lambda start_rank: {"limit": config.SEARCH_PAGE_SIZE['news'], "backend": config.HTML_PARSER_BACKEND}
+            )
+            logger.debug(f"네이버 뉴스 후보 기사: {len(candidates)}개")
             
-            news_areas = soup.select('div.news_area')
-            logger.debug(f"네이버 뉴스 컨테이너 발견: {len(news_areas)}개 (news_area)")
-
-            # 2025-07 네이버 UI 개편 대응: fallback 컨테이너
-            if len(news_areas) == 0:
-                # 새로운 2025-07 네이버 뉴스 UI 대응
-                # div.sds-comps-vertical-layout.sds-comps-full-layout 요소 중
-                # 헤드라인(span.sds-comps-text-type-headline1)이 포함된 컨테이너만 필터링
-                candidate_areas = soup.select('div.sds-comps-vertical-layout.sds-comps-full-layout')
-                news_areas = [c for c in candidate_areas if c.select_one('span.sds-comps-text-type-headline1')]
-                logger.debug(f"새 UI 컨테이너 발견: {len(news_areas)}개 (sds-comps-vertical-layout)")
-            
-
-            for idx, area in enumerate(news_areas[:10]):  # 최대 10개까지 가져와서 중복 제거 단계로 넘김
-                try:
-                    # ----- 제목 & 링크 -----
-                    title = ""
-                    link = ""
-                    title_link = area.select_one('a.news_tit')
-
-                    if title_link:
-                        title = title_link.get_text(strip=True)
-                        link = title_link['href']
-                    else:
-                        # Fallback UI: headline span 안의 텍스트 + 부모 앵커 링크
-                        title_span = area.select_one('span.sds-comps-text-type-headline1')
-                        if title_span:
-                            title = title_span.get_text(strip=True)
-                            parent_a = title_span.find_parent('a')
-                            if parent_a and parent_a.has_attr('href'):
-                                link = parent_a['href']
-                    
-                    if not title or not link:
-                        continue
-                    
-                    # 유효한 뉴스 URL인지 확인
-                    if not self._is_valid_news_url_enhanced(link):
-                        continue
-                    
-                    # 광고성 콘텐츠 필터링
-                    if self._is_ad_content(title):
-                        continue
-                    
-                    # 요약문 (구버전/신버전 모두 대응)
-                    summary_elem = (
-                        area.select_one('div.dsc_wrap') or
-                        area.select_one('a.api_txt_lines.dsc_txt_wrap') or
-                        area.select_one('span.sds-comps-text-type-body1')
-                    )
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    if len(summary) > 200:
-                        summary = summary[:200] + "..."
-                            
-                    # 날짜 처리
-                    date_info = datetime.now().strftime("%Y-%m-%d")
-                    date_elem = (
-                        area.select_one('span.date') or
-                        area.select_one('span.sds-comps-text-type-body2') or
-                        area.select_one('span.sds-comps-profile-info-subtext span.sds-comps-text-type-body2')
-                    )
-                    if date_elem:
-                        date_text = date_elem.get_text(strip=True)
-                        try:
-                            if "일 전" in date_text:
-                                days_ago = int(date_text.replace("일 전", "").strip())
-                                date_info = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-                            elif "시간 전" in date_text:
-                                hours_ago = int(date_text.replace("시간 전", "").strip())
-                                date_info = (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d")
-                        except Exception:
-                            pass
-
-                    # 언론사
-                    press = ""
-                    press_elem = (
-                        area.select_one('a.info.press') or
-                        area.select_one('span.sds-comps-profile-info-title-text')
-                    )
-                    if press_elem:
-                        press = press_elem.get_text(strip=True)
-                    else:
-                        from urllib.parse import urlparse
-                        press = urlparse(link).netloc
-                            
-                    news_data.append({
-                        "title": title,
-                        "url": link,
-                        "content": summary,
-                        "summary": summary,
-                        "press": press,
-                        "date": date_info,
-                        "crawled_at": datetime.now().strftime("%Y-%m-%d"),
-                        "content_length": len(summary),
-                        "keyword": keyword,
-                        "section": "검색 결과",
-                        "type": "news"
-                    })
-                    
-                except Exception as e:
-                    logger.debug(f"뉴스 아이템 {idx+1} 처리 오류: {str(e)}")
-                    continue
+            # 웹 URL만 남기고 광고/홍보 규칙 적용
+            news_data = [article for article in candidates if self._is_valid_news_url_enhanced(article['url'])]
+            news_data = self.filter_engine.filter(news_data, "news")
             
             logger.info(f"네이버 뉴스 검색으로 {len(news_data)}개 수집 완료")
             return news_data
@@ -253,42 +340,10 @@ class EnhancedSongdoCrawler:
             return []
 
     def _is_valid_news_url_enhanced(self, url):
-        """강화된 뉴스 URL 유효성 검사 - 더 포용적으로 수정"""
+        """뉴스 URL 유효성 검사 - http/https 웹 URL만 허용 (광고/프로모션 URL은 필터 규칙 news_ad_url에서 제외)"""
         if not url:
             return False
-        
-        # 제외할 패턴만 확인 (광고, 프로모션 등)
-        invalid_patterns = [
-            "static/channelPromotion",
-            "mkt.naver.com",
-            "promotion",
-            "ad.naver.com",
-            "shopping.naver.com",
-            "channelPromotion.html",
-            "atrb?channel_id"
-        ]
-        
-        # 기본적으로 http/https로 시작하는 URL이고 제외 패턴이 없으면 유효
-        has_invalid_pattern = any(pattern in url for pattern in invalid_patterns)
-        is_web_url = url.startswith(('http://', 'https://'))
-        
-        return is_web_url and not has_invalid_pattern
-
-    def _is_ad_content(self, title):
-        """광고성 콘텐츠 판별"""
-        ad_keywords = [
-            "언론사 선정",
-            "언론사가 선정한",
-            "네이버 메인에서", 
-            "구독하세요",
-            "클립 크리에이터",
-            "피드형 콘텐츠",
-            "창작자도 지원",
-            "Ready, Set, Clip",
-            "주요기사 혹은 심층기획"
-        ]
-        
-        return any(keyword in title for keyword in ad_keywords)
+        return url.startswith(('http://', 'https://'))
 
     def crawl_naver_blog_search(self, keyword):
         """네이버 블로그 검색 결과 크롤링 - 관련도순, 최신 7일"""
@@ -300,110 +355,30 @@ class EnhancedSongdoCrawler:
             encoded_keyword = urllib.parse.quote(keyword)
             search_url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&sm=tab_jum&query={encoded_keyword}&nso=so%3Ar%2Cp%3A1w"
             
-            self.driver.get(search_url)
-            time.sleep(config.DELAY_BETWEEN_REQUESTS)
-            
-            # 블로그 포스트 요소들 찾기 - 사용자 제공 구조에 맞게 수정  
-            blog_containers = self.driver.find_elements(By.CSS_SELECTOR, "div.view_wrap")
-            
-            logger.info(f"발견된 블로그 컨테이너 수: {len(blog_containers)}")
+            # 페이지별 스냅샷에서 포스트 추출 (키워드당 최대 수집 수까지)
+            posts = self._crawl_paginated(
+                search_url, "blog", keyword,
+                lambda start_rank: {
+                    "limit": config.SEARCH_PAGE_SIZE['blog'],
+                    "backend": config.HTML_PARSER_BACKEND,
+                    "start_rank": start_rank
+                }
+            )
+            logger.info(f"발견된 블로그 포스트 수: {len(posts)}")
             
-            for idx, container in enumerate(blog_containers[:5]):  # 최신 5개만
+            for blog_post in posts:
                 try:
-                    # 제목과 링크 추출 - 사용자 제공 구조에 맞게 수정
-                    title_element = container.find_element(By.CSS_SELECTOR, ".detail_box .title_area a.title_link")
-                    title = title_element.text.strip()
-                    # mark 태그 제거
-                    title = BeautifulSoup(title_element.get_attribute('innerHTML'), 'html.parser').get_text(strip=True)
-                    link = title_element.get_attribute("href")
-                    
-                    # 내용 추출
-                    try:
-                        content_element = container.find_element(By.CSS_SELECTOR, ".detail_box .dsc_area a.dsc_link")
-                        content_html = content_element.get_attribute('innerHTML')
-                        # mark 태그 제거
-                        content = BeautifulSoup(content_html, 'html.parser').get_text(strip=True)
-                    except:
-                        content = ""
-                    
-                    # 블로그명 추출 - 사용자 제공 구조에서 추출
-                    try:
-                        blog_name_element = container.find_element(By.CSS_SELECTOR, ".user_box_inner .user_info a.name")
-                        source = blog_name_element.text.strip()
-                    except:
-                        source = "네이버 블로그"
-                    
-                    # 날짜 정보 추출 - 새로운 기능 추가
-                    date_info = ""
-                    try:
-                        date_element = container.find_element(By.CSS_SELECTOR, ".user_box_inner .user_info span.sub")
-                        date_text = date_element.text.strip()
-                        
-                        # "X일 전" 형식을 실제 날짜로 변환
-                        if "일 전" in date_text:
-                            days_ago = int(date_text.replace("일 전", "").strip())
-                            actual_date = datetime.now() - timedelta(days=days_ago)
-                            date_info = actual_date.strftime("%Y-%m-%d")
-                        elif "시간 전" in date_text:
-                            # 시간 전인 경우 오늘 날짜
-                            date_info = datetime.now().strftime("%Y-%m-%d")
-                        else:
-                            # 기타 경우 오늘 날짜로 설정
-                            date_info = datetime.now().strftime("%Y-%m-%d")
-                    except Exception as date_error:
-                        logger.debug(f"블로그 날짜 추출 실패: {str(date_error)}")
-                        date_info = datetime.now().strftime("%Y-%m-%d")
-                    
-                    if not title or len(title) < 5:
-                        continue
-                    
-                    # 광고성 콘텐츠 강화 필터링
-                    ad_keywords = [
-                        "언론사 선정",
-                        "클립 크리에이터",
-                        "피드형 콘텐츠", 
-                        "창작자도 지원",
-                        "네이버 클립",
-                        "Ready, Set, Clip",
-                        "신청 기간",
-                        "크리에이터라면"
-                    ]
+                    title = blog_post['title']
+                    link = blog_post['url']
                     
-                    if any(ad_word in title for ad_word in ad_keywords):
-                        logger.debug(f"광고성 블로그 제외: {title[:50]}...")
+                    if not title or not link:
                         continue
-                        
-                    # URL 패턴 필터링 강화
-                    excluded_urls = [
-                        "mkt.naver.com",
-                        "news.naver.com/main/static/",
-                        "channelPromotion.html",
-                        "atrb?channel_id"
-                    ]
                     
-                    if any(excluded_url in link for excluded_url in excluded_urls):
-                        logger.debug(f"광고 URL 제외: {link}")
-                        continue
-                        
                     # 제목 길이 체크
                     if len(title) < 8:
                         logger.debug(f"블로그 제목 너무 짧음: {title}")
                         continue
                     
-                    blog_post = {
-                        "title": title,
-                        "content": content,
-                        "date": date_info,  # 실제 날짜 정보 사용
-                        "url": link,
-                        "source": source,
-                        "type": "blog",
-                        "keyword": keyword,
-                        "search_rank": idx + 1,
-                        "crawled_at": datetime.now().strftime("%Y-%m-%d"),  # 시간 제거하고 날짜만
-                        "press": source,  # 통일성을 위해 press 필드도 추가
-                        "summary": content
-                    }
-                    
                     blog_data.append(blog_post)
                     logger.debug(f"블로그 수집: {title[:50]}...")
                     
@@ -411,6 +386,9 @@ class EnhancedSongdoCrawler:
                     logger.warning(f"블로그 아이템 처리 중 오류: {str(e)}")
                     continue
             
+            # 광고/홍보 규칙 적용
+            blog_data = self.filter_engine.filter(blog_data, "blog")
+            blog_data = blog_data[:config.MAX_ITEMS_PER_KEYWORD['blog']]
             logger.info(f"네이버 블로그 수집 완료: {len(blog_data)}개 포스트")
             return blog_data
             
@@ -431,95 +409,28 @@ class EnhancedSongdoCrawler:
             
             logger.debug(f"유튜브 검색 URL: {search_url}")
             
-            self.driver.get(search_url)
-            time.sleep(3)  # 유튜브는 로딩이 좀 더 필요
-            
-            # 동의 버튼 클릭 (처음 방문시)
-            try:
-                accept_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label*='모두 수락'], button[aria-label*='Accept all']")
-                accept_button.click()
-                time.sleep(2)
-            except:
-                pass
-            
-            # 스크롤을 통해 더 많은 비디오 로드
-            self.driver.execute_script("window.scrollTo(0, 1000);")
-            time.sleep(2)
+            videos = []
+            if config.YOUTUBE_FETCH_MODE == "initial_data" and self.http_fetcher:
+                videos = self._fetch_youtube_initial_data(search_url, keyword)
             
-            # 비디오 요소들 찾기
-            video_items = self.driver.find_elements(By.CSS_SELECTOR, "div#contents ytd-video-renderer")
+            # ytInitialData를 얻지 못하면 브라우저로 렌더링된 DOM에서 추출
+            if not videos:
+                videos = self._fetch_youtube_rendered(search_url, keyword)
+            videos = self._skip_known_items(videos)
             
-            logger.info(f"🎬 발견된 유튜브 비디오 수: {len(video_items)}개 (상위 7개 수집 예정)")
-            
-            for idx, item in enumerate(video_items[:7]):  # 상위 7개만 수집
-                try:
-                    # 제목 추출
-                    title_element = item.find_element(By.CSS_SELECTOR, "#video-title")
-                    title = title_element.text.strip()
-                    link = title_element.get_attribute("href")
-                    
-                    # 채널명 추출
-                    try:
-                        channel_element = item.find_element(By.CSS_SELECTOR, "#channel-info #text a")
-                        channel = channel_element.text.strip()
-                    except:
-                        channel = ""
-                    
-                    # 조회수 추출
-                    try:
-                        views_element = item.find_element(By.CSS_SELECTOR, "#metadata-line span:first-child")
-                        views = views_element.text.strip()
-                    except:
-                        views = ""
-                    
-                    # 업로드 시간 추출 (없어도 포함)
-                    try:
-                        time_element = item.find_element(By.CSS_SELECTOR, "#metadata-line span:last-child")
-                        upload_time = time_element.text.strip()
-                        
-                        # 업로드 시간 체크는 로그만 남기고 제외하지 않음
-                        if upload_time and not self._is_recent_video(upload_time):
-                            logger.debug(f"오래된 영상이지만 포함: {title[:30]}... ({upload_time})")
-                            
-                    except:
-                        upload_time = "업로드 시간 불명"
-                        logger.debug(f"업로드 시간 불명이지만 포함: {title[:30]}...")
-                    
-                    # 썸네일 URL 추출
-                    try:
-                        thumbnail_element = item.find_element(By.CSS_SELECTOR, "img")
-                        thumbnail = thumbnail_element.get_attribute("src")
-                    except:
-                        thumbnail = ""
-                    
-                    if not title or len(title) < 3:
-                        continue
-                    
-                    # 업로드 시간을 실제 날짜로 변환
-                    actual_date = self._convert_upload_time_to_date(upload_time)
-                    
-                    youtube_video = {
-                        "title": title,
-                        "url": link,
-                        "channel": channel,
-                        "views": views,
-                        "upload_time": upload_time,
-                        "actual_date": actual_date,
-                        "thumbnail": thumbnail,
-                        "type": "youtube",
-                        "keyword": keyword,
-                        "search_rank": idx + 1,
-                        "date": actual_date,  # 실제 날짜 사용
-                        "summary": f"채널: {channel} | 조회수: {views} | 업로드: {upload_time}"
-                    }
-                    
-                    youtube_data.append(youtube_video)
-                    logger.debug(f"유튜브 비디오 수집: {title[:50]}...")
-                    
-                except Exception as e:
-                    logger.warning(f"유튜브 비디오 처리 중 오류: {str(e)}")
+            for video in videos:
+                if not video['title'] or len(video['title']) < 3:
                     continue
+                
+                # 업로드 시간 체크는 로그만 남기고 제외하지 않음
+                if not parsers.is_recent_video(video['upload_time']):
+                    logger.debug(f"오래된 영상이지만 포함: {video['title'][:30]}... ({video['upload_time']})")
+                
+                youtube_data.append(video)
+                logger.debug(f"유튜브 비디오 수집: {video['title'][:50]}...")
             
+            # 광고/홍보 규칙 적용
+            youtube_data = self.filter_engine.filter(youtube_data, "youtube")
             logger.info(f"유튜브 비디오 수집 완료: {len(youtube_data)}개 비디오")
             return youtube_data
             
@@ -527,85 +438,98 @@ class EnhancedSongdoCrawler:
             logger.error(f"유튜브 크롤링 오류: {str(e)}")
             return []
 
-    def _is_recent_video(self, upload_time_text):
-        """유튜브 업로드 시간이 최근인지 판단 (관대한 기준 적용)"""
-        try:
-            if not upload_time_text:
-                return True  # 시간 불명인 경우도 포함
-            
-            upload_time_text = upload_time_text.lower().strip()
-            
-            # 최근 영상 패턴들 (한 달 이내)
-            recent_patterns = [
-                "초 전", "분 전", "시간 전",  # 오늘
-                "일 전", "주 전", "주일 전",  # 일/주 단위
-                "하루 전", "이틀 전", "사흘 전", "나흘 전", "닷새 전", "엿새 전",  # 한글 표현
-                "일주일 전", "이주일 전", "삼주일 전", "한 달 전"  # 주/월 표현
-            ]
-            
-            # 패턴 매칭
-            for pattern in recent_patterns:
-                if pattern in upload_time_text:
-                    return True
-            
-            # "일 전" 패턴으로 숫자 추출 (30일까지 허용)
-            import re
-            day_match = re.search(r'(\d+)일 전', upload_time_text)
-            if day_match:
-                days_ago = int(day_match.group(1))
-                return days_ago <= 30  # 30일 이내로 확장
-            
-            # "주 전" 패턴 (4주까지 허용)
-            week_match = re.search(r'(\d+)주 전', upload_time_text)
-            if week_match:
-                weeks_ago = int(week_match.group(1))
-                return weeks_ago <= 4  # 4주 이내
-            
-            # 기본적으로 포함 (너무 엄격하지 않게)
-            return True
-            
-        except Exception as e:
-            logger.warning(f"업로드 시간 파싱 오류: {str(e)}")
-            return True  # 오류 시에도 포함
-
-    def _convert_upload_time_to_date(self, upload_time_text):
-        """유튜브 업로드 시간을 실제 날짜로 변환"""
-        try:
-            if not upload_time_text:
-                return datetime.now().strftime("%Y-%m-%d")
-            
-            upload_time_text = upload_time_text.lower().strip()
-            now = datetime.now()
-            
-            # 오늘 업로드
-            if any(x in upload_time_text for x in ["초 전", "분 전", "시간 전"]):
-                return now.strftime("%Y-%m-%d")
-            
-            # N일 전 패턴
-            import re
-            day_match = re.search(r'(\d+)일 전', upload_time_text)
-            if day_match:
-                days_ago = int(day_match.group(1))
-                target_date = now - timedelta(days=days_ago)
-                return target_date.strftime("%Y-%m-%d")
-            
-            # 한글 표현 처리
-            korean_days = {
-                "하루 전": 1, "이틀 전": 2, "사흘 전": 3, 
-                "나흘 전": 4, "닷새 전": 5, "엿새 전": 6
+    def _fetch_youtube_initial_data(self, search_url, keyword):
+        """검색 응답에 포함된 ytInitialData JSON에서 영상 추출 (부족하면 continuation 토큰으로 추가 요청)"""
+        cached = self.response_cache.get(search_url, "youtube", variant="initial_data")
+        if cached and cached['fresh']:
+            html = cached['html']
+        else:
+            self.rate_limiter.acquire(search_url)
+            html = self.http_fetcher.fetch(search_url)
+        
+        data = parsers.extract_yt_initial_data(html)
+        if not data:
+            logger.debug(f"ytInitialData 없음 - 브라우저 방식으로 대체: {keyword}")
+            return []
+        if not (cached and cached['fresh']):
+            self.response_cache.put(search_url, "youtube", html, variant="initial_data")
+        
+        limit = config.YOUTUBE_MAX_RESULTS
+        videos = parsers.parse_youtube_initial_data(data, keyword, limit=limit)
+        
+        # 증분 크롤링: 첫 페이지가 모두 이미 수집한 영상이면 continuation 요청 생략
+        if config.INCREMENTAL_CRAWL and self.seen_store.all_known(videos):
+            logger.debug(f"첫 페이지가 모두 이미 수집한 영상 - continuation 생략: {keyword}")
+            return videos
+        
+        innertube = parsers.extract_innertube_config(html)
+        token = parsers.find_youtube_continuation(data)
+        continuations = 0
+        while (len(videos) < limit and token and innertube
+               and continuations < config.YOUTUBE_MAX_CONTINUATIONS):
+            continuation_url = f"{config.YOUTUBE_INNERTUBE_SEARCH_URL}?key={innertube['api_key']}&prettyPrint=false"
+            payload = {
+                "context": {
+                    "client": {
+                        "clientName": "WEB",
+                        "clientVersion": innertube['client_version'],
+                        "hl": "ko",
+                        "gl": "KR"
+                    }
+                },
+                "continuation": token
             }
+            self.rate_limiter.acquire(continuation_url)
+            data = self.http_fetcher.post_json(continuation_url, payload)
+            if not data:
+                break
             
-            for korean_day, days_ago in korean_days.items():
-                if korean_day in upload_time_text:
-                    target_date = now - timedelta(days=days_ago)
-                    return target_date.strftime("%Y-%m-%d")
-            
-            # 기본값: 오늘 날짜
-            return now.strftime("%Y-%m-%d")
-            
-        except Exception as e:
-            logger.warning(f"날짜 변환 오류: {str(e)}")
-            return datetime.now().strftime("%Y-%m-%d")
+            page_videos = parsers.parse_youtube_initial_data(
+                data, keyword, limit=limit - len(videos), start_rank=len(videos) + 1
+            )
+            videos.extend(page_videos)
+            token = parsers.find_youtube_continuation(data)
+            continuations += 1
+            
+            # 증분 크롤링: 이미 수집한 영상만 나오면 이후 페이지도 새 영상이 없다고 보고 중단
+            if config.INCREMENTAL_CRAWL and self.seen_store.all_known(page_videos):
+                logger.debug(f"continuation 페이지가 모두 이미 수집한 영상 - 조기 중단: {keyword}")
+                break
+        
+        logger.info(f"🎬 ytInitialData에서 유튜브 비디오 {len(videos)}개 추출 (continuation {continuations}회)")
+        return videos
+
+    def _fetch_youtube_rendered(self, search_url, keyword):
+        """브라우저로 검색 페이지를 렌더링한 뒤 DOM 스냅샷에서 영상 추출"""
+        cached = self.response_cache.get(search_url, "youtube", variant="rendered")
+        if cached and cached['fresh']:
+            return parsers.parse_youtube(cached['html'], keyword, limit=config.YOUTUBE_MAX_RESULTS, backend=config.HTML_PARSER_BACKEND)
+        
+        self.rate_limiter.acquire(search_url)
+        with self.driver_pool.checkout() as driver:
+            # 동의 쿠키를 미리 넣어 동의 화면 없이 바로 검색 결과 표시
+            seed_consent_cookies(driver)
+            apply_network_profile(driver, "youtube")
+            driver.get(search_url)
+            loaded = self.readiness.wait(driver, "youtube")
+            
+            # 결과가 부족하면 스크롤로 추가 영상을 불러오고 개수가 늘어날 때까지만 대기
+            if loaded < config.YOUTUBE_MAX_RESULTS:
+                driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
+                self.readiness.wait(driver, "youtube", min_count=loaded + 1, timeout=config.YOUTUBE_SCROLL_WAIT_TIMEOUT)
+            
+            # 렌더링된 DOM 스냅샷 한 번만 가져와서 브라우저 밖에서 파싱
+            html = driver.page_source
+            self.network_monitor.record("youtube", read_page_stats(driver))
+        
+        # 드라이버를 반납한 뒤 파서 프로세스에서 파싱
+        videos = self.parse_pipeline.submit(
+            "youtube", html, keyword, limit=config.YOUTUBE_MAX_RESULTS, backend=config.HTML_PARSER_BACKEND
+        ).result()
+        if videos:
+            self.response_cache.put(search_url, "youtube", html, variant="rendered")
+        logger.info(f"🎬 렌더링된 페이지에서 유튜브 비디오 {len(videos)}개 추출")
+        return videos
 
     def crawl_naver_cafe_search(self, keyword):
         """네이버 카페 검색 결과 크롤링"""
@@ -619,87 +543,23 @@ class EnhancedSongdoCrawler:
             search_url = f"https://search.naver.com/search.naver?ssc=tab.cafe.all&query={encoded_keyword}&sm=tab_opt&sort=1&photo=0&field=0&pd=0&ds=&de=&mynews=0&cluster_rank=41&start=1"
             
             logger.debug(f"카페 검색 URL: {search_url}")
-            self.driver.get(search_url)
-            time.sleep(config.DELAY_BETWEEN_REQUESTS)
-            
-            # 카페 게시글 요소들 찾기
-            cafe_items = self.driver.find_elements(By.CSS_SELECTOR, ".total_wrap .api_subject_bx")
-            
-            logger.info(f"☕ 발견된 카페 게시글 수: {len(cafe_items)}개 (상위 5개 수집 예정)")
+            posts = self._crawl_paginated(
+                search_url, "cafe", keyword,
+                lambda start_rank: {"limit": config.SEARCH_PAGE_SIZE['cafe'], "backend": config.HTML_PARSER_BACKEND}
+            )
+            logger.info(f"☕ 발견된 카페 게시글 수: {len(posts)}개")
             
-            for idx, item in enumerate(cafe_items[:5]):
-                try:
-                    # 제목 추출
-                    title_element = item.find_element(By.CSS_SELECTOR, ".api_txt_lines.total_tit a")
-                    title = title_element.text.strip()
-                    link = title_element.get_attribute("href")
-                    
-                    # 카페명 추출
-                    try:
-                        cafe_element = item.find_element(By.CSS_SELECTOR, ".sub_txt a")
-                        cafe_name = cafe_element.text.strip()
-                    except:
-                        cafe_name = ""
-                    
-                    # 작성자 추출
-                    try:
-                        author_element = item.find_element(By.CSS_SELECTOR, ".sub_txt .name")
-                        author = author_element.text.strip()
-                    except:
-                        author = ""
-                    
-                    # 작성일 추출
-                    try:
-                        date_element = item.find_element(By.CSS_SELECTOR, ".sub_txt .date")
-                        date_text = date_element.text.strip()
-                        
-                        # 날짜 형식 변환
-                        if "." in date_text:
-                            # "2024.12.29" 형식
-                            date_info = date_text.replace(".", "-")
-                        elif "일 전" in date_text:
-                            days_ago = int(date_text.replace("일 전", "").strip())
-                            target_date = datetime.now() - timedelta(days=days_ago)
-                            date_info = target_date.strftime("%Y-%m-%d")
-                        else:
-                            date_info = datetime.now().strftime("%Y-%m-%d")
-                    except:
-                        date_info = datetime.now().strftime("%Y-%m-%d")
-                    
-                    # 내용 미리보기 추출
-                    try:
-                        content_element = item.find_element(By.CSS_SELECTOR, ".api_txt_lines.dsc_txt")
-                        content = content_element.text.strip()
-                    except:
-                        content = ""
-                    
-                    if not title or len(title) < 3:
-                        continue
-                    
-                    # 광고성 콘텐츠 필터링
-                    if self._is_ad_content(title):
-                        logger.debug(f"광고성 카페글 제외: {title[:30]}...")
-                        continue
-                    
-                    cafe_post = {
-                        "title": title,
-                        "content": content,
-                        "url": link,
-                        "source": cafe_name if cafe_name else "네이버카페",
-                        "author": author,
-                        "date": date_info,
-                        "keyword": keyword,
-                        "type": "cafe",
-                        "content_length": len(content) if content else 0
-                    }
-                    
-                    cafe_data.append(cafe_post)
-                    logger.debug(f"카페글 수집: {title[:50]}...")
-                    
-                except Exception as e:
-                    logger.warning(f"카페글 처리 중 오류: {str(e)}")
+            for cafe_post in posts:
+                title = cafe_post['title']
+                if not title or len(title) < 3:
                     continue
+                
+                cafe_data.append(cafe_post)
+                logger.debug(f"카페글 수집: {title[:50]}...")
             
+            # 광고/홍보 규칙 적용
+            cafe_data = self.filter_engine.filter(cafe_data, "cafe")
+            cafe_data = cafe_data[:config.MAX_ITEMS_PER_KEYWORD['cafe']]
             logger.info(f"네이버 카페 수집 완료: {len(cafe_data)}개 게시글")
             return cafe_data
             
@@ -709,19 +569,7 @@ class EnhancedSongdoCrawler:
 
     def _normalize_text(self, text):
         """텍스트 정규화 - 중복 검사를 위한 전처리"""
-        if not text:
-            return ""
-        
-        # 소문자 변환
-        text = text.lower()
-        
-        # 특수문자, 공백, 숫자 제거
-        text = re.sub(r'[^\w가-힣]', '', text)
-        
-        # 연속된 공백을 하나로
-        text = re.sub(r'\s+', '', text)
-        
-        return text
+        return normalize_text(text)
     
     def _calculate_similarity(self, text1, text2):
         """두 텍스트 간의 유사도 계산 (0~1 사이 값)"""
@@ -769,12 +617,53 @@ class EnhancedSongdoCrawler:
             logger.warning(f"중복 검사 중 오류: {str(e)}")
             return False
     
-    def remove_duplicates(self, data_list):
-        """데이터 리스트에서 중복 항목 제거"""
+    def remove_duplicates(self, data_list, method=None):
+        """데이터 리스트에서 중복 항목 제거 (method: minhash, exact, tfidf 또는 pairwise, 기본값 config.DEDUP_METHOD)"""
         try:
             if not data_list:
                 return []
             
+            # 대표 URL이 같은 항목은 유사도 비교 전에 해시 집합으로 제거
+            exact_count = len(data_list)
+            data_list = self.url_canonicalizer.deduplicate(data_list)
+            if len(data_list) < exact_count:
+                logger.debug(f"대표 URL 중복 {exact_count - len(data_list)}개 제거 (유사도 비교 전)")
+            
+            method = method or config.DEDUP_METHOD
+            if method == "tfidf" and not tfidf_dedup.is_available():
+                logger.warning("scikit-learn이 없어 TF-IDF 중복 제거 대신 정확 비교 사용")
+                method = "exact"
+            
+            if method == "tfidf":
+                dedup = tfidf_dedup.TfidfDedup()
+                unique_items = dedup.deduplicate(data_list)
+                stats = dedup.get_stats()
+                logger.info(
+                    f"중복 제거 완료 (TF-IDF): 전체 {len(data_list)}개 → 유니크 {len(unique_items)}개 "
+                    f"(제거: {len(data_list) - len(unique_items)}개, 후보 {stats['candidate_pairs']}쌍, {stats['seconds']}초)"
+                )
+                return unique_items
+            
+            if method == "minhash":
+                index = NearDuplicateIndex()
+                unique_items = index.deduplicate(data_list)
+                logger.info(
+                    f"중복 제거 완료 (MinHash LSH): 전체 {len(data_list)}개 → 유니크 {len(unique_items)}개 "
+                    f"(제거: {len(data_list) - len(unique_items)}개, 후보 비교 {index.stats['comparisons']}회)"
+                )
+                return unique_items
+            
+            if method == "exact":
+                engine = ExactDedupEngine()
+                unique_items = engine.deduplicate(data_list)
+                stats = engine.get_stats()
+                logger.info(
+                    f"중복 제거 완료 (정확 비교): 전체 {len(data_list)}개 → 유니크 {len(unique_items)}개 "
+                    f"(제거: {len(data_list) - len(unique_items)}개, 비교 {stats['pairs']}쌍 중 "
+                    f"ratio 계산 {stats['full_ratios']}회, {stats['seconds']}초)"
+                )
+                return unique_items
+            
             unique_items = []
             removed_count = 0
             
@@ -818,10 +707,7 @@ class EnhancedSongdoCrawler:
     def run_enhanced_crawl_with_platform_keywords(self):
         """플랫폼별 키워드를 사용한 개선된 크롤링 실행"""
         try:
-            if not self.create_webdriver():
-                logger.error("웹드라이버 생성 실패")
-                return False
-            
+            # 웹드라이버는 Selenium이 필요한 시점에 풀에서 생성
             all_data = []
             platform_results = {}
             
@@ -837,59 +723,31 @@ class EnhancedSongdoCrawler:
             print(f"   🎥 유튜브 키워드: {len(youtube_keywords)}개")
             print(f"   ☕ 네이버카페 키워드: {len(cafe_keywords)}개")
             
-            # 1. 뉴스 크롤링
-            print(f"\n📰 뉴스 크롤링 시작...")
-            news_data = []
-            for idx, keyword in enumerate(news_keywords, 1):
-                print(f"   [{idx}/{len(news_keywords)}] 뉴스 키워드: '{keyword}'")
-                keyword_news = self.crawl_enhanced_naver_news(keyword)
-                news_data.extend(keyword_news)
-                time.sleep(config.DELAY_BETWEEN_REQUESTS)
-            
-            print(f"   ✅ 뉴스 수집 완료: {len(news_data)}개 항목")
-            platform_results['news'] = news_data
-            
-            # 2. 블로그 크롤링  
-            print(f"\n📝 블로그 크롤링 시작...")
-            blog_data = []
-            for idx, keyword in enumerate(blog_keywords, 1):
-                print(f"   [{idx}/{len(blog_keywords)}] 블로그 키워드: '{keyword}'")
-                keyword_blog = self.crawl_naver_blog_search(keyword)
-                blog_data.extend(keyword_blog)
-                time.sleep(config.DELAY_BETWEEN_REQUESTS)
-            
-            print(f"   ✅ 블로그 수집 완료: {len(blog_data)}개 항목")
-            platform_results['blog'] = blog_data
-            
-            # 3. 유튜브 크롤링
-            print(f"\n🎥 유튜브 크롤링 시작...")
-            youtube_data = []
-            for idx, keyword in enumerate(youtube_keywords, 1):
-                print(f"   [{idx}/{len(youtube_keywords)}] 유튜브 키워드: '{keyword}'")
-                keyword_youtube = self.crawl_youtube_search(keyword)
-                youtube_data.extend(keyword_youtube)
-                time.sleep(config.DELAY_BETWEEN_REQUESTS)
-            
-            print(f"   ✅ 유튜브 수집 완료: {len(youtube_data)}개 항목")
-            platform_results['youtube'] = youtube_data
-            
-            # 4. 네이버 카페 크롤링
-            print(f"\n☕ 네이버 카페 크롤링 시작...")
-            cafe_data = []
-            for idx, keyword in enumerate(cafe_keywords, 1):
-                print(f"   [{idx}/{len(cafe_keywords)}] 카페 키워드: '{keyword}'")
-                keyword_cafe = self.crawl_naver_cafe_search(keyword)
-                cafe_data.extend(keyword_cafe)
-                time.sleep(config.DELAY_BETWEEN_REQUESTS)
-            
-            print(f"   ✅ 네이버 카페 수집 완료: {len(cafe_data)}개 항목")
-            platform_results['cafe'] = cafe_data
+            # 뉴스/블로그/유튜브/카페 키워드를 동시에 크롤링 (호스트별 속도 제한 적용)
+            print(f"\n🚀 플랫폼별 동시 크롤링 시작 (최대 {config.MAX_CONCURRENT_CRAWLS}개 작업)...")
+            orchestrator = CrawlOrchestrator(self)
+            platform_results, stage_timings = orchestrator.run({
+                'news': news_keywords,
+                'blog': blog_keywords,
+                'youtube': youtube_keywords,
+                'cafe': cafe_keywords
+            })
+            
+            print(f"   ✅ 뉴스 수집 완료: {len(platform_results['news'])}개 항목 ({stage_timings['news']}초)")
+            print(f"   ✅ 블로그 수집 완료: {len(platform_results['blog'])}개 항목 ({stage_timings['blog']}초)")
+            print(f"   ✅ 유튜브 수집 완료: {len(platform_results['youtube'])}개 항목 ({stage_timings['youtube']}초)")
+            print(f"   ✅ 네이버 카페 수집 완료: {len(platform_results['cafe'])}개 항목 ({stage_timings['cafe']}초)")
+            for platform, latency in orchestrator.latency_summary().items():
+                print(f"   ⏱️ {platform} 키워드당 소요 시간: 중앙값 {latency['median_seconds']}초, 최대 {latency['max_seconds']}초")
             
             # 플랫폼별 중복 제거
+            dedup_started = time.perf_counter()
             print(f"\n🔍 플랫폼별 중복 제거 중...")
             for platform, data in platform_results.items():
                 if data:
-                    unique_data = self.remove_duplicates(data)
+                    unique_data = self.simhash_store.annotate(self.remove_duplicates(data))
+                    if config.CROSS_RUN_DEDUP:
+                        unique_data = self.simhash_store.filter_new(unique_data)
                     removed_count = len(data) - len(unique_data)
                     platform_results[platform] = unique_data
                     print(f"   {platform}: {len(data)}개 → {len(unique_data)}개 (중복 {removed_count}개 제거)")
@@ -900,6 +758,9 @@ class EnhancedSongdoCrawler:
                 all_data.extend(platform_data)
             
             # 전체 데이터에서 최종 중복 제거 (플랫폼 간 중복)
+            if not all_data and (config.INCREMENTAL_CRAWL or config.CROSS_RUN_DEDUP):
+                print(f"\nℹ️ 증분 크롤링: 새로 수집된 항목 없음 - 저장 생략")
+            
             if all_data:
                 print(f"\n🔍 플랫폼 간 최종 중복 검사 중...")
                 initial_count = len(all_data)
@@ -908,9 +769,20 @@ class EnhancedSongdoCrawler:
                 
                 if final_removed_count > 0:
                     print(f"✅ 플랫폼 간 중복 제거 완료: {final_removed_count}개 추가 중복 제거")
+                stage_timings['dedup'] = round(time.perf_counter() - dedup_started, 2)
                 
                 # 플랫폼별로 키워드 그룹핑해서 저장
-                self._save_platform_based_data(platform_results, final_unique_data)
+                save_started = time.perf_counter()
+                run_id = self.item_store.start_run(news_keywords + blog_keywords + youtube_keywords + cafe_keywords)
+                self.item_store.upsert(final_unique_data, run_id)
+                self.item_store.finish_run(run_id)
+                self._save_platform_based_data(platform_results, final_unique_data, run_id)
+                self.seen_store.mark_seen(final_unique_data)
+                self.simhash_store.add(final_unique_data)
+                if self.parquet_archive:
+                    self.parquet_archive.append(final_unique_data)
+                stage_timings['save'] = round(time.perf_counter() - save_started, 2)
+                compaction = self.run_compaction()
                 
                 # 전체 요약 저장
                 summary_file = f"{self.data_dir}/enhanced_crawl_summary_{datetime.now(KST).strftime('%Y%m%d_%H%M%S')}.json"
@@ -937,6 +809,26 @@ class EnhancedSongdoCrawler:
                                 "items": len(platform_results['cafe'])
                             }
                         },
+                        "stage_timings": stage_timings,
+                        "rate_limit_wait_seconds": self.rate_limiter.get_stats(),
+                        "driver_pool": dict(self.driver_pool.stats),
+                        "browser_startup": self._browser_startup_summary(),
+                        "network": self.network_monitor.get_stats(),
+                        "readiness": self.readiness.get_stats(),
+                        "keyword_latency": orchestrator.latency_summary(),
+                        "response_cache": self.response_cache.get_stats(),
+                        "incremental": config.INCREMENTAL_CRAWL,
+                        "seen_store": self.seen_store.get_stats(),
+                        "cross_run_dedup": config.CROSS_RUN_DEDUP,
+                        "simhash_store": self.simhash_store.get_stats(),
+                        "url_canonical": self.url_canonicalizer.get_stats(),
+                        "item_store": self.item_store.get_stats(),
+                        "jsonl_archive": self.jsonl_archive.get_stats() if self.jsonl_archive else None,
+                        "parquet_archive": self.parquet_archive.get_stats() if self.parquet_archive else None,
+                        "compaction": compaction,
+                        "pagination": dict(self.pagination_stats),
+                        "parse_pipeline": self.parse_pipeline.get_stats(),
+                        "filter_rules": self.filter_engine.get_stats(),
                         "crawl_time": datetime.now(KST).isoformat(),
                         "summary": f"{len(final_unique_data)}개 유니크 항목이 플랫폼별 키워드로 수집됨"
                     }, f, ensure_ascii=False, indent=2)
@@ -959,28 +851,51 @@ class EnhancedSongdoCrawler:
             logger.error(f"플랫폼별 키워드 크롤링 오류: {str(e)}")
             return False
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("웹드라이버 종료")
+            self.close()
     
-    def _save_platform_based_data(self, platform_results, final_data):
-        """플랫폼별 데이터를 개별 파일로 저장"""
+    def _save_platform_based_data(self, platform_results, final_data, run_id=None):
+        """플랫폼별 데이터를 개별 파일로 저장 (항목 저장소가 있으면 이번 실행 항목을 저장소에서 내보내기)"""
         try:
             timestamp = datetime.now(KST).strftime("%Y%m%d_%H%M%S")
+            from_store = self.item_store.enabled and run_id is not None
+            
+            # JSONL 아카이브를 쓰면 실행별 플랫폼 파일 대신 수집일 세그먼트에 추가 (지난 세그먼트는 압축 봉인)
+            if self.jsonl_archive:
+                self.jsonl_archive.append(final_data)
+                self.jsonl_archive.seal()
+                logger.info(f"JSONL 아카이브 추가: {len(final_data)}개 항목")
             
             # 플랫폼별로 저장
             for platform, data in platform_results.items():
-                if data:
+                if data and not self.jsonl_archive:
                     filename = f"{self.data_dir}/enhanced_news/{platform}_enhanced_news_{timestamp}.json"
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-                    logger.info(f"{platform} 데이터 저장: {filename} ({len(data)}개 항목)")
+                    if from_store:
+                        count = self.item_store.export_json(filename, platform=platform, run_id=run_id)
+                    else:
+                        with open(filename, 'w', encoding='utf-8') as f:
+                            json.dump(data, f, ensure_ascii=False, indent=2)
+                        count = len(data)
+                    logger.info(f"{platform} 데이터 저장: {filename} ({count}개 항목)")
             
-            # 전체 통합 데이터도 저장
+            # 전체 통합 데이터도 저장 (JSONL 아카이브를 쓰면 프론트엔드용 최신 파일 하나만 공백 없이 유지)
             all_filename = f"{self.data_dir}/enhanced_news/all_platforms_enhanced_news_{timestamp}.json"
-            with open(all_filename, 'w', encoding='utf-8') as f:
-                json.dump(final_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"통합 데이터 저장: {all_filename} ({len(final_data)}개 항목)")
+            compact = self.jsonl_archive is not None
+            if from_store:
+                count = self.item_store.export_json(all_filename, compact=compact, run_id=run_id)
+            else:
+                with open(all_filename, 'w', encoding='utf-8') as f:
+                    if compact:
+                        json.dump(final_data, f, ensure_ascii=False, separators=(',', ':'))
+                    else:
+                        json.dump(final_data, f, ensure_ascii=False, indent=2)
+                count = len(final_data)
+            logger.info(f"통합 데이터 저장: {all_filename} ({count}개 항목)")
+            
+            if self.jsonl_archive:
+                # 지난 실행의 통합 파일 항목은 아카이브에 있으므로 삭제
+                for file_path in glob.glob(f"{self.data_dir}/enhanced_news/all_platforms_enhanced_news_*.json"):
+                    if file_path != all_filename:
+                        os.remove(file_path)
             
         except Exception as e:
             logger.error(f"플랫폼별 데이터 저장 오류: {str(e)}")
@@ -988,12 +903,10 @@ class EnhancedSongdoCrawler:
     def run_enhanced_crawl(self, keywords):
         """개선된 크롤링 실행"""
         try:
-            if not self.create_webdriver():
-                logger.error("웹드라이버 생성 실패")
-                return False
-            
+            # 웹드라이버는 Selenium이 필요한 시점에 풀에서 생성
             all_data = []
             total_keywords = len(keywords)
+            run_id = self.item_store.start_run(list(keywords))
             
             for idx, keyword in enumerate(keywords, 1):
                 print(f"\n🔍 [{idx}/{total_keywords}] 키워드: '{keyword}' 크롤링 중...")
@@ -1016,7 +929,9 @@ class EnhancedSongdoCrawler:
                 if combined_data:
                     # 키워드별 중복 제거
                     print(f"   🔍 중복 검사 중...")
-                    unique_data = self.remove_duplicates(combined_data)
+                    unique_data = self.simhash_store.annotate(self.remove_duplicates(combined_data))
+                    if config.CROSS_RUN_DEDUP:
+                        unique_data = self.simhash_store.filter_new(unique_data)
                     
                     # 키워드별 파일 저장
                     self.save_enhanced_data(unique_data, keyword)
@@ -1029,9 +944,6 @@ class EnhancedSongdoCrawler:
                         print(f"   ✅ 총 {len(unique_data)}개 항목 수집 완료 (뉴스: {len(news_data)}, 블로그: {len(blog_data)}, 유튜브: {len(youtube_data)})")
                 else:
                     print(f"   ⚠️ 수집된 데이터 없음")
-                
-                # 요청 간 대기
-                time.sleep(config.DELAY_BETWEEN_REQUESTS)
             
             # 전체 데이터에서 최종 중복 제거
             if all_data:
@@ -1056,6 +968,14 @@ class EnhancedSongdoCrawler:
                 
                 # all_data를 최종 중복 제거된 데이터로 업데이트
                 all_data = final_unique_data
+                self.seen_store.mark_seen(all_data)
+                self.simhash_store.add(all_data)
+                if self.parquet_archive:
+                    self.parquet_archive.append(all_data)
+                # 실행 전체 항목을 한 번에 저장해 실행 내 수집 순서 유지
+                self.item_store.upsert(all_data, run_id)
+                self.item_store.finish_run(run_id)
+                self.run_compaction()
             
             logger.info(f"전체 개선된 크롤링 완료: {len(all_data)}개 유니크 항목")
             
@@ -1068,9 +988,43 @@ class EnhancedSongdoCrawler:
             logger.error(f"개선된 크롤링 실행 오류: {str(e)}")
             return False
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("웹드라이버 종료")
+            self.close()
+
+    def run_compaction(self):
+        """지난 실행별 파일 롤업 병합 및 보존 기간 적용 (비활성화 또는 실패 시 None)"""
+        if not config.COMPACTION_ENABLED:
+            return None
+        try:
+            report = DataCompactor(
+                data_dir=self.data_dir,
+                deduplicate=self.remove_duplicates,
+                stores={"item_store": self.item_store, "seen_store": self.seen_store, "simhash_store": self.simhash_store},
+                archives={
+                    name: archive for name, archive in
+                    (("jsonl_archive", self.jsonl_archive), ("parquet_archive", self.parquet_archive)) if archive
+                }
+            ).run()
+            if report.get("load_speedup"):
+                print(f"🗜️ 데이터 압축: {report['reclaimed_bytes']:,}바이트 회수, 전체 파일 로드 {report['load_speedup']}배 빨라짐")
+            return report
+        except Exception as e:
+            logger.error(f"데이터 압축 오류: {str(e)}")
+            return None
+
+    def close(self):
+        """웹드라이버 및 HTTP 세션 정리"""
+        self.driver_pool.close()
+        logger.info("웹드라이버 종료")
+        if self.http_fetcher:
+            self.http_fetcher.close()
+        self.seen_store.close()
+        self.simhash_store.close()
+        self.item_store.close()
+        if self.jsonl_archive:
+            self.jsonl_archive.close()
+        if self.parquet_archive:
+            self.parquet_archive.close()
+        self.parse_pipeline.close()
 
     def sync_to_frontend(self):
         """크롤링 완료 후 프론트엔드로 데이터 동기화"""
@@ -180,9 +180,29 @@ class SongdoScheduler:
             schedule.every().day.at(time_str).do(self.run_with_retry)
             self.logger.info(f"📅 스케줄 등록: 매일 {time_str}")
     
+    def start_browser_daemon(self):
+        """브라우저 데몬 시작 (CRAWLER_BROWSER_DAEMON=true인 경우) - 실행마다 Chrome 기동 시간 절약"""
+        import config
+        if not config.BROWSER_DAEMON_ENABLED:
+            return False
+        
+        from browser_daemon import start_daemon
+        if start_daemon():
+            self.logger.info("🌐 브라우저 데몬 실행 중 - 크롤러가 기존 Chrome 세션에 연결합니다")
+            return True
+        self.logger.warning("브라우저 데몬 시작 실패 - 크롤러가 매번 Chrome을 새로 실행합니다")
+        return False
+    
+    def stop_browser_daemon(self):
+        """브라우저 데몬 종료"""
+        from browser_daemon import stop_daemon
+        stop_daemon()
+        self.logger.info("🌐 브라우저 데몬 종료")
+    
     def run_daemon(self):
         """데몬 모드로 실행"""
         self.logger.info("🤖 스케줄러 데몬 모드 시작")
+        browser_daemon_started = self.start_browser_daemon()
         self.schedule_jobs()
         
         try:
@@ -194,6 +214,9 @@ class SongdoScheduler:
             self.logger.info("🛑 스케줄러 중지됨")
         except Exception as e:
             self.logger.error(f"스케줄러 오류: {e}")
+        finally:
+            if browser_daemon_started:
+                self.stop_browser_daemon()
     
     def run_now(self):
         """즉시 실행"""
@@ -0,0 +1,124 @@
+"""
+검색 결과 페이지 수집기 (fetcher)
+가벼운 HTTP 세션으로 먼저 가져오고, 결과 컨테이너가 없으면 Selenium으로 대체
+"""
+
+import re
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from loguru import logger
+import config
+from network_profiles import apply_network_profile, read_page_stats
+from readiness import ReadinessWaiter
+
+
+def _selector_to_pattern(selector):
+    """'div.news_area' 형식의 단순 CSS 선택자를 HTML 검사용 정규식으로 변환"""
+    tag, _, class_name = selector.partition('.')
+    class_name = class_name.split('.')[0]
+    return re.compile(
+        rf'<{tag or "[a-z0-9]+"}\b[^>]*class="[^"]*\b{re.escape(class_name)}\b',
+        re.IGNORECASE
+    )
+
+
+def has_result_containers(html, platform):
+    """HTML에 플랫폼별 검색 결과 컨테이너가 하나라도 있는지 확인"""
+    if not html:
+        return False
+
+    selectors = config.RESULT_CONTAINER_SELECTORS.get(platform, [])
+    if not selectors:
+        return True
+
+    return any(_selector_to_pattern(selector).search(html) for selector in selectors)
+
+
+class HttpFetcher:
+    """requests.Session 기반 수집기 (keep-alive, gzip, 커넥션 풀)"""
+
+    name = "http"
+
+    def __init__(self, pool_size=None, timeout=None):
+        self.timeout = timeout or config.HTTP_TIMEOUT
+        pool_size = pool_size or config.HTTP_POOL_SIZE
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Accept-Encoding에 gzip을 명시하면 requests가 응답을 자동으로 풀어줌
+        self.session.headers.update(config.HTTP_HEADERS)
+
+    def fetch(self, url):
+        """URL의 HTML 반환 (실패 시 None)"""
+        response = self.fetch_response(url)
+        return response.text if response is not None else None
+
+    def fetch_response(self, url, headers=None):
+        """URL 응답 객체 반환 - 조건부 요청 헤더 지원, 304도 그대로 반환 (실패 시 None)"""
+        try:
+            started = time.perf_counter()
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+            elapsed = time.perf_counter() - started
+            logger.debug(f"HTTP 수집 완료 ({response.status_code}, {elapsed:.2f}초, {len(response.content)} bytes): {url}")
+            return response
+        except Exception as e:
+            logger.warning(f"HTTP 수집 실패: {url} - {str(e)}")
+            return None
+
+    def post_json(self, url, payload):
+        """JSON 본문으로 POST 요청 후 JSON 응답 반환 (실패 시 None)"""
+        try:
+            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.warning(f"HTTP JSON 요청 실패: {url} - {str(e)}")
+            return None
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
+
+
+class SeleniumFetcher:
+    """Selenium 웹드라이버 기반 수집기 (자바스크립트 렌더링이 필요한 경우)"""
+
+    name = "selenium"
+
+    def __init__(self, driver_pool, network_monitor=None, readiness=None):
+        # driver_pool: 대여/반납 방식으로 웹드라이버를 제공하는 WebDriverPool
+        # network_monitor: 페이지별 네트워크 통계를 누적할 NetworkMonitor (선택)
+        # readiness: 결과 컨테이너가 준비될 때까지 대기하는 ReadinessWaiter (없으면 새로 생성)
+        self.driver_pool = driver_pool
+        self.network_monitor = network_monitor
+        self.readiness = readiness or ReadinessWaiter()
+
+    def fetch(self, url, platform=None):
+        """URL을 브라우저로 열고 렌더링된 HTML 반환 - 플랫폼별 네트워크 차단 프로필 적용 (실패 시 None)"""
+        try:
+            with self.driver_pool.checkout() as driver:
+                apply_network_profile(driver, platform)
+                driver.get(url)
+                self.readiness.wait(driver, platform)
+                html = driver.page_source
+                if self.network_monitor:
+                    self.network_monitor.record(platform, read_page_stats(driver))
+                return html
+        except Exception as e:
+            logger.warning(f"Selenium 수집 실패: {url} - {str(e)}")
+            return None
+
+    def close(self):
+        """웹드라이버 풀은 크롤러가 관리하므로 별도 정리 없음"""
+        pass
@@ -0,0 +1,231 @@
+"""
+광고/홍보/제외 규칙 필터 엔진
+규칙 파일의 제목/본문/URL 패턴을 필드별 Aho-Corasick 오토마톤 하나로 컴파일해
+규칙 수와 관계없이 텍스트 길이에 비례하는 비용으로 검사 (규칙 파일이 바뀌면 자동으로 다시 로드)
+"""
+
+import os
+import json
+import time
+import threading
+from collections import deque
+from loguru import logger
+import config
+
+FIELDS = ("title", "content", "url")
+
+# 규칙 파일을 읽지 못할 때 사용하는 기본 규칙 (규칙 파일 도입 전 코드에 있던 플랫폼별 광고 필터)
+DEFAULT_RULES = [
+    {
+        "id": "naver_promotion_title",
+        "field": "title",
+        "platforms": ["news", "cafe"],
+        "patterns": [
+            "언론사 선정", "언론사가 선정한", "네이버 메인에서", "구독하세요", "클립 크리에이터",
+            "피드형 콘텐츠", "창작자도 지원", "Ready, Set, Clip", "주요기사 혹은 심층기획",
+        ],
+    },
+    {
+        "id": "blog_promotion_title",
+        "field": "title",
+        "platforms": ["blog"],
+        "patterns": [
+            "언론사 선정", "클립 크리에이터", "피드형 콘텐츠", "창작자도 지원", "네이버 클립",
+            "Ready, Set, Clip", "신청 기간", "크리에이터라면",
+        ],
+    },
+    {
+        "id": "news_ad_url",
+        "field": "url",
+        "platforms": ["news"],
+        "patterns": [
+            "static/channelPromotion", "mkt.naver.com", "promotion", "ad.naver.com",
+            "shopping.naver.com", "channelPromotion.html", "atrb?channel_id",
+        ],
+    },
+    {
+        "id": "blog_ad_url",
+        "field": "url",
+        "platforms": ["blog"],
+        "patterns": ["mkt.naver.com", "news.naver.com/main/static/", "channelPromotion.html", "atrb?channel_id"],
+    },
+]
+
+
+class AhoCorasick:
+    """여러 문자열 패턴을 한 번의 텍스트 순회로 찾는 오토마톤"""
+
+    def __init__(self, patterns):
+        # patterns: [(패턴 문자열, 값)] - 값은 패턴이 발견되면 반환할 규칙 번호
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+
+        for pattern, value in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                    self.goto[state][char] = next_state
+                state = next_state
+            self.output[state].add(value)
+
+        # 너비 우선으로 실패 링크 계산 (실패 상태의 출력도 합쳐 둠)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] |= self.output[self.fail[next_state]]
+
+    def search(self, text):
+        """텍스트에 포함된 패턴들의 값 집합"""
+        found = set()
+        state = 0
+        goto, fail, output = self.goto, self.fail, self.output
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class FilterEngine:
+    """규칙 파일 기반 항목 필터 (스레드 안전, 규칙별 적중 횟수 기록)"""
+
+    def __init__(self, rules_path=None, reload_interval=None):
+        self.rules_path = rules_path or config.FILTER_RULES_FILE
+        # 상대 경로는 실행 위치가 아니라 이 모듈 위치 기준
+        if not os.path.isabs(self.rules_path):
+            self.rules_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), self.rules_path)
+        self.reload_interval = config.FILTER_RULES_RELOAD_INTERVAL if reload_interval is None else reload_interval
+        self.lock = threading.Lock()
+        self.rules = []
+        self.automata = {}
+        self.mtime = None
+        self.loaded = False
+        self.checked_at = 0.0
+        self.stats = {"checked": 0, "excluded": 0, "reloads": 0}
+        self.hits = {}
+        self._load()
+
+    def _read_rules(self):
+        """규칙 파일 읽기"""
+        with open(self.rules_path, 'r', encoding='utf-8') as f:
+            rules = json.load(f).get("rules", [])
+
+        for rule in rules:
+            if rule.get("field") not in FIELDS:
+                raise ValueError(f"규칙 '{rule.get('id')}'의 field는 {FIELDS} 중 하나여야 합니다")
+        return rules
+
+    def _load(self):
+        """규칙 파일을 읽어 필드별 오토마톤 컴파일 (실패 시 기존 규칙 유지, 처음 로드라면 기본 규칙 사용)"""
+        mtime = None
+        try:
+            mtime = os.path.getmtime(self.rules_path)
+            rules = self._read_rules()
+        except Exception as e:
+            if self.loaded:
+                logger.warning(f"필터 규칙 로드 실패 - 기존 규칙 유지: {self.rules_path} - {str(e)}")
+                return False
+            # 필터가 모두 꺼진 채로 수집하지 않도록 기본 규칙 사용
+            logger.warning(f"필터 규칙 로드 실패 - 기본 규칙 사용: {self.rules_path} - {str(e)}")
+            rules = [dict(rule) for rule in DEFAULT_RULES]
+
+        automata = {}
+        for field in FIELDS:
+            patterns = [
+                (pattern, index)
+                for index, rule in enumerate(rules) if rule["field"] == field
+                for pattern in rule.get("patterns", [])
+            ]
+            if patterns:
+                automata[field] = AhoCorasick(patterns)
+
+        with self.lock:
+            reloaded = self.loaded
+            self.loaded = True
+            self.rules = rules
+            self.automata = automata
+            self.mtime = mtime
+            for rule in rules:
+                self.hits.setdefault(rule["id"], 0)
+            if reloaded:
+                self.stats["reloads"] += 1
+
+        pattern_count = sum(len(rule.get("patterns", [])) for rule in rules)
+        logger.info(f"필터 규칙 {'다시 ' if reloaded else ''}로드: 규칙 {len(rules)}개, 패턴 {pattern_count}개")
+        return True
+
+    def _reload_if_changed(self):
+        """규칙 파일 수정 시각을 reload_interval 간격으로 확인해 바뀌었으면 다시 로드"""
+        now = time.monotonic()
+        if now - self.checked_at < self.reload_interval:
+            return
+        self.checked_at = now
+        try:
+            if os.path.getmtime(self.rules_path) != self.mtime:
+                self._load()
+        except OSError:
+            pass
+
+    def _field_text(self, item, field):
+        if field == "content":
+            return item.get('content') or item.get('summary') or ""
+        return item.get(field) or ""
+
+    def match(self, item, platform):
+        """항목에 적용되는 규칙 중 적중한 규칙 id 목록 (규칙 파일 순서)"""
+        with self.lock:
+            rules, automata = self.rules, self.automata
+
+        matched = set()
+        for field, automaton in automata.items():
+            text = self._field_text(item, field)
+            if text:
+                matched |= automaton.search(text)
+
+        return [
+            rules[index]["id"] for index in sorted(matched)
+            if not rules[index].get("platforms") or platform in rules[index]["platforms"]
+        ]
+
+    def filter(self, items, platform):
+        """규칙에 걸린 항목을 제외한 목록 반환"""
+        self._reload_if_changed()
+
+        kept = []
+        excluded = 0
+        for item in items:
+            rule_ids = self.match(item, platform)
+            if rule_ids:
+                excluded += 1
+                with self.lock:
+                    for rule_id in rule_ids:
+                        self.hits[rule_id] = self.hits.get(rule_id, 0) + 1
+                logger.debug(f"필터 규칙 {rule_ids} 적중 - {platform} 제외: {item.get('title', '')[:50]}...")
+                continue
+            kept.append(item)
+
+        with self.lock:
+            self.stats["checked"] += len(items)
+            self.stats["excluded"] += excluded
+        return kept
+
+    def get_stats(self):
+        """검사/제외 수와 규칙별 적중 횟수"""
+        with self.lock:
+            return {**self.stats, "rules": len(self.rules), "hits": dict(self.hits)}
@@ -0,0 +1,87 @@
+"""
+HTML 파서 백엔드
+BeautifulSoup(html.parser / lxml)과 selectolax를 같은 인터페이스로 사용하기 위한 어댑터
+"""
+
+from bs4 import BeautifulSoup
+
+# lxml이 설치되어 있으면 더 빠른 lxml 파서 사용
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# selectolax는 선택 의존성 (없으면 해당 백엔드만 사용 불가)
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+SOUP_BACKENDS = ("html.parser", "lxml")
+
+
+def available_backends():
+    """현재 환경에서 사용 가능한 백엔드 이름 목록"""
+    backends = ["html.parser"]
+    if HTML_PARSER == "lxml":
+        backends.append("lxml")
+    if SelectolaxParser is not None:
+        backends.append("selectolax")
+    return backends
+
+
+class SelectolaxNode:
+    """selectolax 노드를 파서가 사용하는 BeautifulSoup API 일부로 감싼 어댑터"""
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector):
+        node = self.node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get_text(self, strip=False):
+        # BeautifulSoup get_text(strip=True)와 동일하게 텍스트 노드별로 공백 제거 후 연결
+        return self.node.text(deep=True, separator="", strip=strip)
+
+    def get(self, name, default=None):
+        value = self.node.attributes.get(name)
+        return default if value is None else value
+
+    def has_attr(self, name):
+        return name in self.node.attributes
+
+    def __getitem__(self, name):
+        value = self.node.attributes.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def find_parent(self, name):
+        parent = self.node.parent
+        while parent is not None:
+            if parent.tag == name:
+                return SelectolaxNode(parent)
+            parent = parent.parent
+        return None
+
+
+def make_document(html, backend=None):
+    """HTML 문자열을 지정한 백엔드의 문서 객체로 변환 (기본: lxml 또는 html.parser)"""
+    backend = backend or HTML_PARSER
+    if backend == "selectolax":
+        if SelectolaxParser is None:
+            raise ImportError("selectolax 백엔드를 사용하려면 selectolax 패키지를 설치하세요")
+        return SelectolaxNode(SelectolaxParser(html or "").root)
+    if backend not in SOUP_BACKENDS:
+        raise ValueError(f"지원하지 않는 HTML 파서 백엔드: {backend}")
+    return BeautifulSoup(html or "", backend)
@@ -0,0 +1,340 @@
+"""
+수집 항목 저장소 (item store)
+실행마다 타임스탬프 JSON 파일을 새로 쓰는 대신 대표 URL 기준으로 SQLite에 upsert하고
+플랫폼/키워드/날짜/크롤링 실행별 인덱스로 조회 (JSON 파일은 프론트엔드용 내보내기 형식)
+
+사용법 (crawler 디렉토리에서):
+    python item_store.py import                       # 기존 enhanced_news JSON 파일 가져오기
+    python item_store.py query --platform blog --days 7 --limit 50
+    python item_store.py export ../data/export.json --run latest
+"""
+
+import os
+import sys
+import json
+import glob
+import sqlite3
+import argparse
+import threading
+from datetime import date, datetime, timedelta, timezone
+from loguru import logger
+import config
+from url_canonical import canonical_url, url_hash
+from dedup_engine import item_date_ordinal
+
+# 한국시간 타임존 설정
+KST = timezone(timedelta(hours=9))
+
+ITEM_COLUMNS = "url_key, url_hash, url, platform, keyword, title, date, run_position, first_run, last_run, first_seen, last_seen, data"
+
+
+def _item_date(item):
+    ordinal = item_date_ordinal(item)
+    return date.fromordinal(ordinal).isoformat() if ordinal else None
+
+
+class ItemStore:
+    """대표 URL 단위 항목 저장소 - 플랫폼/키워드/날짜/실행 인덱스 조회 (스레드 안전)"""
+
+    def __init__(self, db_path=None, enabled=None):
+        self.enabled = config.ITEM_STORE_ENABLED if enabled is None else enabled
+        self.db_path = db_path or config.ITEM_STORE_PATH
+        self.lock = threading.Lock()
+        self.stats = {"runs": 0, "upserted": 0, "inserted": 0, "exported_files": 0}
+        self.conn = self._connect() if self.enabled else None
+
+    def _connect(self):
+        """DB 연결 및 테이블/인덱스 생성 (실패 시 저장소 비활성화)"""
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_runs (
+                    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    keywords TEXT,
+                    item_count INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    url_key TEXT PRIMARY KEY,
+                    url_hash TEXT,
+                    url TEXT,
+                    platform TEXT,
+                    keyword TEXT,
+                    title TEXT,
+                    date TEXT,
+                    run_position INTEGER,
+                    first_run INTEGER,
+                    last_run INTEGER,
+                    first_seen TEXT,
+                    last_seen TEXT,
+                    data TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_items_platform_date ON items(platform, date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_items_keyword_date ON items(keyword, date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_items_date ON items(date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_items_last_run ON items(last_run, run_position)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_items_url_hash ON items(url_hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_items_platform_last_seen ON items(platform, last_seen)")
+            conn.commit()
+            return conn
+        except Exception as e:
+            logger.warning(f"항목 저장소 열기 실패 - 비활성화: {str(e)}")
+            self.enabled = False
+            return None
+
+    def start_run(self, keywords=None):
+        """크롤링 실행 기록 시작 - run_id 반환 (비활성화 시 None)"""
+        if not self.enabled:
+            return None
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT INTO crawl_runs (started_at, keywords) VALUES (?, ?)",
+                (datetime.now(KST).isoformat(), json.dumps(keywords or [], ensure_ascii=False))
+            )
+            self.conn.commit()
+            self.stats["runs"] += 1
+            return cursor.lastrowid
+
+    def finish_run(self, run_id):
+        """크롤링 실행 종료 시각과 항목 수 기록"""
+        if not self.enabled or run_id is None:
+            return
+        with self.lock:
+            self.conn.execute("""
+                UPDATE crawl_runs SET finished_at = ?,
+                    item_count = (SELECT COUNT(*) FROM items WHERE last_run = ?)
+                WHERE run_id = ?
+            """, (datetime.now(KST).isoformat(), run_id, run_id))
+            self.conn.commit()
+
+    def latest_run_id(self):
+        """항목이 기록된 가장 최근 실행 id"""
+        if not self.enabled:
+            return None
+        with self.lock:
+            row = self.conn.execute("SELECT MAX(last_run) FROM items").fetchone()
+        return row[0] if row else None
+
+    def upsert(self, items, run_id=None):
+        """항목 저장 - 대표 URL이 이미 있으면 내용과 마지막 실행/수집 시각 갱신 (처음 실행/수집 시각 유지)"""
+        if not self.enabled or not items:
+            return 0
+
+        now = datetime.now(KST).isoformat()
+        rows = []
+        for position, item in enumerate(items):
+            url_key = canonical_url(item.get('url', ''))
+            if not url_key:
+                continue
+            rows.append((
+                url_key, item.get('url_hash') or url_hash(item['url']), item.get('url'),
+                item.get('type', ''), item.get('keyword', ''), item.get('title', ''), _item_date(item),
+                position, run_id, run_id, now, now, json.dumps(item, ensure_ascii=False)
+            ))
+
+        try:
+            with self.lock:
+                if run_id is not None:
+                    # 같은 실행에서 나눠 저장해도 수집 순서가 이어지도록 이번 실행의 마지막 위치 다음부터 번호 부여
+                    offset = self.conn.execute(
+                        "SELECT COALESCE(MAX(run_position) + 1, 0) FROM items WHERE last_run = ?", (run_id,)
+                    ).fetchone()[0]
+                    rows = [row[:7] + (row[7] + offset,) + row[8:] for row in rows]
+                before = self.conn.total_changes
+                count_before = self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+                self.conn.executemany(f"""
+                    INSERT INTO items ({ITEM_COLUMNS}) VALUES ({",".join("?" * 13)})
+                    ON CONFLICT(url_key) DO UPDATE SET
+                        url = excluded.url,
+                        keyword = excluded.keyword,
+                        title = excluded.title,
+                        date = excluded.date,
+                        run_position = excluded.run_position,
+                        last_run = COALESCE(excluded.last_run, last_run),
+                        last_seen = excluded.last_seen,
+                        data = excluded.data
+                """, rows)
+                self.conn.commit()
+                count_after = self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+                self.stats["upserted"] += self.conn.total_changes - before
+                self.stats["inserted"] += count_after - count_before
+            return len(rows)
+        except Exception as e:
+            logger.error(f"항목 저장소 기록 실패: {str(e)}")
+            return 0
+
+    def query(self, platform=None, keyword=None, since=None, until=None, seen_since=None, seen_until=None,
+              run_id=None, limit=None, newest_first=True):
+        """조건에 맞는 항목 목록 (since/until: 게시일 'YYYY-MM-DD', seen_since/seen_until: 마지막 수집 시각 ISO 범위 [since, until), run_id: 해당 실행 항목을 수집 순서대로)"""
+        if not self.enabled:
+            return []
+
+        conditions, params = [], []
+        for column, value in (("platform", platform), ("keyword", keyword), ("last_run", run_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            conditions.append("date >= ?")
+            params.append(since)
+        if until:
+            conditions.append("date <= ?")
+            params.append(until)
+        if seen_since:
+            conditions.append("last_seen >= ?")
+            params.append(seen_since)
+        if seen_until:
+            conditions.append("last_seen < ?")
+            params.append(seen_until)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        if run_id is not None:
+            order = "ORDER BY run_position"
+        else:
+            order = f"ORDER BY date {'DESC' if newest_first else 'ASC'}, last_seen {'DESC' if newest_first else 'ASC'}"
+        sql = f"SELECT data FROM items {where} {order}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def delete(self, items):
+        """항목 삭제 (대표 URL 기준) - 삭제한 항목 수 반환"""
+        if not self.enabled or not items:
+            return 0
+        keys = [(canonical_url(item.get('url', '')),) for item in items]
+        with self.lock:
+            before = self.conn.total_changes
+            self.conn.executemany("DELETE FROM items WHERE url_key = ?", keys)
+            self.conn.commit()
+            return self.conn.total_changes - before
+
+    def latest(self, platform=None, limit=50, days=7):
+        """최근 days일 동안의 최신 항목 limit개"""
+        since = (datetime.now(KST).date() - timedelta(days=days)).isoformat()
+        return self.query(platform=platform, since=since, limit=limit)
+
+    def keywords(self):
+        """저장된 검색 키워드 목록"""
+        if not self.enabled:
+            return []
+        with self.lock:
+            return [row[0] for row in self.conn.execute("SELECT DISTINCT keyword FROM items WHERE keyword != '' ORDER BY keyword")]
+
+    def export_json(self, path, compact=False, **filters):
+        """조회 결과를 JSON 배열 파일로 내보내기 (프론트엔드/기존 도구 호환 형식, compact: 공백 없이) - 내보낸 항목 수 반환"""
+        items = self.query(**filters)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(items, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(items, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        with self.lock:
+            self.stats["exported_files"] += 1
+        return len(items)
+
+    def import_json_files(self, paths):
+        """기존 JSON 파일을 파일 하나가 실행 하나인 것처럼 순서대로 가져오기 - 가져온 항목 수 반환"""
+        total = 0
+        for file_path in paths:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.warning(f"항목 가져오기 실패 ({os.path.basename(file_path)}): {str(e)}")
+                continue
+            run_id = self.start_run([os.path.basename(file_path).split('_enhanced_news_')[0]])
+            total += self.upsert(data, run_id)
+            self.finish_run(run_id)
+        return total
+
+    def purge(self, before):
+        """마지막 수집 시각이 before(ISO 시각)보다 이전인 항목 삭제 - 삭제한 항목 수 반환"""
+        if not self.enabled:
+            return 0
+        try:
+            with self.lock:
+                cursor = self.conn.execute("DELETE FROM items WHERE last_seen < ?", (before,))
+                self.conn.commit()
+                if cursor.rowcount:
+                    # 삭제 후 테이블/인덱스 다시 쓰기 (파일 크기 회수)
+                    self.conn.execute("VACUUM")
+                return cursor.rowcount
+        except Exception as e:
+            logger.warning(f"항목 저장소 정리 실패: {str(e)}")
+            return 0
+
+    def get_stats(self):
+        """기록/내보내기 통계와 저장된 항목 수"""
+        stats = dict(self.stats)
+        if self.enabled:
+            with self.lock:
+                stats["entries"] = self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        return stats
+
+    def close(self):
+        """DB 연결 종료"""
+        if self.conn:
+            with self.lock:
+                self.conn.close()
+                self.conn = None
+            self.enabled = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수집 항목 저장소')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('import', help='기존 enhanced_news JSON 파일 가져오기')
+
+    query_parser = subparsers.add_parser('query', help='항목 조회')
+    query_parser.add_argument('--platform', choices=['news', 'blog', 'youtube', 'cafe'])
+    query_parser.add_argument('--keyword')
+    query_parser.add_argument('--days', type=int, default=7)
+    query_parser.add_argument('--limit', type=int, default=50)
+
+    export_parser = subparsers.add_parser('export', help='JSON 파일로 내보내기')
+    export_parser.add_argument('path')
+    export_parser.add_argument('--platform', choices=['news', 'blog', 'youtube', 'cafe'])
+    export_parser.add_argument('--run', help="실행 id 또는 'latest'")
+
+    args = parser.parse_args()
+    store = ItemStore(enabled=True)
+    try:
+        if args.command == 'import':
+            files = sorted(
+                glob.glob(f"{config.DATA_DIR}/enhanced_news/*_enhanced_news_*.json"),
+                key=lambda path: path.rsplit('_enhanced_news_', 1)[1]
+            )
+            print(f"📥 기존 JSON 파일 {len(files)}개 가져오는 중...")
+            count = store.import_json_files(files)
+            print(f"✅ {count}개 항목 기록 - 저장소 항목 수: {store.get_stats()['entries']}개")
+        elif args.command == 'query':
+            since = (datetime.now(KST).date() - timedelta(days=args.days)).isoformat()
+            items = store.query(platform=args.platform, keyword=args.keyword, since=since, limit=args.limit)
+            for item in items:
+                print(f"[{item.get('type', '')}] {item.get('date', '')} {item.get('title', '')[:60]}")
+            print(f"📊 {len(items)}개 항목")
+        else:
+            run_id = store.latest_run_id() if args.run == 'latest' else (int(args.run) if args.run else None)
+            count = store.export_json(args.path, platform=args.platform, run_id=run_id)
+            print(f"✅ {count}개 항목 내보내기: {args.path}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
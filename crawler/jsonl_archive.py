@@ -0,0 +1,375 @@
+"""
+날짜별 JSONL 아카이브
+실행마다 들여쓰기한 JSON 배열 파일을 새로 쓰는 대신 수집일별 세그먼트에 항목을 한 줄씩 추가하고,
+지난 날짜의 세그먼트는 블록 단위로 압축해 봉인 (기본 gzip, JSONL_ARCHIVE_COMPRESSION=zstd이고 zstandard가 있으면 zstd)
+
+세그먼트마다 항목 ID(url_hash)별 바이트 위치를 담은 색인 파일(.idx)을 두어,
+mmap으로 필요한 줄(봉인된 세그먼트는 해당 압축 블록 하나)만 읽고 전체를 풀지 않아도 항목 하나를 조회
+
+사용법 (crawler 디렉토리에서):
+    python jsonl_archive.py import          # 기존 enhanced_news JSON 파일을 아카이브로 가져오기
+    python jsonl_archive.py seal            # 오늘 이전 세그먼트 압축
+    python jsonl_archive.py get <url_hash>  # 항목 하나 조회
+    python jsonl_archive.py stats
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import gzip
+import mmap
+import zlib
+import threading
+from datetime import datetime, timedelta, timezone
+from loguru import logger
+import config
+from url_canonical import url_hash
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 한국시간 타임존 설정
+KST = timezone(timedelta(hours=9))
+
+SEGMENT_PATTERN = re.compile(r'^items_(\d{8})\.jsonl(\.gz|\.zst)?$')
+
+
+def _codec():
+    """봉인할 때 사용할 압축 형식의 확장자"""
+    if config.JSONL_ARCHIVE_COMPRESSION == "zstd" and zstandard is not None:
+        return ".zst"
+    return ".gz"
+
+
+def _compress(data, suffix):
+    if suffix == ".zst":
+        return zstandard.ZstdCompressor(level=config.JSONL_ARCHIVE_COMPRESSION_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=config.JSONL_ARCHIVE_COMPRESSION_LEVEL, mtime=0)
+
+
+def _decompress(data, suffix):
+    if suffix == ".zst":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data, wbits=31)
+
+
+def _item_id(item):
+    return item.get('url_hash') or url_hash(item.get('url', ''))
+
+
+def _item_day(item, default_day=None):
+    """항목의 수집일 (YYYYMMDD, crawled_at이 없으면 default_day 또는 오늘)"""
+    crawled_at = item.get('crawled_at', '')
+    if re.match(r'^\d{4}-\d{2}-\d{2}', crawled_at):
+        return crawled_at[:10].replace('-', '')
+    return default_day or datetime.now(KST).strftime('%Y%m%d')
+
+
+def _iter_index(index_path):
+    """색인 파일의 (항목 ID, 위치 정보 튜플)을 기록 순서대로 반환"""
+    if not os.path.exists(index_path):
+        return
+    with open(index_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) >= 3:
+                yield fields[0], tuple(int(value) for value in fields[1:])
+
+
+def _read_index(index_path):
+    """색인 파일 읽기 - {항목 ID: 위치 정보 튜플} (같은 ID는 나중 줄이 우선)"""
+    return dict(_iter_index(index_path))
+
+
+class JsonlArchive:
+    """수집일별 JSONL 세그먼트 아카이브 (추가 전용, 지난 세그먼트 압축 봉인, 항목 ID 색인 조회, 스레드 안전)"""
+
+    def __init__(self, directory=None, block_bytes=None):
+        self.directory = directory or config.JSONL_ARCHIVE_DIR
+        self.block_bytes = block_bytes or config.JSONL_ARCHIVE_BLOCK_BYTES
+        self.lock = threading.Lock()
+        self.stats = {"appended": 0, "sealed_segments": 0, "bytes_before_seal": 0, "bytes_after_seal": 0, "lookups": 0}
+        self._locations = None
+        self._maps = {}
+        os.makedirs(self.directory, exist_ok=True)
+        if config.JSONL_ARCHIVE_COMPRESSION == "zstd" and zstandard is None:
+            logger.warning("zstandard가 설치되어 있지 않아 JSONL 아카이브를 gzip으로 압축합니다")
+
+    def _segment_path(self, day, suffix=""):
+        return os.path.join(self.directory, f"items_{day}.jsonl{suffix}")
+
+    def segments(self):
+        """세그먼트 (날짜, 경로, 확장자) 목록 - 날짜순, 같은 날짜는 봉인된 세그먼트가 먼저"""
+        result = []
+        for path in glob.glob(os.path.join(self.directory, "items_*.jsonl*")):
+            match = SEGMENT_PATTERN.match(os.path.basename(path))
+            if match:
+                result.append((match.group(1), path, match.group(2) or ""))
+        return sorted(result, key=lambda segment: (segment[0], segment[2] == ""))
+
+    def append(self, items, default_day=None):
+        """항목을 수집일 세그먼트 끝에 한 줄씩 추가하고 색인 기록"""
+        if not items:
+            return 0
+
+        by_day = {}
+        for item in items:
+            by_day.setdefault(_item_day(item, default_day), []).append(item)
+
+        with self.lock:
+            for day, day_items in sorted(by_day.items()):
+                path = self._segment_path(day)
+                index_lines = []
+                with open(path, 'ab') as f:
+                    offset = f.tell()
+                    for item in day_items:
+                        line = (json.dumps(item, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+                        f.write(line)
+                        item_id = _item_id(item)
+                        index_lines.append(f"{item_id}\t{offset}\t{len(line)}\n")
+                        if self._locations is not None:
+                            self._locations[item_id] = (path, "", (offset, len(line)))
+                        offset += len(line)
+                with open(f"{path}.idx", 'a', encoding='utf-8') as f:
+                    f.writelines(index_lines)
+            self.stats["appended"] += len(items)
+        return len(items)
+
+    def seal(self, before_day=None):
+        """before_day(기본: 오늘) 이전의 열린 세그먼트를 블록 단위로 압축해 봉인 - 봉인한 세그먼트 수 반환"""
+        before_day = before_day or datetime.now(KST).strftime('%Y%m%d')
+        sealed = 0
+        with self.lock:
+            for day, path, suffix in self.segments():
+                if suffix or day >= before_day:
+                    continue
+                try:
+                    self._seal_segment(day, path)
+                    sealed += 1
+                except Exception as e:
+                    logger.error(f"JSONL 세그먼트 봉인 실패 ({os.path.basename(path)}): {str(e)}")
+        return sealed
+
+    def _seal_segment(self, day, path):
+        """열린 세그먼트를 압축 블록으로 기존 봉인 세그먼트 뒤에 이어 붙이고 (임시 파일 후 교체) 원본 삭제
+        같은 날 여러 실행에서 다시 수집된 항목은 마지막 줄만 남김 (색인 조회 결과와 같음)"""
+        existing = [segment for segment in self.segments() if segment[0] == day and segment[2]]
+        suffix = existing[0][2] if existing else _codec()
+        sealed_path = self._segment_path(day, suffix)
+        raw_index = _read_index(f"{path}.idx")
+        ids_by_offset = {offset: item_id for item_id, (offset, _) in raw_index.items()}
+
+        tmp_path, tmp_index_path = f"{sealed_path}.tmp", f"{sealed_path}.idx.tmp"
+        with open(tmp_path, 'wb') as out, open(tmp_index_path, 'w', encoding='utf-8') as index_out:
+            if existing:
+                with open(sealed_path, 'rb') as f:
+                    out.write(f.read())
+                with open(f"{sealed_path}.idx", 'r', encoding='utf-8') as f:
+                    index_out.write(f.read())
+
+            def flush(block, entries):
+                block_offset = out.tell()
+                compressed = _compress(b"".join(block), suffix)
+                out.write(compressed)
+                for item_id, line_offset, line_length in entries:
+                    index_out.write(f"{item_id}\t{block_offset}\t{len(compressed)}\t{line_offset}\t{line_length}\n")
+
+            block, entries, block_size, offset = [], [], 0, 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    item_id = ids_by_offset.get(offset)
+                    offset += len(line)
+                    if item_id is None:
+                        continue
+                    entries.append((item_id, block_size, len(line)))
+                    block.append(line)
+                    block_size += len(line)
+                    if block_size >= self.block_bytes:
+                        flush(block, entries)
+                        block, entries, block_size = [], [], 0
+            if block:
+                flush(block, entries)
+            out.flush()
+            os.fsync(out.fileno())
+
+        raw_bytes = os.path.getsize(path)
+        previous_bytes = os.path.getsize(sealed_path) if existing else 0
+        self._close_map(sealed_path)
+        os.replace(tmp_path, sealed_path)
+        os.replace(tmp_index_path, f"{sealed_path}.idx")
+        os.remove(path)
+        os.remove(f"{path}.idx")
+
+        self._locations = None
+        self.stats["sealed_segments"] += 1
+        self.stats["bytes_before_seal"] += raw_bytes
+        self.stats["bytes_after_seal"] += os.path.getsize(sealed_path) - previous_bytes
+
+    def _close_map(self, path):
+        mapped = self._maps.pop(path, None)
+        if mapped:
+            mapped[0].close()
+            mapped[1].close()
+
+    def _load_locations(self):
+        """모든 색인을 날짜순으로 읽어 항목 ID별 최신 위치 (세그먼트, 확장자, 위치 정보)"""
+        locations = {}
+        for _, path, suffix in self.segments():
+            for item_id, entry in _read_index(f"{path}.idx").items():
+                locations[item_id] = (path, suffix, entry)
+        return locations
+
+    def _map(self, path):
+        """봉인된(변하지 않는) 세그먼트의 mmap (열어 둔 채 재사용)"""
+        if path not in self._maps:
+            f = open(path, 'rb')
+            self._maps[path] = (f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return self._maps[path][1]
+
+    def get(self, item_id):
+        """항목 ID로 항목 하나 조회 (없으면 None) - 해당 줄 또는 압축 블록 하나만 읽음"""
+        with self.lock:
+            if self._locations is None:
+                self._locations = self._load_locations()
+            location = self._locations.get(item_id)
+            self.stats["lookups"] += 1
+            if location is None:
+                return None
+
+            path, suffix, entry = location
+            try:
+                if suffix:
+                    block_offset, block_length, line_offset, line_length = entry
+                    mapped = self._map(path)
+                    block = _decompress(mapped[block_offset:block_offset + block_length], suffix)
+                    line = block[line_offset:line_offset + line_length]
+                else:
+                    # 열린 세그먼트는 계속 늘어나므로 조회할 때마다 새로 매핑
+                    offset, length = entry
+                    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        line = mapped[offset:offset + length]
+                return json.loads(line)
+            except Exception as e:
+                logger.warning(f"JSONL 아카이브 항목 조회 실패 ({item_id}): {str(e)}")
+                return None
+
+    def iter_items(self, since_day=None):
+        """세그먼트 순서대로 항목을 하나씩 반환 (since_day: 'YYYYMMDD' 이후 세그먼트만) - get()과 같이 항목 ID별 최신 위치의 줄만, 봉인된 세그먼트는 블록 단위로 풀기"""
+        with self.lock:
+            if self._locations is None:
+                self._locations = self._load_locations()
+            locations = dict(self._locations)
+
+        for day, path, suffix in self.segments():
+            if since_day and day < since_day:
+                continue
+            # 다시 수집되어 뒤에 새로 기록된 항목의 이전 줄은 건너뜀
+            entries = sorted(entry for item_id, entry in _iter_index(f"{path}.idx")
+                             if locations.get(item_id) == (path, suffix, entry))
+            if not suffix:
+                with open(path, 'rb') as f:
+                    for offset, length in entries:
+                        f.seek(offset)
+                        yield json.loads(f.read(length))
+                continue
+
+            with open(path, 'rb') as f:
+                block_key, block = None, None
+                for block_offset, block_length, line_offset, line_length in entries:
+                    if block_key != (block_offset, block_length):
+                        block_key = (block_offset, block_length)
+                        f.seek(block_offset)
+                        block = _decompress(f.read(block_length), suffix)
+                    yield json.loads(block[line_offset:line_offset + line_length])
+
+    def compact(self, before_day):
+        """데이터 압축 작업용 - before_day 이전 세그먼트 봉인"""
+        return self.seal(before_day)
+
+    def drop_before(self, before_day):
+        """before_day('YYYYMMDD') 이전 날짜의 세그먼트와 색인 삭제 - 삭제한 세그먼트 수 반환"""
+        dropped = 0
+        with self.lock:
+            for day, path, _ in self.segments():
+                if day >= before_day:
+                    continue
+                self._close_map(path)
+                for file_path in (path, f"{path}.idx"):
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
+                dropped += 1
+            if dropped:
+                self._locations = None
+        return dropped
+
+    def disk_usage(self):
+        """아카이브 디렉토리 전체 크기 (바이트, 색인 포함)"""
+        return sum(os.path.getsize(path) for path in glob.glob(os.path.join(self.directory, "*")) if os.path.isfile(path))
+
+    def get_stats(self):
+        """추가/봉인/조회 통계와 세그먼트 수, 디스크 사용량"""
+        with self.lock:
+            stats = dict(self.stats)
+        stats["segments"] = len(self.segments())
+        stats["disk_bytes"] = self.disk_usage()
+        return stats
+
+    def close(self):
+        """열어 둔 mmap 정리"""
+        with self.lock:
+            for path in list(self._maps):
+                self._close_map(path)
+
+
+def import_from_archive(archive):
+    """기존 enhanced_news 파일 항목을 파일명 시간순으로 아카이브에 추가하고 지난 세그먼트 봉인 - 처리한 파일 수 반환"""
+    files = sorted(
+        glob.glob(f"{config.DATA_DIR}/enhanced_news/*_enhanced_news_*.json"),
+        key=lambda path: path.rsplit('_enhanced_news_', 1)[1]
+    )
+    for file_path in files:
+        timestamp = file_path.rsplit('_enhanced_news_', 1)[1]
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                archive.append(json.load(f), default_day=timestamp[:8])
+        except Exception as e:
+            logger.warning(f"JSONL 아카이브 가져오기 실패 ({os.path.basename(file_path)}): {str(e)}")
+    archive.seal()
+    return len(files)
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ("import", "seal", "get", "stats"):
+        print(__doc__)
+        return 1
+
+    archive = JsonlArchive()
+    try:
+        command = sys.argv[1]
+        if command == "import":
+            source_bytes = sum(os.path.getsize(path) for path in glob.glob(f"{config.DATA_DIR}/enhanced_news/*.json"))
+            print("📥 기존 enhanced_news 파일을 JSONL 아카이브로 가져오는 중...")
+            file_count = import_from_archive(archive)
+            archive_bytes = archive.disk_usage()
+            print(f"✅ 파일 {file_count}개 처리 - 세그먼트 {len(archive.segments())}개")
+            print(f"   💾 JSON 파일 {source_bytes:,}바이트 → 아카이브 {archive_bytes:,}바이트 ({source_bytes / max(archive_bytes, 1):.1f}배 감소)")
+        elif command == "seal":
+            print(f"🔒 봉인한 세그먼트: {archive.seal()}개")
+        elif command == "get":
+            item = archive.get(sys.argv[2]) if len(sys.argv) > 2 else None
+            print(json.dumps(item, ensure_ascii=False, indent=2) if item else "❌ 항목을 찾을 수 없습니다.")
+        else:
+            print(json.dumps(archive.get_stats(), ensure_ascii=False, indent=2))
+    finally:
+        archive.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
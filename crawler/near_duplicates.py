@@ -0,0 +1,188 @@
+"""
+근사 중복 인덱스
+정규화한 제목의 문자 shingle로 MinHash 서명을 만들고 LSH 밴딩으로 후보만 추려서
+모든 항목 쌍을 SequenceMatcher로 비교하던 O(n²) 중복 제거를 대체 (기준: URL 일치, 제목 0.8, 제목 0.6 + 내용 0.7)
+"""
+
+import re
+import zlib
+import difflib
+from collections import defaultdict
+import config
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+UINT64_MASK = (1 << 64) - 1
+
+
+def normalize_text(text):
+    """중복 검사용 정규화 - 소문자 변환 후 한글/영문/숫자 외 문자와 공백 제거"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'[^\w가-힣]', '', text)
+    return re.sub(r'\s+', '', text)
+
+
+def sequence_similarity(norm_text1, norm_text2):
+    """정규화된 두 텍스트의 SequenceMatcher 유사도 (비어 있으면 0)"""
+    if not norm_text1 or not norm_text2:
+        return 0.0
+    return difflib.SequenceMatcher(None, norm_text1, norm_text2).ratio()
+
+
+def item_content(item):
+    """내용 비교에 쓰는 텍스트 (summary 우선, 없으면 content)"""
+    return item.get('summary', '') or item.get('content', '')
+
+
+class MinHasher:
+    """문자 shingle 집합의 MinHash 서명 생성 (numpy가 없으면 순수 파이썬으로 같은 값 계산)"""
+
+    def __init__(self, num_perm=None, shingle_size=None, seed=1):
+        self.num_perm = num_perm or config.DEDUP_MINHASH_PERMUTATIONS
+        self.shingle_size = shingle_size or config.DEDUP_SHINGLE_SIZE
+
+        # 실행마다 같은 서명이 나오도록 고정 시드의 선형 해시 계수 사용
+        state = seed
+        self.a, self.b = [], []
+        for _ in range(self.num_perm):
+            state = (state * 6364136223846793005 + 1442695040888963407) & UINT64_MASK
+            self.a.append((state >> 3) % (MERSENNE_PRIME - 1) + 1)
+            state = (state * 6364136223846793005 + 1442695040888963407) & UINT64_MASK
+            self.b.append((state >> 3) % MERSENNE_PRIME)
+        if np is not None:
+            self.a_array = np.array(self.a, dtype=np.uint64)
+            self.b_array = np.array(self.b, dtype=np.uint64)
+
+    def shingles(self, norm_text):
+        """정규화된 텍스트의 문자 n-gram 집합 (한글은 음절 단위라 짧은 n이 적합)"""
+        size = self.shingle_size
+        if len(norm_text) <= size:
+            return {norm_text} if norm_text else set()
+        return {norm_text[i:i + size] for i in range(len(norm_text) - size + 1)}
+
+    def signature(self, norm_text):
+        """MinHash 서명 (shingle이 없으면 None)"""
+        shingles = self.shingles(norm_text)
+        if not shingles:
+            return None
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+
+        if np is not None:
+            values = np.array(hashes, dtype=np.uint64)[:, None]
+            # uint64 곱셈의 wrap-around는 순수 파이썬 경로에서 같은 방식으로 재현
+            permuted = ((values * self.a_array + self.b_array) % np.uint64(MERSENNE_PRIME)) & np.uint64(MAX_HASH)
+            return tuple(int(value) for value in permuted.min(axis=0))
+
+        return tuple(
+            min(((((value * a) & UINT64_MASK) + b) & UINT64_MASK) % MERSENNE_PRIME & MAX_HASH for value in hashes)
+            for a, b in zip(self.a, self.b)
+        )
+
+
+def estimate_jaccard(signature1, signature2):
+    """두 MinHash 서명이 일치하는 비율 (Jaccard 유사도 추정치)"""
+    if not signature1 or not signature2:
+        return 0.0
+    return sum(1 for x, y in zip(signature1, signature2) if x == y) / len(signature1)
+
+
+class NearDuplicateIndex:
+    """남긴 항목들의 URL/제목 LSH 인덱스 - 새 항목과 중복인 기존 항목을 후보 비교만으로 찾음"""
+
+    def __init__(self, bands=None, verify=None, title_threshold=0.8, content_threshold=0.7, title_floor=0.6, hasher=None):
+        self.hasher = hasher or MinHasher()
+        self.bands = bands or config.DEDUP_LSH_BANDS
+        self.rows = self.hasher.num_perm // self.bands
+        self.verify = config.DEDUP_MINHASH_VERIFY if verify is None else verify
+        self.title_threshold = title_threshold
+        self.content_threshold = content_threshold
+        self.title_floor = title_floor
+
+        self.urls = set()
+        self.records = []
+        self.buckets = [defaultdict(list) for _ in range(self.bands)]
+        self.stats = {"items": 0, "url_matches": 0, "candidates": 0, "comparisons": 0, "near_duplicates": 0}
+
+    def _record(self, item):
+        norm_title = normalize_text(item.get('title', ''))
+        return {
+            "title": norm_title,
+            "content": normalize_text(item_content(item)),
+            "signature": self.hasher.signature(norm_title),
+            "content_signature": None,
+        }
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [tuple(signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def _content_similarity(self, record, other):
+        if self.verify:
+            return sequence_similarity(record["content"], other["content"])
+        for target in (record, other):
+            if target["content_signature"] is None and target["content"]:
+                target["content_signature"] = self.hasher.signature(target["content"])
+        return estimate_jaccard(record["content_signature"], other["content_signature"])
+
+    def _is_match(self, record, other):
+        """후보 쌍 판정 - verify면 SequenceMatcher, 아니면 MinHash 추정치에 같은 기준 적용"""
+        self.stats["comparisons"] += 1
+        if self.verify:
+            title_similarity = sequence_similarity(record["title"], other["title"])
+        else:
+            title_similarity = estimate_jaccard(record["signature"], other["signature"])
+
+        if title_similarity >= self.title_threshold:
+            return True
+        return title_similarity >= self.title_floor and self._content_similarity(record, other) >= self.content_threshold
+
+    def find_duplicate(self, item):
+        """이미 인덱스에 있는 항목 중 중복 후보를 찾아 (중복 여부, 새 항목 레코드) 반환"""
+        url = item.get('url')
+        record = self._record(item)
+        if url and url in self.urls:
+            self.stats["url_matches"] += 1
+            return True, record
+        if record["signature"] is None:
+            return False, record
+
+        # 밴드가 하나라도 같은 기존 항목만 후보로 - 먼저 남긴 항목부터 비교
+        candidates = set()
+        for band, key in enumerate(self._band_keys(record["signature"])):
+            candidates.update(self.buckets[band].get(key, ()))
+        self.stats["candidates"] += len(candidates)
+
+        for index in sorted(candidates):
+            if self._is_match(record, self.records[index]):
+                self.stats["near_duplicates"] += 1
+                return True, record
+        return False, record
+
+    def add(self, item, record=None):
+        """항목을 인덱스에 추가"""
+        record = record or self._record(item)
+        index = len(self.records)
+        self.records.append(record)
+        self.stats["items"] += 1
+        if item.get('url'):
+            self.urls.add(item['url'])
+        if record["signature"] is not None:
+            for band, key in enumerate(self._band_keys(record["signature"])):
+                self.buckets[band][key].append(index)
+
+    def deduplicate(self, items):
+        """입력 순서대로 앞서 남긴 항목과 중복인 항목을 제외한 목록"""
+        unique_items = []
+        for item in items:
+            is_duplicate, record = self.find_duplicate(item)
+            if not is_duplicate:
+                self.add(item, record)
+                unique_items.append(item)
+        return unique_items
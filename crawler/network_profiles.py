@@ -0,0 +1,117 @@
+"""
+Chrome 네트워크 프로필
+플랫폼별로 파싱에 쓰지 않는 리소스(이미지/폰트/미디어/광고·추적 스크립트)를 DevTools Protocol로 차단하고
+페이지별 요청/차단/전송량 통계를 수집 (전송량은 Network.loadingFinished의 encodedDataLength 합계)
+차단된 요청은 내려받지 않으므로 그 바이트는 잴 수 없음 - 통계는 차단을 꺼도 수집해 켜고 끈 실행의 페이지당 전송량으로 절약량을 비교
+"""
+
+import json
+import threading
+from loguru import logger
+import config
+
+
+def configure_options(options):
+    """웹드라이버 옵션에 페이지 로드 전략과 네트워크 통계용 성능 로그 설정 추가"""
+    options.page_load_strategy = config.PAGE_LOAD_STRATEGY
+    if config.NETWORK_STATS_ENABLED:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def blocked_patterns(platform):
+    """플랫폼 프로필의 차단 URL 패턴 목록"""
+    profile = config.NETWORK_BLOCK_PROFILES.get(platform, {})
+    patterns = []
+    for resource_type in profile.get("resource_types", []):
+        patterns.extend(config.BLOCKED_RESOURCE_PATTERNS.get(resource_type, []))
+    patterns.extend(profile.get("url_patterns", []))
+    return patterns
+
+
+def apply_network_profile(driver, platform):
+    """다음 페이지 이동 전에 플랫폼별 차단 패턴 적용 (세션을 플랫폼 간에 공유하므로 매번 설정, 차단을 끄면 빈 목록)"""
+    if not (config.NETWORK_BLOCKING_ENABLED or config.NETWORK_STATS_ENABLED):
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        patterns = blocked_patterns(platform) if config.NETWORK_BLOCKING_ENABLED else []
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        if config.NETWORK_STATS_ENABLED:
+            # 이전 페이지의 성능 로그 비우기
+            driver.get_log("performance")
+    except Exception as e:
+        logger.debug(f"네트워크 프로필 적용 실패 ({platform}): {str(e)}")
+
+
+def seed_consent_cookies(driver):
+    """유튜브 쿠키 동의 화면이 뜨지 않도록 동의 쿠키를 미리 설정"""
+    try:
+        for cookie in config.YOUTUBE_CONSENT_COOKIES:
+            driver.execute_cdp_cmd("Network.setCookie", {"path": "/", "secure": True, **cookie})
+    except Exception as e:
+        logger.debug(f"유튜브 동의 쿠키 설정 실패: {str(e)}")
+
+
+def read_page_stats(driver):
+    """마지막 페이지 이동 이후 성능 로그에서 요청 수, 차단 수, 실제 전송 바이트 집계 (수집 불가 시 None)"""
+    if not config.NETWORK_STATS_ENABLED:
+        return None
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+
+    stats = {"requests": 0, "blocked_requests": 0, "transferred_bytes": 0}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            stats["requests"] += 1
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            stats["blocked_requests"] += 1
+        elif method == "Network.loadingFinished":
+            stats["transferred_bytes"] += int(params.get("encodedDataLength", 0))
+    return stats
+
+
+class NetworkMonitor:
+    """플랫폼별 페이지 네트워크 통계 누적 (스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def record(self, platform, page_stats):
+        """페이지 하나의 통계 누적"""
+        if not page_stats:
+            return
+        with self.lock:
+            totals = self.stats.setdefault(
+                platform, {"pages": 0, "requests": 0, "blocked_requests": 0, "transferred_bytes": 0}
+            )
+            totals["pages"] += 1
+            for key, value in page_stats.items():
+                totals[key] += value
+        logger.debug(
+            f"{platform} 페이지 네트워크: 요청 {page_stats['requests']}개, "
+            f"차단 {page_stats['blocked_requests']}개, 전송 {page_stats['transferred_bytes']} bytes"
+        )
+
+    def get_stats(self):
+        """플랫폼별 누적 통계와 페이지당 평균"""
+        with self.lock:
+            result = {}
+            for platform, totals in self.stats.items():
+                pages = totals["pages"] or 1
+                result[platform] = {
+                    **totals,
+                    "blocking_enabled": config.NETWORK_BLOCKING_ENABLED,
+                    "blocked_per_page": round(totals["blocked_requests"] / pages, 1),
+                    "bytes_per_page": totals["transferred_bytes"] // pages,
+                }
+            return result
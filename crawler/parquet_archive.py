@@ -0,0 +1,261 @@
+"""
+분석용 Parquet 데이터셋
+수집 항목을 플랫폼/수집일로 파티션한 Parquet 데이터셋(platform=.../crawl_date=.../part-*.parquet)에 추가하고,
+분석기는 필요한 컬럼과 파티션만 읽어 JSON 파일 전체를 다시 파싱하지 않도록 함 (pyarrow 필요)
+keyword/press/type/section/channel/cafe_name 컬럼은 사전 인코딩, 날짜/숫자 컬럼은 타입을 지정해 저장
+항목은 url_hash 기준으로 한 번만 기록 (다시 수집된 항목은 건너뛰고, 파티션 병합 시에도 중복 제거)
+
+사용법 (crawler 디렉토리에서):
+    python parquet_archive.py    # 기존 enhanced_news JSON 파일을 데이터셋으로 변환
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import time
+import threading
+from datetime import date, datetime, timedelta, timezone
+from loguru import logger
+import config
+from url_canonical import url_hash
+from dedup_engine import item_date_ordinal
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# 한국시간 타임존 설정
+KST = timezone(timedelta(hours=9))
+
+PARTITION_PATTERN = re.compile(r'^crawl_date=(\d{4}-\d{2}-\d{2})$')
+DICTIONARY_COLUMNS = ["keyword", "press", "type", "section", "channel", "cafe_name"]
+STRING_COLUMNS = ["url_hash", "url", "title", "summary", "content", "content_preview", "source", "views", "upload_time", "thumbnail", "simhash"]
+
+
+def is_available():
+    """pyarrow 설치 여부"""
+    return pa is not None
+
+
+def _schema():
+    fields = [(name, pa.string()) for name in STRING_COLUMNS]
+    fields += [(name, pa.dictionary(pa.int32(), pa.string())) for name in DICTIONARY_COLUMNS]
+    fields += [
+        ("date", pa.date32()),
+        ("crawled_at", pa.timestamp('s')),
+        ("search_rank", pa.int32()),
+        ("content_length", pa.int32()),
+    ]
+    return pa.schema(fields)
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([("platform", pa.string()), ("crawl_date", pa.string())]), flavor="hive")
+
+
+def _dataset(directory):
+    """데이터셋 열기 - 스키마를 지정해 컬럼이 추가되기 전에 쓴 파일의 없는 컬럼은 null로 읽음"""
+    partitioning = _partitioning()
+    schema = pa.unify_schemas([_schema(), partitioning.schema])
+    return ds.dataset(directory, format="parquet", partitioning=partitioning, schema=schema)
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _crawled_at(item):
+    try:
+        return datetime.fromisoformat(item.get('crawled_at', '')).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        return None
+
+
+def _dedup_table(table):
+    """url_hash가 같은 행은 마지막 행만 남김 (순서 유지)"""
+    last = {value: index for index, value in enumerate(table.column("url_hash").to_pylist())}
+    return table if len(last) == table.num_rows else table.take(sorted(last.values()))
+
+
+def _row(item):
+    """항목을 스키마 컬럼 값으로 변환 (스키마에 없는 필드는 제외)"""
+    row = {name: item.get(name) if isinstance(item.get(name), str) else None for name in STRING_COLUMNS + DICTIONARY_COLUMNS}
+    row["url_hash"] = item.get('url_hash') or url_hash(item.get('url', ''))
+    ordinal = item_date_ordinal(item)
+    row["date"] = date.fromordinal(ordinal) if ordinal else None
+    row["crawled_at"] = _crawled_at(item)
+    row["search_rank"] = _int(item.get('search_rank'))
+    row["content_length"] = _int(item.get('content_length'))
+    return row
+
+
+class ParquetArchive:
+    """플랫폼/수집일 파티션 Parquet 데이터셋 (실행마다 파티션별 파일 추가, url_hash당 한 행, 스레드 안전)"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or config.PARQUET_ARCHIVE_DIR
+        self.enabled = is_available()
+        self.lock = threading.Lock()
+        self.known_hashes = None
+        self.stats = {"appended": 0, "skipped_known": 0, "files_written": 0, "partitions_merged": 0}
+
+    def _load_known_hashes(self):
+        """데이터셋에 이미 있는 url_hash 집합 (처음 한 번만 url_hash 컬럼을 읽음)"""
+        if self.known_hashes is None:
+            self.known_hashes = set()
+            if os.path.isdir(self.directory):
+                dataset = _dataset(self.directory)
+                self.known_hashes.update(dataset.to_table(columns=["url_hash"]).column("url_hash").to_pylist())
+        return self.known_hashes
+
+    def append(self, items, crawl_time=None):
+        """데이터셋에 없는 항목만 (플랫폼, 수집일) 파티션별 새 파일로 추가 - 추가한 항목 수 반환"""
+        if not self.enabled or not items:
+            return 0
+
+        crawl_time = crawl_time or datetime.now(KST).replace(tzinfo=None)
+        schema = _schema()
+        stamp = crawl_time.strftime('%Y%m%d_%H%M%S')
+        try:
+            with self.lock:
+                known = self._load_known_hashes()
+                groups = {}
+                appended = 0
+                for item in items:
+                    row = _row(item)
+                    if row["url_hash"] in known:
+                        self.stats["skipped_known"] += 1
+                        continue
+                    known.add(row["url_hash"])
+                    crawled_at = _crawled_at(item) or crawl_time
+                    groups.setdefault((item.get('type') or 'unknown', crawled_at.strftime('%Y-%m-%d')), []).append(row)
+                    appended += 1
+
+                for (platform, crawl_date), rows in sorted(groups.items()):
+                    partition_dir = os.path.join(self.directory, f"platform={platform}", f"crawl_date={crawl_date}")
+                    os.makedirs(partition_dir, exist_ok=True)
+                    path = os.path.join(partition_dir, f"part-{stamp}-{len(os.listdir(partition_dir)):03d}.parquet")
+                    table = pa.Table.from_pylist(rows, schema=schema)
+                    pq.write_table(table, f"{path}.tmp", compression="zstd", use_dictionary=DICTIONARY_COLUMNS)
+                    os.replace(f"{path}.tmp", path)
+                    self.stats["files_written"] += 1
+                self.stats["appended"] += appended
+            return appended
+        except Exception as e:
+            logger.error(f"Parquet 데이터셋 기록 실패: {str(e)}")
+            # 기록하지 못한 항목이 건너뛰어지지 않도록 다음 추가 때 다시 읽음
+            self.known_hashes = None
+            return 0
+
+    def read(self, columns=None, platforms=None, since=None, until=None):
+        """필요한 컬럼/파티션만 읽은 pandas DataFrame (since/until: 'YYYY-MM-DD' 수집일, 데이터가 없으면 None)"""
+        if not self.enabled or not os.path.isdir(self.directory):
+            return None
+
+        dataset = _dataset(self.directory)
+        if columns is not None:
+            columns = [name for name in columns if name in dataset.schema.names]
+
+        conditions = []
+        if platforms:
+            conditions.append(ds.field("platform").isin(list(platforms)))
+        if since:
+            conditions.append(ds.field("crawl_date") >= since)
+        if until:
+            conditions.append(ds.field("crawl_date") <= until)
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        table = dataset.to_table(columns=columns, filter=expression)
+        return table.to_pandas() if table.num_rows else None
+
+    def drop_before(self, before_day):
+        """before_day('YYYYMMDD')보다 이전 수집일 파티션 삭제 - 삭제한 파티션 수 반환"""
+        if not os.path.isdir(self.directory):
+            return 0
+        before = f"{before_day[:4]}-{before_day[4:6]}-{before_day[6:8]}"
+        dropped = 0
+        with self.lock:
+            for partition_dir in glob.glob(os.path.join(self.directory, "platform=*", "crawl_date=*")):
+                match = PARTITION_PATTERN.match(os.path.basename(partition_dir))
+                if match and match.group(1) < before:
+                    for path in glob.glob(os.path.join(partition_dir, "*")):
+                        os.remove(path)
+                    os.rmdir(partition_dir)
+                    dropped += 1
+            if dropped:
+                # 삭제한 항목이 다시 수집되면 새로 기록하도록 다음 추가 때 다시 읽음
+                self.known_hashes = None
+        return dropped
+
+    def compact(self, before_day):
+        """before_day('YYYYMMDD')보다 이전 수집일 파티션의 실행별 파일을 url_hash 중복 없이 하나로 병합 - 병합한 파티션 수 반환"""
+        if not self.enabled or not os.path.isdir(self.directory):
+            return 0
+        before = f"{before_day[:4]}-{before_day[4:6]}-{before_day[6:8]}"
+        merged = 0
+        with self.lock:
+            for partition_dir in sorted(glob.glob(os.path.join(self.directory, "platform=*", "crawl_date=*"))):
+                match = PARTITION_PATTERN.match(os.path.basename(partition_dir))
+                paths = sorted(glob.glob(os.path.join(partition_dir, "part-*.parquet")))
+                if not match or match.group(1) >= before or len(paths) < 2:
+                    continue
+                try:
+                    table = _dedup_table(pa.concat_tables([pq.read_table(path, schema=_schema()) for path in paths]))
+                    target = os.path.join(partition_dir, "part-merged.parquet")
+                    pq.write_table(table, f"{target}.tmp", compression="zstd", use_dictionary=DICTIONARY_COLUMNS)
+                    os.replace(f"{target}.tmp", target)
+                    for path in paths:
+                        if path != target:
+                            os.remove(path)
+                    merged += 1
+                except Exception as e:
+                    logger.error(f"Parquet 파티션 병합 실패 ({partition_dir}): {str(e)}")
+            self.stats["partitions_merged"] += merged
+        return merged
+
+    def get_stats(self):
+        """추가한 항목/파일 수, 병합한 파티션 수"""
+        with self.lock:
+            return dict(self.stats)
+
+    def close(self):
+        """정리할 자원 없음 (다른 저장소와 같은 인터페이스)"""
+
+
+def import_from_archive(archive):
+    """기존 enhanced_news 파일 항목을 파일명의 실행 시각을 수집 시각으로 데이터셋에 추가 - 처리한 파일 수 반환"""
+    files = sorted(glob.glob(f"{config.DATA_DIR}/enhanced_news/*_enhanced_news_*.json"))
+    for file_path in files:
+        match = re.search(r'_enhanced_news_(\d{8}_\d{6})', os.path.basename(file_path))
+        crawl_time = datetime.strptime(match.group(1), '%Y%m%d_%H%M%S') if match else None
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                archive.append(json.load(f), crawl_time)
+        except Exception as e:
+            logger.warning(f"Parquet 데이터셋 가져오기 실패 ({os.path.basename(file_path)}): {str(e)}")
+    return len(files)
+
+
+if __name__ == "__main__":
+    if not is_available():
+        print("❌ pyarrow가 설치되어 있지 않습니다.")
+        sys.exit(1)
+    print("📦 기존 enhanced_news 파일을 Parquet 데이터셋으로 변환 중...")
+    parquet_archive = ParquetArchive()
+    file_count = import_from_archive(parquet_archive)
+    parquet_archive.compact(datetime.now(KST).strftime('%Y%m%d'))
+    print(f"✅ 파일 {file_count}개 처리 - {parquet_archive.get_stats()}")
+
+    started = time.perf_counter()
+    frame = parquet_archive.read(columns=["keyword", "press", "title", "crawled_at"], platforms=["news"])
+    print(f"   ⚡ 뉴스 분석 컬럼 로드: {0 if frame is None else len(frame)}개 행, {time.perf_counter() - started:.4f}초")
@@ -0,0 +1,140 @@
+"""
+수집/파싱 파이프라인
+수집 스레드가 HTML 스냅샷을 넘기면 프로세스 풀의 파서 워커가 항목으로 변환 (브라우저 대기와 파싱을 겹쳐서 실행)
+대기 중인 스냅샷 수를 제한해 메모리 사용량을 묶어두고 단계별 처리량을 기록
+"""
+
+import time
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from loguru import logger
+import config
+import parsers
+
+
+def _parse_worker(platform, html, keyword, kwargs):
+    """워커 프로세스에서 실행 - (항목 목록, 파싱 소요 시간)"""
+    started = time.perf_counter()
+    items = parsers.PARSERS[platform](html, keyword, **kwargs)
+    return items, time.perf_counter() - started
+
+
+class ParsePipeline:
+    """HTML 스냅샷 파싱 작업 큐 (프로세스 풀, 작업 수 제한으로 backpressure 적용)"""
+
+    def __init__(self, workers=None, queue_size=None):
+        self.workers = config.PARSE_WORKERS if workers is None else workers
+        self.queue_size = queue_size or config.PARSE_QUEUE_SIZE
+        self.slots = threading.BoundedSemaphore(self.queue_size)
+        self.lock = threading.Lock()
+        self.executor = None
+        self.in_flight = 0
+        self.stats = {
+            "fetched_pages": 0,
+            "fetch_seconds": 0.0,
+            "parsed_snapshots": 0,
+            "parsed_items": 0,
+            "parse_seconds": 0.0,
+            "inline_parses": 0,
+            "backpressure_waits": 0,
+            "backpressure_seconds": 0.0,
+            "max_in_flight": 0,
+        }
+        self.started = time.perf_counter()
+
+    def _get_executor(self):
+        """프로세스 풀을 처음 필요할 때 생성 (워커 0개 또는 생성 실패 시 None - 호출 스레드에서 파싱)"""
+        if self.workers <= 0:
+            return None
+        with self.lock:
+            if self.executor is None:
+                try:
+                    self.executor = ProcessPoolExecutor(max_workers=self.workers)
+                    logger.info(f"파서 프로세스 풀 시작: 워커 {self.workers}개, 대기열 {self.queue_size}개")
+                except Exception as e:
+                    logger.warning(f"파서 프로세스 풀 생성 실패 - 현재 스레드에서 파싱: {str(e)}")
+                    self.workers = 0
+            return self.executor
+
+    def record_fetch(self, seconds):
+        """수집 단계 처리량 기록 (수집 스레드에서 호출)"""
+        with self.lock:
+            self.stats["fetched_pages"] += 1
+            self.stats["fetch_seconds"] += seconds
+
+    def submit(self, platform, html, keyword, **kwargs):
+        """스냅샷 파싱 요청 - 항목 목록을 결과로 갖는 Future 반환 (대기열이 가득 차면 자리가 날 때까지 대기)"""
+        wait_started = time.perf_counter()
+        if not self.slots.acquire(blocking=False):
+            self.slots.acquire()
+            with self.lock:
+                self.stats["backpressure_waits"] += 1
+                self.stats["backpressure_seconds"] += time.perf_counter() - wait_started
+
+        with self.lock:
+            self.in_flight += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.in_flight)
+
+        result = Future()
+        executor = self._get_executor()
+        if executor is None:
+            self._parse_inline(result, platform, html, keyword, kwargs)
+            return result
+
+        try:
+            future = executor.submit(_parse_worker, platform, html, keyword, kwargs)
+        except Exception as e:
+            logger.warning(f"파서 워커 제출 실패 - 현재 스레드에서 파싱: {str(e)}")
+            self._parse_inline(result, platform, html, keyword, kwargs)
+            return result
+
+        future.add_done_callback(lambda done: self._on_done(done, result, platform, html, keyword, kwargs))
+        return result
+
+    def _on_done(self, done, result, platform, html, keyword, kwargs):
+        """워커 결과 전달 (워커 오류 시 현재 스레드에서 다시 파싱)"""
+        try:
+            items, seconds = done.result()
+        except Exception as e:
+            logger.warning(f"파서 워커 오류 - 현재 스레드에서 다시 파싱: {str(e)}")
+            self._parse_inline(result, platform, html, keyword, kwargs)
+            return
+        self._finish(result, items, seconds)
+
+    def _parse_inline(self, result, platform, html, keyword, kwargs):
+        try:
+            items, seconds = _parse_worker(platform, html, keyword, kwargs)
+        except Exception as e:
+            logger.error(f"{platform} 스냅샷 파싱 오류: {str(e)}")
+            items, seconds = [], 0.0
+        with self.lock:
+            self.stats["inline_parses"] += 1
+        self._finish(result, items, seconds)
+
+    def _finish(self, result, items, seconds):
+        with self.lock:
+            self.in_flight -= 1
+            self.stats["parsed_snapshots"] += 1
+            self.stats["parsed_items"] += len(items)
+            self.stats["parse_seconds"] += seconds
+        self.slots.release()
+        result.set_result(items)
+
+    def get_stats(self):
+        """단계별 누적 통계와 처리량 (초당 페이지/항목)"""
+        with self.lock:
+            stats = dict(self.stats)
+        elapsed = time.perf_counter() - self.started
+        stats["workers"] = self.workers
+        stats["pages_per_second"] = round(stats["fetched_pages"] / elapsed, 2) if elapsed > 0 else 0.0
+        stats["items_per_second"] = round(stats["parsed_items"] / elapsed, 2) if elapsed > 0 else 0.0
+        for key in ("fetch_seconds", "parse_seconds", "backpressure_seconds"):
+            stats[key] = round(stats[key], 2)
+        return stats
+
+    def close(self):
+        """프로세스 풀 종료"""
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor:
+            executor.shutdown(wait=True)
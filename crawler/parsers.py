@@ -0,0 +1,414 @@
+"""
+검색 결과 HTML 파서
+페이지 HTML 스냅샷 하나에서 플랫폼별 항목을 추출하는 순수 함수 모음 (브라우저 호출 없음)
+"""
+
+import re
+import json
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, urljoin
+from html_backends import HTML_PARSER, make_document  # noqa: F401
+
+YOUTUBE_BASE_URL = "https://www.youtube.com"
+YT_INITIAL_DATA_MARKERS = ("var ytInitialData = ", 'window["ytInitialData"] = ', "ytInitialData = ")
+
+
+def make_soup(html, backend=None):
+    """HTML 문자열을 문서 객체로 변환 (backend: "html.parser", "lxml", "selectolax")"""
+    return make_document(html, backend)
+
+
+def _text(element):
+    """요소의 텍스트 (요소가 없으면 빈 문자열)"""
+    return element.get_text(strip=True) if element else ""
+
+
+def _today():
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def convert_relative_date(date_text):
+    """'N일 전', 'N시간 전' 형식을 날짜 문자열로 변환 (그 외에는 오늘 날짜)"""
+    try:
+        if "일 전" in date_text:
+            days_ago = int(date_text.replace("일 전", "").strip())
+            return (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+        if "시간 전" in date_text:
+            hours_ago = int(date_text.replace("시간 전", "").strip())
+            return (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d")
+    except Exception:
+        pass
+    return _today()
+
+
+def is_recent_video(upload_time_text):
+    """유튜브 업로드 시간이 최근인지 판단 (관대한 기준 적용)"""
+    try:
+        if not upload_time_text:
+            return True  # 시간 불명인 경우도 포함
+
+        upload_time_text = upload_time_text.lower().strip()
+
+        # 최근 영상 패턴들 (한 달 이내)
+        recent_patterns = [
+            "초 전", "분 전", "시간 전",  # 오늘
+            "일 전", "주 전", "주일 전",  # 일/주 단위
+            "하루 전", "이틀 전", "사흘 전", "나흘 전", "닷새 전", "엿새 전",  # 한글 표현
+            "일주일 전", "이주일 전", "삼주일 전", "한 달 전"  # 주/월 표현
+        ]
+
+        # 패턴 매칭
+        for pattern in recent_patterns:
+            if pattern in upload_time_text:
+                return True
+
+        # "일 전" 패턴으로 숫자 추출 (30일까지 허용)
+        day_match = re.search(r'(\d+)일 전', upload_time_text)
+        if day_match:
+            return int(day_match.group(1)) <= 30
+
+        # "주 전" 패턴 (4주까지 허용)
+        week_match = re.search(r'(\d+)주 전', upload_time_text)
+        if week_match:
+            return int(week_match.group(1)) <= 4
+
+        # 기본적으로 포함 (너무 엄격하지 않게)
+        return True
+
+    except Exception:
+        return True  # 오류 시에도 포함
+
+
+def convert_upload_time_to_date(upload_time_text):
+    """유튜브 업로드 시간을 실제 날짜로 변환"""
+    try:
+        if not upload_time_text:
+            return _today()
+
+        upload_time_text = upload_time_text.lower().strip()
+        now = datetime.now()
+
+        # 오늘 업로드
+        if any(x in upload_time_text for x in ["초 전", "분 전", "시간 전"]):
+            return now.strftime("%Y-%m-%d")
+
+        # N일 전 패턴
+        day_match = re.search(r'(\d+)일 전', upload_time_text)
+        if day_match:
+            return (now - timedelta(days=int(day_match.group(1)))).strftime("%Y-%m-%d")
+
+        # 한글 표현 처리
+        korean_days = {
+            "하루 전": 1, "이틀 전": 2, "사흘 전": 3,
+            "나흘 전": 4, "닷새 전": 5, "엿새 전": 6
+        }
+        for korean_day, days_ago in korean_days.items():
+            if korean_day in upload_time_text:
+                return (now - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+
+        # 기본값: 오늘 날짜
+        return now.strftime("%Y-%m-%d")
+
+    except Exception:
+        return _today()
+
+
+def parse_naver_news(html, keyword, limit=10, backend=None):
+    """네이버 뉴스 검색 결과 HTML에서 기사 추출 (구버전/2025-07 개편 UI 모두 대응)"""
+    soup = make_soup(html, backend)
+
+    news_areas = soup.select('div.news_area')
+
+    # 2025-07 네이버 UI 개편 대응: 헤드라인이 포함된 sds-comps 컨테이너만 사용
+    if len(news_areas) == 0:
+        candidate_areas = soup.select('div.sds-comps-vertical-layout.sds-comps-full-layout')
+        news_areas = [c for c in candidate_areas if c.select_one('span.sds-comps-text-type-headline1')]
+
+    news_data = []
+    for area in news_areas[:limit]:
+        # ----- 제목 & 링크 -----
+        title = ""
+        link = ""
+        title_link = area.select_one('a.news_tit')
+
+        if title_link:
+            title = title_link.get_text(strip=True)
+            link = title_link.get('href', '')
+        else:
+            # Fallback UI: headline span 안의 텍스트 + 부모 앵커 링크
+            title_span = area.select_one('span.sds-comps-text-type-headline1')
+            if title_span:
+                title = title_span.get_text(strip=True)
+                parent_a = title_span.find_parent('a')
+                if parent_a and parent_a.has_attr('href'):
+                    link = parent_a['href']
+
+        if not title or not link:
+            continue
+
+        # 요약문 (구버전/신버전 모두 대응)
+        summary = _text(
+            area.select_one('div.dsc_wrap') or
+            area.select_one('a.api_txt_lines.dsc_txt_wrap') or
+            area.select_one('span.sds-comps-text-type-body1')
+        )
+        if len(summary) > 200:
+            summary = summary[:200] + "..."
+
+        # 날짜 처리
+        date_elem = (
+            area.select_one('span.date') or
+            area.select_one('span.sds-comps-text-type-body2') or
+            area.select_one('span.sds-comps-profile-info-subtext span.sds-comps-text-type-body2')
+        )
+        date_info = convert_relative_date(_text(date_elem)) if date_elem else _today()
+
+        # 언론사
+        press_elem = (
+            area.select_one('a.info.press') or
+            area.select_one('span.sds-comps-profile-info-title-text')
+        )
+        press = _text(press_elem) if press_elem else urlparse(link).netloc
+
+        news_data.append({
+            "title": title,
+            "url": link,
+            "content": summary,
+            "summary": summary,
+            "press": press,
+            "date": date_info,
+            "crawled_at": _today(),
+            "content_length": len(summary),
+            "keyword": keyword,
+            "section": "검색 결과",
+            "type": "news"
+        })
+
+    return news_data
+
+
+def parse_naver_blog(html, keyword, limit=5, backend=None, start_rank=1):
+    """네이버 블로그 검색 결과 HTML에서 포스트 추출"""
+    soup = make_soup(html, backend)
+
+    blog_data = []
+    for idx, container in enumerate(soup.select("div.view_wrap")[:limit]):
+        # 제목과 링크 (mark 태그는 get_text로 제거)
+        title_element = container.select_one(".detail_box .title_area a.title_link")
+        if not title_element:
+            continue
+        title = title_element.get_text(strip=True)
+        link = title_element.get("href", "")
+
+        content = _text(container.select_one(".detail_box .dsc_area a.dsc_link"))
+        source = _text(container.select_one(".user_box_inner .user_info a.name")) or "네이버 블로그"
+
+        # "X일 전" 형식을 실제 날짜로 변환 ("시간 전" 및 기타 형식은 오늘 날짜)
+        date_text = _text(container.select_one(".user_box_inner .user_info span.sub"))
+        date_info = convert_relative_date(date_text) if "일 전" in date_text else _today()
+
+        blog_data.append({
+            "title": title,
+            "content": content,
+            "date": date_info,
+            "url": link,
+            "source": source,
+            "type": "blog",
+            "keyword": keyword,
+            "search_rank": start_rank + idx,
+            "crawled_at": _today(),
+            "press": source,  # 통일성을 위해 press 필드도 추가
+            "summary": content
+        })
+
+    return blog_data
+
+
+def parse_youtube(html, keyword, limit=7, backend=None):
+    """유튜브 검색 결과(렌더링된 DOM) HTML에서 영상 추출"""
+    soup = make_soup(html, backend)
+
+    youtube_data = []
+    for idx, item in enumerate(soup.select("div#contents ytd-video-renderer")[:limit]):
+        title_element = item.select_one("#video-title")
+        if not title_element:
+            continue
+        title = title_element.get_text(strip=True) or title_element.get("title", "").strip()
+        link = urljoin(YOUTUBE_BASE_URL, title_element.get("href", ""))
+
+        channel = _text(item.select_one("#channel-info #text a"))
+        views = _text(item.select_one("#metadata-line span:first-child"))
+        upload_time = _text(item.select_one("#metadata-line span:last-child")) or "업로드 시간 불명"
+
+        thumbnail_element = item.select_one("img")
+        thumbnail = thumbnail_element.get("src", "") if thumbnail_element else ""
+
+        youtube_data.append(build_youtube_item(
+            title, link, channel, views, upload_time, thumbnail, keyword, idx + 1
+        ))
+
+    return youtube_data
+
+
+def build_youtube_item(title, link, channel, views, upload_time, thumbnail, keyword, search_rank):
+    """유튜브 영상 항목 딕셔너리 생성"""
+    # 업로드 시간을 실제 날짜로 변환
+    actual_date = convert_upload_time_to_date(upload_time)
+    return {
+        "title": title,
+        "url": link,
+        "channel": channel,
+        "views": views,
+        "upload_time": upload_time,
+        "actual_date": actual_date,
+        "thumbnail": thumbnail,
+        "type": "youtube",
+        "keyword": keyword,
+        "search_rank": search_rank,
+        "date": actual_date,  # 실제 날짜 사용
+        "summary": f"채널: {channel} | 조회수: {views} | 업로드: {upload_time}"
+    }
+
+
+def _extract_json_after(html, marker):
+    """marker 바로 뒤에 오는 JSON 객체를 디코딩 (없으면 None)"""
+    position = html.find(marker)
+    if position < 0:
+        return None
+    start = html.find("{", position + len(marker))
+    if start < 0:
+        return None
+    try:
+        data, _ = json.JSONDecoder().raw_decode(html, start)
+        return data
+    except ValueError:
+        return None
+
+
+def extract_yt_initial_data(html):
+    """유튜브 검색 응답 HTML에 포함된 ytInitialData JSON 추출 (없으면 None)"""
+    if not html:
+        return None
+    for marker in YT_INITIAL_DATA_MARKERS:
+        data = _extract_json_after(html, marker)
+        if data is not None:
+            return data
+    return None
+
+
+def extract_innertube_config(html):
+    """continuation 요청에 필요한 InnerTube API 키와 클라이언트 버전 추출"""
+    api_key = re.search(r'"INNERTUBE_API_KEY"\s*:\s*"([^"]+)"', html or "")
+    client_version = re.search(r'"INNERTUBE_CLIENT_VERSION"\s*:\s*"([^"]+)"', html or "")
+    if not api_key or not client_version:
+        return None
+    return {"api_key": api_key.group(1), "client_version": client_version.group(1)}
+
+
+def _walk(node, key):
+    """중첩된 JSON에서 key에 해당하는 값을 문서 순서대로 모두 찾기"""
+    if isinstance(node, dict):
+        for k, value in node.items():
+            if k == key:
+                yield value
+            else:
+                yield from _walk(value, key)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value, key)
+
+
+def _yt_text(field):
+    """유튜브 텍스트 필드 (simpleText 또는 runs) 를 문자열로 변환"""
+    if not field:
+        return ""
+    if "simpleText" in field:
+        return field["simpleText"].strip()
+    return "".join(run.get("text", "") for run in field.get("runs", [])).strip()
+
+
+def find_youtube_continuation(data):
+    """다음 검색 결과 페이지를 요청할 continuation 토큰 (없으면 None)"""
+    for renderer in _walk(data, "continuationItemRenderer"):
+        token = (
+            renderer.get("continuationEndpoint", {})
+            .get("continuationCommand", {})
+            .get("token")
+        )
+        if token:
+            return token
+    return None
+
+
+def parse_youtube_initial_data(data, keyword, limit=7, start_rank=1):
+    """ytInitialData(또는 continuation 응답) JSON의 videoRenderer를 영상 항목으로 변환"""
+    youtube_data = []
+    for renderer in _walk(data, "videoRenderer"):
+        if len(youtube_data) >= limit:
+            break
+
+        video_id = renderer.get("videoId")
+        title = _yt_text(renderer.get("title"))
+        if not video_id or not title:
+            continue
+
+        channel = _yt_text(renderer.get("ownerText") or renderer.get("longBylineText"))
+        views = _yt_text(renderer.get("shortViewCountText") or renderer.get("viewCountText"))
+        upload_time = _yt_text(renderer.get("publishedTimeText")) or "업로드 시간 불명"
+        thumbnails = renderer.get("thumbnail", {}).get("thumbnails", [])
+        thumbnail = thumbnails[-1].get("url", "") if thumbnails else ""
+
+        youtube_data.append(build_youtube_item(
+            title, f"{YOUTUBE_BASE_URL}/watch?v={video_id}", channel, views,
+            upload_time, thumbnail, keyword, start_rank + len(youtube_data)
+        ))
+
+    return youtube_data
+
+
+def parse_naver_cafe(html, keyword, limit=5, backend=None):
+    """네이버 카페 검색 결과 HTML에서 게시글 추출"""
+    soup = make_soup(html, backend)
+
+    cafe_data = []
+    for item in soup.select(".total_wrap .api_subject_bx")[:limit]:
+        title_element = item.select_one(".api_txt_lines.total_tit a")
+        if not title_element:
+            continue
+        title = title_element.get_text(strip=True)
+        link = title_element.get("href", "")
+
+        cafe_name = _text(item.select_one(".sub_txt a"))
+        author = _text(item.select_one(".sub_txt .name"))
+
+        # 작성일 ("2024.12.29" 또는 "N일 전" 형식)
+        date_text = _text(item.select_one(".sub_txt .date"))
+        if "." in date_text:
+            date_info = date_text.replace(".", "-")
+        else:
+            date_info = convert_relative_date(date_text) if "일 전" in date_text else _today()
+
+        content = _text(item.select_one(".api_txt_lines.dsc_txt"))
+
+        cafe_data.append({
+            "title": title,
+            "content": content,
+            "url": link,
+            "source": cafe_name if cafe_name else "네이버카페",
+            "author": author,
+            "date": date_info,
+            "keyword": keyword,
+            "type": "cafe",
+            "content_length": len(content) if content else 0
+        })
+
+    return cafe_data
+
+
+# 플랫폼별 파서
+PARSERS = {
+    "news": parse_naver_news,
+    "blog": parse_naver_blog,
+    "youtube": parse_youtube,
+    "cafe": parse_naver_cafe,
+}
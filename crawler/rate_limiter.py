@@ -0,0 +1,75 @@
+"""
+호스트별 요청 속도 제한기
+토큰 버킷으로 대상 사이트(search.naver.com, youtube.com)에 대한 예의(politeness)를 유지
+"""
+
+import time
+import threading
+from urllib.parse import urlparse
+from loguru import logger
+import config
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate: 초당 토큰 수, capacity: 최대 버스트)"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기하고 대기한 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 관리"""
+
+    def __init__(self, limits=None, default_limit=None):
+        self.limits = limits if limits is not None else config.HOST_RATE_LIMITS
+        self.default_limit = default_limit or config.DEFAULT_HOST_RATE_LIMIT
+        self.buckets = {}
+        self.waited = {}
+        self.lock = threading.Lock()
+
+    def _get_bucket(self, host):
+        """호스트에 해당하는 버킷 반환 (없으면 생성)"""
+        with self.lock:
+            if host not in self.buckets:
+                limit = self.limits.get(host, self.default_limit)
+                self.buckets[host] = TokenBucket(limit["rate"], limit.get("burst", 1))
+                self.waited[host] = 0.0
+            return self.buckets[host]
+
+    def acquire(self, url):
+        """URL의 호스트에 대한 요청 허가를 받을 때까지 대기"""
+        host = urlparse(url).netloc
+        waited = self._get_bucket(host).acquire()
+        if waited:
+            with self.lock:
+                self.waited[host] += waited
+            logger.debug(f"속도 제한 대기 {waited:.2f}초: {host}")
+        return waited
+
+    def get_stats(self):
+        """호스트별 누적 대기 시간 (초)"""
+        with self.lock:
+            return {host: round(seconds, 2) for host, seconds in self.waited.items()}
@@ -0,0 +1,89 @@
+"""
+페이지 준비 대기
+고정 sleep 대신 플랫폼별 결과 컨테이너가 나타나고 개수가 안정될 때까지 WebDriverWait로 대기
+(요청 간격 조절은 호스트별 속도 제한기가 담당)
+"""
+
+import time
+import threading
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from loguru import logger
+import config
+
+
+class ResultsSettled:
+    """결과 컨테이너 개수가 min_count 이상이고 READINESS_STABLE_SECONDS 동안 변하지 않으면 참"""
+
+    def __init__(self, selector, min_count=1):
+        self.selector = selector
+        self.min_count = min_count
+        self.count = -1
+        self.changed_at = time.perf_counter()
+
+    def __call__(self, driver):
+        count = len(driver.find_elements(By.CSS_SELECTOR, self.selector))
+        now = time.perf_counter()
+        if count != self.count:
+            self.count = count
+            self.changed_at = now
+            return False
+        return count >= self.min_count and now - self.changed_at >= config.READINESS_STABLE_SECONDS
+
+
+class ReadinessWaiter:
+    """플랫폼별 준비 대기 실행 및 대기 시간/시간 초과 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {"waits": 0, "timeouts": 0, "empty_pages": 0, "wait_seconds": 0.0}
+
+    def wait(self, driver, platform, min_count=1, timeout=None):
+        """결과가 준비될 때까지 대기 후 결과 컨테이너 개수 반환 (시간 초과 시 현재 상태로 진행)"""
+        selector = config.READINESS_SELECTORS.get(platform)
+        if not selector:
+            return 0
+
+        timeout = timeout or config.READINESS_TIMEOUT
+        started = time.perf_counter()
+        condition = ResultsSettled(selector, min_count)
+        outcome = "ready"
+
+        try:
+            # 1단계: 결과 또는 '검색 결과 없음' 표시가 나타날 때까지
+            empty_selector = config.READINESS_EMPTY_SELECTORS.get(platform)
+            locator = f"{selector}, {empty_selector}" if empty_selector else selector
+            WebDriverWait(driver, timeout, poll_frequency=config.READINESS_POLL_INTERVAL).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, locator))
+            )
+
+            if empty_selector and not driver.find_elements(By.CSS_SELECTOR, selector):
+                outcome = "empty"
+            else:
+                # 2단계: 지연 로딩되는 결과까지 개수가 안정될 때까지
+                remaining = max(timeout - (time.perf_counter() - started), config.READINESS_POLL_INTERVAL)
+                WebDriverWait(driver, remaining, poll_frequency=config.READINESS_POLL_INTERVAL).until(condition)
+        except TimeoutException:
+            outcome = "timeout"
+            logger.debug(f"{platform} 페이지 준비 대기 시간 초과 ({timeout}초) - 현재 상태로 진행")
+
+        elapsed = time.perf_counter() - started
+        with self.lock:
+            self.stats["waits"] += 1
+            self.stats["wait_seconds"] += elapsed
+            if outcome == "timeout":
+                self.stats["timeouts"] += 1
+            elif outcome == "empty":
+                self.stats["empty_pages"] += 1
+
+        return max(condition.count, 0)
+
+    def get_stats(self):
+        """대기 횟수, 시간 초과 횟수, 평균 대기 시간"""
+        with self.lock:
+            stats = dict(self.stats)
+        stats["avg_wait_seconds"] = round(stats["wait_seconds"] / stats["waits"], 2) if stats["waits"] else 0.0
+        stats["wait_seconds"] = round(stats["wait_seconds"], 2)
+        return stats
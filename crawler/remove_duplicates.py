@@ -1,16 +1,25 @@
 """
 기존 크롤링된 데이터에서 중복 제거 스크립트
+
+사용법 (crawler 디렉토리에서):
+    python remove_duplicates.py                  # config.DEDUP_METHOD 방식
+    python remove_duplicates.py --method tfidf   # 전체 기록을 TF-IDF 일괄 처리
+    python remove_duplicates.py --stream         # 파일을 항목 단위로 읽어 메모리 사용량을 제한 (대용량 기록용)
+    python remove_duplicates.py --store          # 항목 저장소 안의 유사 중복 제거 (대표 URL 중복은 저장 시 upsert로 처리됨)
 """
 
 import os
 import json
 import glob
+import argparse
 from datetime import datetime
 from enhanced_crawler import EnhancedSongdoCrawler
+from stream_dedup import stream_remove_duplicates
+from item_store import ItemStore
 from loguru import logger
 import config
 
-def remove_duplicates_from_existing_data():
+def remove_duplicates_from_existing_data(method=None):
     """기존 크롤링된 데이터에서 중복 제거"""
     try:
         print("🔍 기존 데이터에서 중복 제거를 시작합니다...")
@@ -49,7 +58,7 @@ def remove_duplicates_from_existing_data():
                 total_before += original_count
                 
                 # 중복 제거
-                unique_data = crawler.remove_duplicates(data)
+                unique_data = crawler.remove_duplicates(data, method=method)
                 unique_count = len(unique_data)
                 total_after += unique_count
                 
@@ -86,7 +95,7 @@ def remove_duplicates_from_existing_data():
         logger.error(f"중복 제거 오류: {str(e)}")
         return False
 
-def remove_duplicates_across_files():
+def remove_duplicates_across_files(method=None):
     """파일 간 중복 제거 - 모든 파일의 데이터를 합쳐서 중복 제거 후 다시 분배"""
     try:
         print("\n🔍 파일 간 중복 제거를 시작합니다...")
@@ -133,7 +142,7 @@ def remove_duplicates_across_files():
                 continue
             
             original_count = len(items)
-            unique_items = crawler.remove_duplicates(items)
+            unique_items = crawler.remove_duplicates(items, method=method)
             unique_count = len(unique_items)
             removed_count = original_count - unique_count
             
@@ -173,17 +182,99 @@ def remove_duplicates_across_files():
         logger.error(f"파일 간 중복 제거 오류: {str(e)}")
         return False
 
+def remove_duplicates_streaming(memory_mb=None):
+    """스트리밍 중복 제거 - 파일 내/파일 간 중복을 한 번에 처리 (메모리 사용량이 기록 크기와 무관)"""
+    try:
+        memory_mb = memory_mb or config.STREAM_DEDUP_MEMORY_MB
+        print(f"\n🔍 스트리밍 중복 제거를 시작합니다... (메모리 상한 {memory_mb}MB)")
+        
+        result = stream_remove_duplicates(memory_mb)
+        if result is None:
+            print("❌ 처리할 JSON 파일이 없습니다.")
+            return False
+        
+        for keyword, counts in result["keywords"].items():
+            removed_count = counts["before"] - counts["after"]
+            if removed_count > 0:
+                print(f"   ✅ {keyword}: {counts['before']}개 → {counts['after']}개 (중복 {removed_count}개 제거)")
+            else:
+                print(f"   ✅ {keyword}: {counts['after']}개 (중복 없음)")
+        
+        total_removed = result["items"] - result["unique"]
+        print(f"\n📊 스트리밍 중복 제거 완료!")
+        print(f"   • 입력 파일: {result['files']}개 → 출력 파일: {len(result['outputs'])}개")
+        print(f"   • 전체 항목: {result['items']}개 → {result['unique']}개")
+        print(f"   • 제거된 중복: {total_removed}개 (URL {result['index']['url_matches']}개, 유사 {result['index']['near_duplicates']}개)")
+        if result["failed_files"]:
+            print(f"   ⚠️ 읽지 못해 그대로 둔 파일: {result['failed_files']}개")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ 스트리밍 중복 제거 중 오류: {str(e)}")
+        logger.error(f"스트리밍 중복 제거 오류: {str(e)}")
+        return False
+
+def remove_duplicates_in_store(method=None):
+    """항목 저장소 안의 유사 중복 제거 - 플랫폼별로 날짜가 이른 항목부터 남김"""
+    try:
+        print("\n🔍 항목 저장소 중복 제거를 시작합니다...")
+        
+        store = ItemStore()
+        if not store.enabled:
+            print("❌ 항목 저장소를 사용할 수 없습니다.")
+            return False
+        
+        crawler = EnhancedSongdoCrawler()
+        try:
+            total_removed = 0
+            for platform in ['news', 'blog', 'youtube', 'cafe']:
+                items = store.query(platform=platform, newest_first=False)
+                if not items:
+                    continue
+                kept = {id(item) for item in crawler.remove_duplicates(items, method=method)}
+                removed_count = store.delete([item for item in items if id(item) not in kept])
+                total_removed += removed_count
+                print(f"   ✅ {platform}: {len(items)}개 → {len(items) - removed_count}개 (중복 {removed_count}개 제거)")
+        finally:
+            crawler.close()
+            store.close()
+        
+        print(f"\n📊 항목 저장소 중복 제거 완료: {total_removed}개 제거")
+        return True
+        
+    except Exception as e:
+        print(f"❌ 항목 저장소 중복 제거 중 오류: {str(e)}")
+        logger.error(f"항목 저장소 중복 제거 오류: {str(e)}")
+        return False
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='크롤링 데이터 중복 제거')
+    parser.add_argument('--method', choices=['minhash', 'exact', 'tfidf', 'pairwise'],
+                        help=f'중복 제거 방식 (기본: {config.DEDUP_METHOD})')
+    parser.add_argument('--stream', action='store_true', help='스트리밍 모드 (디스크 인덱스 사용, minhash 기준)')
+    parser.add_argument('--memory-mb', type=int, help=f'스트리밍 모드 메모리 상한 (기본: {config.STREAM_DEDUP_MEMORY_MB})')
+    parser.add_argument('--store', action='store_true', help='항목 저장소 안의 중복 제거 (JSON 파일은 그대로 유지)')
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("🔧 송도동 정보 허브 - 중복 제거 도구")
     print("=" * 60)
     
-    print("\n1️⃣ 파일 내 중복 제거 실행...")
-    success1 = remove_duplicates_from_existing_data()
+    if args.store:
+        # 저장소 모드는 저장소 안의 항목만 처리
+        success1 = success2 = remove_duplicates_in_store(args.method)
+    elif args.stream:
+        # 스트리밍 모드는 파일 내/파일 간 중복을 한 번에 처리
+        success1 = success2 = remove_duplicates_streaming(args.memory_mb)
+    else:
+        print("\n1️⃣ 파일 내 중복 제거 실행...")
+        success1 = remove_duplicates_from_existing_data(args.method)
     
     if success1:
-        print("\n2️⃣ 파일 간 중복 제거 실행...")
-        success2 = remove_duplicates_across_files()
+        if not (args.stream or args.store):
+            print("\n2️⃣ 파일 간 중복 제거 실행...")
+            success2 = remove_duplicates_across_files(args.method)
         
         if success2:
             print("\n🎉 모든 중복 제거 작업이 완료되었습니다!")
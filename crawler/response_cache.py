@@ -0,0 +1,167 @@
+"""
+검색 결과 페이지 디스크 캐시
+정규화된 URL을 키로 플랫폼별 TTL, ETag/Last-Modified 재검증, 용량 기반 LRU 삭제를 지원
+"""
+
+import os
+import json
+import gzip
+import time
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from loguru import logger
+import config
+
+
+def normalize_url(url):
+    """캐시 키용 URL 정규화 - 스킴/호스트 소문자, 쿼리 파라미터 정렬, 프래그먼트 제거"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+class ResponseCache:
+    """검색 결과 HTML 디스크 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_dir=None, max_bytes=None, ttls=None, enabled=None):
+        self.enabled = config.RESPONSE_CACHE_ENABLED if enabled is None else enabled
+        self.cache_dir = cache_dir or config.RESPONSE_CACHE_DIR
+        self.max_bytes = max_bytes or config.RESPONSE_CACHE_MAX_MB * 1024 * 1024
+        self.ttls = ttls or config.RESPONSE_CACHE_TTL
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "revalidated": 0, "stores": 0, "evictions": 0}
+        self.index = self._load_index() if self.enabled else {}
+
+    def _load_index(self):
+        """캐시 인덱스 로드 (없거나 손상된 경우 빈 인덱스)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"응답 캐시 인덱스 로드 실패 - 새로 시작: {str(e)}")
+        return {}
+
+    def _save_index(self):
+        """캐시 인덱스를 임시 파일에 쓴 뒤 교체 (lock 보유 상태에서 호출)"""
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def _key(self, url, variant=""):
+        normalized = normalize_url(url)
+        if variant:
+            normalized = f"{normalized}#{variant}"
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.html.gz")
+
+    def get(self, url, platform, variant=""):
+        """캐시 항목 조회 - {html, fresh, etag, last_modified} 또는 None"""
+        if not self.enabled:
+            return None
+
+        key = self._key(url, variant)
+        with self.lock:
+            meta = self.index.get(key)
+            if not meta:
+                self.stats["misses"] += 1
+                return None
+
+            try:
+                with gzip.open(self._body_path(key), 'rt', encoding='utf-8') as f:
+                    html = f.read()
+            except Exception:
+                self.index.pop(key, None)
+                self.stats["misses"] += 1
+                return None
+
+            ttl = self.ttls.get(platform, config.RESPONSE_CACHE_DEFAULT_TTL)
+            fresh = time.time() - meta["stored_at"] < ttl
+            meta["last_access"] = time.time()
+            self.stats["hits" if fresh else "stale"] += 1
+
+        return {
+            "html": html,
+            "fresh": fresh,
+            "etag": meta.get("etag"),
+            "last_modified": meta.get("last_modified"),
+        }
+
+    def validators(self, entry):
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url, platform, html, etag=None, last_modified=None, variant=""):
+        """HTML 저장 후 용량 한도를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        if not self.enabled or not html:
+            return
+
+        key = self._key(url, variant)
+        try:
+            with self.lock:
+                with gzip.open(self._body_path(key), 'wt', encoding='utf-8') as f:
+                    f.write(html)
+                now = time.time()
+                self.index[key] = {
+                    "url": url,
+                    "platform": platform,
+                    "stored_at": now,
+                    "last_access": now,
+                    "size": os.path.getsize(self._body_path(key)),
+                    "etag": etag,
+                    "last_modified": last_modified,
+                }
+                self.stats["stores"] += 1
+                self._evict()
+                self._save_index()
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 실패: {url} - {str(e)}")
+
+    def mark_revalidated(self, url, variant=""):
+        """304 응답으로 재검증된 항목의 저장 시각 갱신"""
+        if not self.enabled:
+            return
+
+        key = self._key(url, variant)
+        with self.lock:
+            if key in self.index:
+                self.index[key]["stored_at"] = time.time()
+                self.stats["revalidated"] += 1
+                self._save_index()
+
+    def _evict(self):
+        """총 용량이 한도를 넘으면 LRU 순서로 삭제 (lock 보유 상태에서 호출)"""
+        total = sum(meta["size"] for meta in self.index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, meta in sorted(self.index.items(), key=lambda kv: kv[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+            total -= meta["size"]
+            del self.index[key]
+            self.stats["evictions"] += 1
+
+    def get_stats(self):
+        """적중/실패 통계와 현재 캐시 크기"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self.index)
+            stats["size_bytes"] = sum(meta["size"] for meta in self.index.values())
+        return stats
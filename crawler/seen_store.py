@@ -0,0 +1,153 @@
+"""
+수집 이력 저장소 (seen store)
+대표 URL(canonical URL)을 키로 처음/마지막 수집 시각을 SQLite에 기록해 이미 수집한 항목을 건너뛸 수 있도록 함
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from loguru import logger
+import config
+from url_canonical import canonical_url
+
+# 한국시간 타임존 설정
+KST = timezone(timedelta(hours=9))
+
+
+class SeenStore:
+    """URL 단위 수집 이력 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path=None, enabled=None):
+        self.enabled = config.SEEN_STORE_ENABLED if enabled is None else enabled
+        self.db_path = db_path or config.SEEN_STORE_PATH
+        self.lock = threading.Lock()
+        self.stats = {"checked": 0, "known": 0, "new": 0, "marked": 0}
+        self.conn = self._connect() if self.enabled else None
+
+    def _connect(self):
+        """DB 연결 및 테이블 생성 (실패 시 저장소 비활성화)"""
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_items (
+                    url_key TEXT PRIMARY KEY,
+                    platform TEXT,
+                    url TEXT,
+                    title TEXT,
+                    first_seen TEXT,
+                    last_seen TEXT,
+                    seen_count INTEGER DEFAULT 1
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_items_last_seen ON seen_items(last_seen)")
+            conn.commit()
+            return conn
+        except Exception as e:
+            logger.warning(f"수집 이력 저장소 열기 실패 - 비활성화: {str(e)}")
+            self.enabled = False
+            return None
+
+    def _key(self, url):
+        return canonical_url(url)
+
+    def _known_keys(self, urls):
+        """주어진 URL 중 이미 수집 이력이 있는 URL의 정규화 키 집합"""
+        if not self.enabled or not urls:
+            return set()
+
+        keys = list({self._key(url) for url in urls if url})
+        known = set()
+        with self.lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT url_key FROM seen_items WHERE url_key IN ({placeholders})", chunk
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return known
+
+    def _is_known(self, item, known_keys):
+        """항목 URL의 정규화 키가 known_keys에 있는지"""
+        return bool(item.get('url')) and self._key(item['url']) in known_keys
+
+    def filter_new(self, items):
+        """이미 수집한 항목을 제외한 새 항목 목록 반환"""
+        if not self.enabled or not items:
+            return items
+
+        known = self._known_keys([item.get('url') for item in items])
+        new_items = [item for item in items if not self._is_known(item, known)]
+
+        with self.lock:
+            self.stats["checked"] += len(items)
+            self.stats["known"] += len(items) - len(new_items)
+            self.stats["new"] += len(new_items)
+        return new_items
+
+    def all_known(self, items):
+        """항목이 모두 이미 수집한 것인지 (조기 중단 판단용, 빈 목록은 False)"""
+        if not self.enabled or not items:
+            return False
+        known = self._known_keys([item.get('url') for item in items])
+        return all(self._is_known(item, known) for item in items)
+
+    def mark_seen(self, items):
+        """항목을 수집 이력에 기록 (이미 있으면 마지막 수집 시각과 횟수 갱신)"""
+        if not self.enabled or not items:
+            return
+
+        now = datetime.now(KST).isoformat()
+        rows = [
+            (self._key(item['url']), item.get('type', ''), item['url'], item.get('title', ''), now, now)
+            for item in items if item.get('url')
+        ]
+        try:
+            with self.lock:
+                self.conn.executemany("""
+                    INSERT INTO seen_items (url_key, platform, url, title, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url_key) DO UPDATE SET
+                        last_seen = excluded.last_seen,
+                        seen_count = seen_count + 1
+                """, rows)
+                self.conn.commit()
+                self.stats["marked"] += len(rows)
+        except Exception as e:
+            logger.warning(f"수집 이력 기록 실패: {str(e)}")
+
+    def purge(self, before):
+        """마지막 수집 시각이 before(ISO 시각)보다 이전인 URL 삭제 - 삭제한 URL 수 반환"""
+        if not self.enabled:
+            return 0
+        try:
+            with self.lock:
+                cursor = self.conn.execute("DELETE FROM seen_items WHERE last_seen < ?", (before,))
+                self.conn.commit()
+                if cursor.rowcount:
+                    # 삭제 후 테이블/인덱스 다시 쓰기 (파일 크기 회수)
+                    self.conn.execute("VACUUM")
+                return cursor.rowcount
+        except Exception as e:
+            logger.warning(f"수집 이력 정리 실패: {str(e)}")
+            return 0
+
+    def get_stats(self):
+        """조회/기록 통계와 저장된 URL 수"""
+        stats = dict(self.stats)
+        if self.enabled:
+            with self.lock:
+                stats["entries"] = self.conn.execute("SELECT COUNT(*) FROM seen_items").fetchone()[0]
+        return stats
+
+    def close(self):
+        """DB 연결 종료"""
+        if self.conn:
+            with self.lock:
+                self.conn.close()
+                self.conn = None
+            self.enabled = False
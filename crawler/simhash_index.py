@@ -0,0 +1,237 @@
+"""
+SimHash 지문 저장소
+정규화한 제목+요약의 64비트 SimHash를 항목에 기록하고 SQLite에 누적해 두어,
+이전 실행 파일을 다시 읽지 않고도 새 항목이 과거 항목과 거의 같은지(해밍 거리 이내) 확인
+
+64비트를 16비트 블록 4개로 나누면 해밍 거리 3 이내인 두 지문은 적어도 한 블록이 같으므로 (비둘기집 원리)
+블록별 인덱스(각 블록을 앞에 둔 순열 테이블과 같은 역할)로 후보만 조회
+"""
+
+import os
+import glob
+import json
+import hashlib
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from loguru import logger
+import config
+from url_canonical import canonical_url
+from near_duplicates import normalize_text, item_content
+
+# 한국시간 타임존 설정
+KST = timezone(timedelta(hours=9))
+
+BITS = 64
+BLOCKS = 4
+BLOCK_BITS = BITS // BLOCKS
+BLOCK_MASK = (1 << BLOCK_BITS) - 1
+# 블록 4개로 보장되는 최대 해밍 거리
+MAX_INDEXED_DISTANCE = BLOCKS - 1
+
+
+def _feature_hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(text, shingle_size=None):
+    """정규화된 텍스트의 64비트 SimHash (문자 n-gram 빈도를 가중치로 사용, 빈 텍스트는 0)"""
+    size = shingle_size or config.DEDUP_SHINGLE_SIZE
+    if not text:
+        return 0
+    features = Counter(text[i:i + size] for i in range(max(len(text) - size + 1, 1)))
+
+    weights = [0] * BITS
+    for feature, count in features.items():
+        value = _feature_hash(feature)
+        for bit in range(BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def item_simhash(item):
+    """항목의 SimHash - 정규화한 제목과 요약(없으면 본문)을 이어 붙여 계산"""
+    return simhash(normalize_text(item.get('title', '')) + normalize_text(item_content(item)))
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+
+def _blocks(fingerprint):
+    return [(fingerprint >> (BLOCK_BITS * index)) & BLOCK_MASK for index in range(BLOCKS)]
+
+
+def _to_signed(value):
+    # SQLite INTEGER는 부호 있는 64비트
+    return value - (1 << BITS) if value >= 1 << (BITS - 1) else value
+
+
+class SimHashStore:
+    """실행 간 SimHash 지문 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path=None, enabled=None, max_distance=None):
+        self.enabled = config.SIMHASH_STORE_ENABLED if enabled is None else enabled
+        self.db_path = db_path or config.SIMHASH_STORE_PATH
+        requested = config.SIMHASH_MAX_DISTANCE if max_distance is None else max_distance
+        self.max_distance = min(requested, MAX_INDEXED_DISTANCE)
+        self.lock = threading.Lock()
+        self.stats = {"annotated": 0, "checked": 0, "near_duplicates": 0, "candidates": 0, "added": 0}
+        self.conn = self._connect() if self.enabled else None
+
+    def _connect(self):
+        """DB 연결 및 테이블/블록 인덱스 생성 (실패 시 저장소 비활성화)"""
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            block_columns = ", ".join(f"block{index} INTEGER" for index in range(BLOCKS))
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS fingerprints (
+                    url_key TEXT PRIMARY KEY,
+                    simhash INTEGER,
+                    {block_columns},
+                    platform TEXT,
+                    title TEXT,
+                    first_seen TEXT
+                )
+            """)
+            for index in range(BLOCKS):
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_fingerprints_block{index} ON fingerprints(block{index})")
+            conn.commit()
+            return conn
+        except Exception as e:
+            logger.warning(f"SimHash 지문 저장소 열기 실패 - 비활성화: {str(e)}")
+            self.enabled = False
+            return None
+
+    def annotate(self, items):
+        """항목마다 SimHash를 16자리 16진수 문자열로 기록 (JSON/자바스크립트에서 64비트 정수 손실 방지)"""
+        for item in items:
+            item['simhash'] = format(item_simhash(item), '016x')
+        with self.lock:
+            self.stats["annotated"] += len(items)
+        return items
+
+    def _fingerprint(self, item):
+        value = item.get('simhash')
+        return int(value, 16) if value else item_simhash(item)
+
+    def find_near(self, fingerprint):
+        """해밍 거리 max_distance 이내의 과거 지문 (url_key, 거리) 목록"""
+        if not self.enabled or not fingerprint:
+            return []
+
+        where = " OR ".join(f"block{index} = ?" for index in range(BLOCKS))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT url_key, simhash FROM fingerprints WHERE {where}", _blocks(fingerprint)
+            ).fetchall()
+            self.stats["candidates"] += len(rows)
+
+        matches = []
+        for url_key, stored in rows:
+            distance = hamming_distance(fingerprint, stored & ((1 << BITS) - 1))
+            if distance <= self.max_distance:
+                matches.append((url_key, distance))
+        return matches
+
+    def filter_new(self, items):
+        """과거 실행에서 수집한 항목과 거의 같은 항목을 제외한 목록"""
+        if not self.enabled or not items:
+            return items
+
+        new_items = []
+        for item in items:
+            matches = self.find_near(self._fingerprint(item))
+            if matches:
+                logger.debug(f"과거 수집 항목과 유사 (거리 {min(d for _, d in matches)}) - 제외: {item.get('title', '')[:50]}...")
+                continue
+            new_items.append(item)
+
+        with self.lock:
+            self.stats["checked"] += len(items)
+            self.stats["near_duplicates"] += len(items) - len(new_items)
+        return new_items
+
+    def add(self, items):
+        """항목 지문을 저장소에 추가 (같은 URL이 이미 있으면 유지)"""
+        if not self.enabled or not items:
+            return
+
+        now = datetime.now(KST).isoformat()
+        rows = []
+        for item in items:
+            fingerprint = self._fingerprint(item)
+            if not item.get('url') or not fingerprint:
+                continue
+            rows.append((
+                canonical_url(item['url']), _to_signed(fingerprint), *_blocks(fingerprint),
+                item.get('type', ''), item.get('title', ''), now
+            ))
+
+        placeholders = ", ".join("?" * (BLOCKS + 5))
+        try:
+            with self.lock:
+                cursor = self.conn.executemany(
+                    f"INSERT OR IGNORE INTO fingerprints VALUES ({placeholders})", rows
+                )
+                self.conn.commit()
+                self.stats["added"] += cursor.rowcount
+        except Exception as e:
+            logger.warning(f"SimHash 지문 기록 실패: {str(e)}")
+
+    def purge(self, before):
+        """처음 기록 시각이 before(ISO 시각)보다 이전인 지문 삭제 - 삭제한 지문 수 반환"""
+        if not self.enabled:
+            return 0
+        try:
+            with self.lock:
+                cursor = self.conn.execute("DELETE FROM fingerprints WHERE first_seen < ?", (before,))
+                self.conn.commit()
+                if cursor.rowcount:
+                    # 삭제 후 테이블/인덱스 다시 쓰기 (파일 크기 회수)
+                    self.conn.execute("VACUUM")
+                return cursor.rowcount
+        except Exception as e:
+            logger.warning(f"SimHash 지문 정리 실패: {str(e)}")
+            return 0
+
+    def get_stats(self):
+        """지문 계산/조회/추가 통계와 저장된 지문 수"""
+        stats = dict(self.stats)
+        if self.enabled:
+            with self.lock:
+                stats["entries"] = self.conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+        stats["max_distance"] = self.max_distance
+        return stats
+
+    def close(self):
+        """DB 연결 종료"""
+        if self.conn:
+            with self.lock:
+                self.conn.close()
+                self.conn = None
+            self.enabled = False
+
+
+def backfill_from_archive(store):
+    """기존 enhanced_news 파일의 항목 지문을 저장소에 채우기 (파일 하나씩 읽어서 추가)"""
+    files = sorted(glob.glob(f"{config.DATA_DIR}/enhanced_news/*_enhanced_news_*.json"))
+    for file_path in files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                store.add(json.load(f))
+        except Exception as e:
+            logger.warning(f"지문 채우기 실패 ({os.path.basename(file_path)}): {str(e)}")
+    return len(files)
+
+
+if __name__ == "__main__":
+    print("🔏 기존 수집 데이터로 SimHash 지문 저장소 채우는 중...")
+    simhash_store = SimHashStore(enabled=True)
+    file_count = backfill_from_archive(simhash_store)
+    print(f"✅ 파일 {file_count}개 처리 - {simhash_store.get_stats()}")
+    simhash_store.close()
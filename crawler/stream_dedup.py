@@ -0,0 +1,248 @@
+"""
+스트리밍 중복 제거
+enhanced_news 파일을 한 항목씩 읽어(raw_decode 기반 점진 파싱) 디스크(SQLite)의 대표 URL/MinHash LSH 인덱스와 비교하고,
+남길 항목은 키워드별 출력 파일에 바로 써서 최대 메모리 사용량이 기록 크기가 아니라 설정값(STREAM_DEDUP_MEMORY_MB)에 묶이도록 함
+판정 기준은 minhash 방식과 같음 (대표 URL 일치, 후보 쌍의 제목 0.8 또는 제목 0.6 + 내용 0.7)
+"""
+
+import os
+import json
+import codecs
+import glob
+import hashlib
+import sqlite3
+from datetime import datetime
+from itertools import groupby
+from loguru import logger
+import config
+from near_duplicates import MinHasher, normalize_text, sequence_similarity, item_content
+from url_canonical import canonical_url
+
+SEPARATORS = " \t\r\n,"
+
+
+def iter_json_array(file_path, chunk_size=None):
+    """JSON 객체 배열 파일의 원소를 하나씩 반환 - 파일 전체가 아니라 chunk_size 바이트씩 읽어서 파싱"""
+    chunk_size = chunk_size or config.STREAM_DEDUP_READ_CHUNK_BYTES
+    decoder = json.JSONDecoder()
+    # 바이트 단위로 읽고, 청크 경계에서 잘린 UTF-8 문자는 다음 청크와 이어서 디코딩
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    with open(file_path, 'rb') as f:
+        data = f.read(chunk_size)
+        buffer = utf8.decode(data, final=not data)
+        position = 0
+        eof = not data
+        started = False
+
+        while True:
+            while position < len(buffer) and buffer[position] in SEPARATORS:
+                position += 1
+
+            if position < len(buffer):
+                if not started:
+                    if buffer[position] != "[":
+                        raise ValueError(f"JSON 배열 파일이 아닙니다: {file_path}")
+                    started = True
+                    position += 1
+                    continue
+                if buffer[position] == "]":
+                    return
+                try:
+                    item, position = decoder.raw_decode(buffer, position)
+                    yield item
+                    continue
+                except json.JSONDecodeError:
+                    # 원소가 버퍼 경계에서 잘림 - 더 읽어서 다시 시도
+                    if eof:
+                        raise
+            elif eof:
+                if started:
+                    raise ValueError(f"JSON 배열이 닫히지 않았습니다: {file_path}")
+                return
+
+            data = f.read(chunk_size)
+            buffer = buffer[position:] + utf8.decode(data, final=not data)
+            position = 0
+            eof = not data
+
+
+class DiskDedupIndex:
+    """SQLite에 저장하는 대표 URL + 제목 MinHash LSH 인덱스 (정규화된 제목/내용도 함께 저장해 후보 확인에 사용)"""
+
+    def __init__(self, db_path=None, cache_mb=None):
+        self.db_path = db_path or config.STREAM_DEDUP_INDEX_PATH
+        self.hasher = MinHasher()
+        self.bands = config.DEDUP_LSH_BANDS
+        self.rows = self.hasher.num_perm // self.bands
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        # 페이지 캐시도 메모리 상한 안에서 사용 (음수는 KiB 단위)
+        self.conn.execute(f"PRAGMA cache_size=-{max(int((cache_mb or 8) * 1024), 1024)}")
+        self.conn.execute("PRAGMA journal_mode=OFF")
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, scope TEXT, url_key TEXT, title TEXT, content TEXT)")
+        self.conn.execute("CREATE UNIQUE INDEX idx_items_url ON items(scope, url_key)")
+        self.conn.execute("CREATE TABLE buckets (scope TEXT, bucket INTEGER, item_id INTEGER)")
+        self.conn.execute("CREATE INDEX idx_buckets ON buckets(scope, bucket)")
+        self.stats = {"indexed": 0, "url_matches": 0, "candidates": 0, "near_duplicates": 0}
+
+    def _buckets(self, signature):
+        """밴드별 서명 조각을 하나의 정수 버킷 키로 (밴드 번호 포함)"""
+        keys = []
+        for band in range(self.bands):
+            chunk = f"{band}:" + ",".join(map(str, signature[band * self.rows:(band + 1) * self.rows]))
+            keys.append(int.from_bytes(hashlib.blake2b(chunk.encode(), digest_size=8).digest(), 'big', signed=True))
+        return keys
+
+    def check_and_add(self, item, scope):
+        """항목이 scope 안의 기존 항목과 중복이면 True, 아니면 인덱스에 추가하고 False"""
+        url_key = canonical_url(item.get('url', '')) or None
+        if url_key and self.conn.execute(
+            "SELECT 1 FROM items WHERE scope = ? AND url_key = ?", (scope, url_key)
+        ).fetchone():
+            self.stats["url_matches"] += 1
+            return True
+
+        title = normalize_text(item.get('title', ''))
+        content = normalize_text(item_content(item))
+        signature = self.hasher.signature(title)
+        buckets = self._buckets(signature) if signature else []
+
+        if buckets:
+            placeholders = ",".join("?" * len(buckets))
+            candidates = self.conn.execute(
+                f"SELECT id, title, content FROM items WHERE id IN "
+                f"(SELECT item_id FROM buckets WHERE scope = ? AND bucket IN ({placeholders})) ORDER BY id",
+                (scope, *buckets)
+            ).fetchall()
+            self.stats["candidates"] += len(candidates)
+            for _, other_title, other_content in candidates:
+                title_similarity = sequence_similarity(title, other_title)
+                if title_similarity >= 0.8 or (
+                    title_similarity >= 0.6 and sequence_similarity(content, other_content) >= 0.7
+                ):
+                    self.stats["near_duplicates"] += 1
+                    return True
+
+        cursor = self.conn.execute(
+            "INSERT INTO items (scope, url_key, title, content) VALUES (?, ?, ?, ?)", (scope, url_key, title, content)
+        )
+        self.conn.executemany(
+            "INSERT INTO buckets (scope, bucket, item_id) VALUES (?, ?, ?)",
+            [(scope, bucket, cursor.lastrowid) for bucket in buckets]
+        )
+        self.stats["indexed"] += 1
+        return False
+
+    def close(self):
+        """인덱스 DB 닫고 삭제 (작업용 임시 파일)"""
+        self.conn.close()
+        try:
+            os.remove(self.db_path)
+        except OSError:
+            pass
+
+
+class JsonArrayWriter:
+    """남긴 항목을 JSON 배열 파일 하나에 바로 기록 (키워드별 파일 하나 - 기존 파일 간 중복 제거와 같은 형식, 완료 전에는 .tmp 파일)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.count = 0
+
+    def write(self, item):
+        if self.file is None:
+            self.file = open(f"{self.path}.tmp", 'w', encoding='utf-8')
+            self.file.write("[\n")
+        if self.count:
+            self.file.write(",\n")
+        self.file.write(json.dumps(item, ensure_ascii=False))
+        self.count += 1
+
+    def finish(self):
+        """파일을 닫고 .tmp 파일을 최종 이름으로 교체 - 기록한 파일 경로 (남긴 항목이 없으면 None)"""
+        if self.file is None:
+            return None
+        self.file.write("\n]\n")
+        self.file.close()
+        self.file = None
+        os.replace(f"{self.path}.tmp", self.path)
+        return self.path
+
+    def abort(self):
+        """작성 중인 파일 삭제"""
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        try:
+            os.remove(f"{self.path}.tmp")
+        except OSError:
+            pass
+
+
+def _file_keyword(file_path):
+    return os.path.basename(file_path).split('_enhanced_news_')[0]
+
+
+def stream_remove_duplicates(memory_mb=None, data_dir=None):
+    """파일 간 중복 제거 (스트리밍) - 키워드별로 파일을 순서대로 읽어 키워드별 파일 하나로 다시 쓰고, 모두 성공하면 기존 파일 삭제"""
+    memory_mb = memory_mb or config.STREAM_DEDUP_MEMORY_MB
+    enhanced_news_dir = f"{data_dir or config.DATA_DIR}/enhanced_news"
+    json_files = sorted(glob.glob(f"{enhanced_news_dir}/*_enhanced_news_*.json"), key=lambda path: (_file_keyword(path), path))
+    if not json_files:
+        return None
+
+    # 메모리 상한: 읽기 버퍼 1/4, SQLite 페이지 캐시 1/2 (나머지는 항목 하나와 파일 쓰기 버퍼)
+    chunk_size = max(int(memory_mb * 1024 * 1024 / 4), 64 * 1024)
+    index = DiskDedupIndex(cache_mb=memory_mb / 2)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    result = {"files": len(json_files), "items": 0, "unique": 0, "keywords": {}, "outputs": []}
+    writers = []
+    failed = set()
+
+    try:
+        for keyword, paths in groupby(json_files, key=_file_keyword):
+            writer = JsonArrayWriter(os.path.join(enhanced_news_dir, f"{keyword}_enhanced_news_{timestamp}.json"))
+            writers.append(writer)
+            before, after = 0, 0
+            for file_path in paths:
+                try:
+                    for item in iter_json_array(file_path, chunk_size):
+                        before += 1
+                        if not index.check_and_add(item, keyword):
+                            writer.write(item)
+                            after += 1
+                except Exception as e:
+                    # 읽지 못한 파일은 지우지 않도록 기록
+                    logger.error(f"스트리밍 중복 제거 - 파일 읽기 오류 ({os.path.basename(file_path)}): {str(e)}")
+                    failed.add(file_path)
+            index.conn.commit()
+            result["keywords"][keyword] = {"before": before, "after": after}
+            result["items"] += before
+            result["unique"] += after
+
+        for writer in writers:
+            output = writer.finish()
+            if output:
+                result["outputs"].append(output)
+    except Exception:
+        for writer in writers:
+            writer.abort()
+        raise
+    finally:
+        result["index"] = dict(index.stats)
+        index.close()
+
+    # 새 파일이 모두 기록된 뒤에만 기존 파일 삭제
+    result["failed_files"] = len(failed)
+    for file_path in json_files:
+        if file_path not in failed:
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                logger.warning(f"기존 파일 삭제 실패 ({os.path.basename(file_path)}): {str(e)}")
+    return result
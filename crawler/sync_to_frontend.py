@@ -1,11 +1,13 @@
 """
 크롤링 데이터를 프론트엔드로 자동 동기화
 크롤링 완료 후 최신 데이터를 frontend/public/data/enhanced_news/로 복사
+매니페스트(내용 해시)로 바뀐 파일만 쓰고 지우므로, 바뀐 내용이 없으면 대상 디렉토리를 건드리지 않음 (커밋/푸시 생략 가능)
 """
 
 import os
 import shutil
 import json
+import hashlib
 import glob
 from datetime import datetime, timezone, timedelta
 from loguru import logger
@@ -14,11 +16,17 @@ import config
 # 한국시간 타임존 설정
 KST = timezone(timedelta(hours=9))
 
+# 변경 없음 상태 (_sync 반환값) 및 --sync 종료 코드 - 배치 스크립트가 커밋/푸시 생략 판단에 사용
+SYNC_NOOP = "noop"
+SYNC_NOOP_EXIT_CODE = 3
+
 class DataSyncManager:
     def __init__(self):
         """데이터 동기화 매니저 초기화"""
         self.source_dir = os.path.join(config.DATA_DIR, "enhanced_news")
         self.target_dir = os.path.join("../frontend/public/data/enhanced_news")
+        self.manifest_path = config.SYNC_MANIFEST_PATH
+        self.last_result = None
         self.setup_logging()
         
     def setup_logging(self):
@@ -101,96 +109,124 @@ class DataSyncManager:
             logger.error(f"최신 파일 선택 오류: {str(e)}")
             return {}
 
-    def sync_all_data(self):
-        """최신 데이터만 프론트엔드로 동기화 (실제로는 키워드별 최신 파일만)"""
+    def _file_hash(self, path):
+        """파일 내용의 SHA-256"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_manifest(self):
+        """마지막 동기화 때 기록한 대상 파일 목록 {파일명: {sha256, size, mtime_ns}}"""
         try:
-            print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] 🔄 최신 데이터 동기화 시작...")
-            
-            if not self.ensure_target_directory():
-                return False
-                
-            # 기존 파일들 정리
-            self.cleanup_old_files()
-            
-            # 키워드별 최신 파일들만 가져오기 (과거 데이터 제외)
-            latest_files = self.get_latest_files_by_keyword()
-            
-            if not latest_files:
-                logger.warning("동기화할 파일이 없습니다")
-                return False
-            
-            # 파일 복사
-            synced_count = 0
-            synced_files = {}
-            for keyword, file_info in latest_files.items():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("files", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, files):
+        """동기화한 대상 파일 목록 기록 (임시 파일에 쓴 뒤 교체)"""
+        self._atomic_write_json(self.manifest_path, {"synced_at": datetime.now(KST).isoformat(), "files": files})
+
+    def _atomic_write_json(self, path, data):
+        """JSON을 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _manifest_entry(self, path, sha256):
+        stat = os.stat(path)
+        return {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _target_hash(self, path, manifest):
+        """대상 파일 해시 - 크기/수정 시각이 매니페스트와 같으면 기록된 해시 사용, 다르면 다시 계산"""
+        entry = manifest.get(os.path.basename(path))
+        stat = os.stat(path)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["sha256"]
+        return self._file_hash(path)
+
+    def sync_files(self, files):
+        """매니페스트 기반 증분 동기화 - 내용이 바뀐 파일만 임시 파일 후 교체로 쓰고, 대상에만 남은 파일 삭제
+        반환: written/removed/unchanged 파일명 목록, 대상 파일명으로 바꾼 files(synced), 변경 여부(changed)"""
+        manifest = self._load_manifest()
+        targets = {
+            os.path.basename(path): self._target_hash(path, manifest)
+            for path in glob.glob(os.path.join(self.target_dir, "*_enhanced_news_*.json"))
+        }
+
+        result = {"written": [], "removed": [], "unchanged": [], "synced": {}}
+        kept = {}
+        for key, file_info in files.items():
+            source_hash = self._file_hash(file_info['path'])
+            filename = file_info['filename']
+            if targets.get(filename) != source_hash:
+                # 이름만 다르고 내용이 같은 파일이 이미 있으면 그대로 사용 (다시 수집했지만 바뀐 내용이 없는 경우)
+                filename = next(
+                    (name for name, target_hash in targets.items() if target_hash == source_hash and name not in kept),
+                    filename
+                )
+
+            target_path = os.path.join(self.target_dir, filename)
+            if targets.get(filename) == source_hash:
+                result["unchanged"].append(filename)
+            else:
+                tmp_path = f"{target_path}.tmp"
+                shutil.copy2(file_info['path'], tmp_path)
+                os.replace(tmp_path, target_path)
+                result["written"].append(filename)
+                logger.debug(f"동기화 완료: {key} -> {filename}")
+
+            kept[filename] = self._manifest_entry(target_path, source_hash)
+            result["synced"][key] = dict(file_info, filename=filename, path=target_path)
+
+        for filename in targets:
+            if filename not in kept:
                 try:
-                    source_path = file_info['path']
-                    target_path = os.path.join(self.target_dir, file_info['filename'])
-                    
-                    # 파일 복사
-                    shutil.copy2(source_path, target_path)
-                    synced_count += 1
-                    synced_files[file_info['filename']] = file_info
-                    
-                    logger.debug(f"동기화 완료: {keyword} -> {file_info['filename']}")
-                    
-                except Exception as e:
-                    logger.error(f"파일 복사 오류 {keyword}: {str(e)}")
-                    continue
-            
-            logger.info(f"최신 데이터 동기화 완료: {synced_count}개 파일")
-            print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] ✅ 최신 데이터 동기화 완료: {synced_count}개 파일")
-            
-            # 동기화 결과 요약 생성
-            self.create_latest_sync_summary(synced_files)
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"최신 데이터 동기화 오류: {str(e)}")
-            print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] ❌ 최신 데이터 동기화 오류: {str(e)}")
-            return False
+                    os.remove(os.path.join(self.target_dir, filename))
+                    result["removed"].append(filename)
+                    logger.debug(f"기존 파일 삭제: {filename}")
+                except OSError as e:
+                    logger.warning(f"파일 삭제 실패 {filename}: {str(e)}")
 
-    def sync_latest_data(self):
-        """최신 데이터만 프론트엔드로 동기화"""
+        result["changed"] = bool(result["written"] or result["removed"])
+        if result["changed"] or kept != manifest:
+            self._save_manifest(kept)
+        self.last_result = result
+        return result
+
+    def _sync(self, sync_type):
+        """최신 통합 파일 증분 동기화 (바뀐 내용이 없으면 파일과 요약을 건드리지 않고 SYNC_NOOP 반환)"""
         try:
             print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] 🔄 데이터 동기화 시작...")
             
             if not self.ensure_target_directory():
                 return False
-                
-            # 기존 파일들 정리 (선택적)
-            self.cleanup_old_files()
             
-            # 키워드별 최신 파일들 가져오기
+            # 키워드별 최신 파일들만 가져오기 (과거 데이터 제외)
             latest_files = self.get_latest_files_by_keyword()
             
             if not latest_files:
                 logger.warning("동기화할 파일이 없습니다")
                 return False
             
-            # 파일 복사
-            synced_count = 0
-            for keyword, file_info in latest_files.items():
-                try:
-                    source_path = file_info['path']
-                    target_path = os.path.join(self.target_dir, file_info['filename'])
-                    
-                    # 파일 복사
-                    shutil.copy2(source_path, target_path)
-                    synced_count += 1
-                    
-                    logger.debug(f"동기화 완료: {keyword} -> {file_info['filename']}")
-                    
-                except Exception as e:
-                    logger.error(f"파일 복사 오류 {keyword}: {str(e)}")
-                    continue
+            result = self.sync_files(latest_files)
+            if not result["changed"]:
+                logger.info(f"동기화 생략: 변경 없음 ({len(result['unchanged'])}개 파일 동일)")
+                print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] ℹ️ 변경 없음 - 동기화 생략 (커밋/푸시 불필요)")
+                return SYNC_NOOP
             
-            logger.info(f"데이터 동기화 완료: {synced_count}개 파일")
-            print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] ✅ 데이터 동기화 완료: {synced_count}개 파일")
+            logger.info(f"데이터 동기화 완료: {len(result['written'])}개 파일 기록, {len(result['removed'])}개 삭제, {len(result['unchanged'])}개 동일")
+            print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] ✅ 데이터 동기화 완료: {len(result['written'])}개 기록, {len(result['removed'])}개 삭제")
             
-            # 동기화 결과 요약 생성
-            self.create_sync_summary(latest_files)
+            # 동기화 결과 요약 생성 (파일이 바뀐 경우에만)
+            if sync_type == "all_files":
+                self.create_latest_sync_summary({info['filename']: info for info in result["synced"].values()})
+            else:
+                self.create_sync_summary(result["synced"])
             
             return True
             
@@ -199,27 +235,13 @@ class DataSyncManager:
             print(f"[{datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}] ❌ 데이터 동기화 오류: {str(e)}")
             return False
 
-    def cleanup_old_files(self, keep_days=7):
-        """기존 파일들 정리"""
-        try:
-            # 타겟 디렉토리의 모든 JSON 파일 삭제 (sync_summary.json 제외)
-            pattern = os.path.join(self.target_dir, "*_enhanced_news_*.json")
-            existing_files = glob.glob(pattern)
-            
-            deleted_count = 0
-            for file_path in existing_files:
-                try:
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logger.debug(f"기존 파일 삭제: {os.path.basename(file_path)}")
-                except Exception as e:
-                    logger.warning(f"파일 삭제 실패 {file_path}: {str(e)}")
-            
-            if deleted_count > 0:
-                logger.info(f"기존 파일 {deleted_count}개 정리 완료")
-            
-        except Exception as e:
-            logger.warning(f"파일 정리 오류: {str(e)}")
+    def sync_all_data(self):
+        """최신 데이터만 프론트엔드로 동기화 (실제로는 키워드별 최신 파일만)"""
+        return self._sync("all_files")
+
+    def sync_latest_data(self):
+        """최신 데이터만 프론트엔드로 동기화"""
+        return self._sync("latest_only")
 
     def create_latest_sync_summary(self, synced_files):
         """최신 데이터 동기화 요약 정보 생성"""
@@ -254,8 +276,7 @@ class DataSyncManager:
             }
             
             summary_path = os.path.join(self.target_dir, "sync_summary.json")
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            self._atomic_write_json(summary_path, summary)
                 
             logger.info(f"최신 데이터 동기화 요약 생성: {summary_path} (실제 키워드 {len(actual_keywords)}개)")
             
@@ -281,8 +302,7 @@ class DataSyncManager:
             }
             
             summary_path = os.path.join(self.target_dir, "sync_summary.json")
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            self._atomic_write_json(summary_path, summary)
                 
             logger.info(f"전체 동기화 요약 생성: {summary_path}")
             
@@ -322,8 +342,7 @@ class DataSyncManager:
             }
             
             summary_path = os.path.join(self.target_dir, "sync_summary.json")
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            self._atomic_write_json(summary_path, summary)
                 
             logger.info(f"동기화 요약 생성: {summary_path} (실제 키워드 {len(actual_keywords)}개)")
             
@@ -379,17 +398,25 @@ def main():
         if sys.argv[1] == "--sync":
             print("🔄 최신 데이터 동기화를 시작합니다...")
             success = sync_data_to_frontend()
-            if success:
+            if success == SYNC_NOOP:
+                print("ℹ️ 변경 없음 - 커밋/푸시 생략")
+                sys.exit(SYNC_NOOP_EXIT_CODE)
+            elif success:
                 print("✅ 동기화 완료!")
             else:
                 print("❌ 동기화 실패!")
+                sys.exit(1)
         elif sys.argv[1] == "--sync-all":
             print("🔄 전체 데이터 동기화를 시작합니다...")
             success = sync_all_data_to_frontend()
-            if success:
+            if success == SYNC_NOOP:
+                print("ℹ️ 변경 없음 - 커밋/푸시 생략")
+                sys.exit(SYNC_NOOP_EXIT_CODE)
+            elif success:
                 print("✅ 전체 동기화 완료!")
             else:
                 print("❌ 전체 동기화 실패!")
+                sys.exit(1)
         elif sys.argv[1] == "--status":
             check_sync_status()
         else:
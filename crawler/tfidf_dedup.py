@@ -0,0 +1,109 @@
+"""
+TF-IDF 일괄 중복 제거
+정규화한 제목/내용을 문자 n-gram TF-IDF 희소 행렬로 만들고, 행 묶음 단위의 희소 행렬 곱으로
+코사인 유사도가 기준 이상인 쌍만 찾아 기존 기준(제목 0.8, 제목 0.6 + 내용 0.7)을 적용
+전체 기록을 한 번에 처리하는 배치 작업용 (scikit-learn 필요)
+"""
+
+import time
+from loguru import logger
+import config
+from near_duplicates import normalize_text, item_content
+
+try:
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+except ImportError:
+    np = None
+    TfidfVectorizer = None
+
+
+def is_available():
+    """scikit-learn 설치 여부"""
+    return TfidfVectorizer is not None
+
+
+def _vectorize(texts):
+    """문자 n-gram TF-IDF 행렬 (행 L2 정규화, 어휘가 없으면 None)"""
+    vectorizer = TfidfVectorizer(analyzer='char', ngram_range=config.DEDUP_TFIDF_NGRAM_RANGE, dtype=np.float32)
+    try:
+        return vectorizer.fit_transform(texts).tocsr()
+    except ValueError:
+        # 모든 텍스트가 비어 있으면 어휘를 만들 수 없음
+        return None
+
+
+class TfidfDedup:
+    """문자 n-gram TF-IDF 코사인 유사도 기반 일괄 중복 제거 (입력 순서대로 먼저 나온 항목을 남김)"""
+
+    def __init__(self, title_threshold=0.8, content_threshold=0.7, title_floor=0.6, chunk_size=None):
+        self.title_threshold = title_threshold
+        self.content_threshold = content_threshold
+        self.title_floor = title_floor
+        self.chunk_size = chunk_size or config.DEDUP_TFIDF_CHUNK_SIZE
+        self.stats = {"items": 0, "unique": 0, "url_matches": 0, "candidate_pairs": 0, "duplicate_pairs": 0, "seconds": 0.0}
+
+    def _similar_pairs(self, titles, contents):
+        """앞선 항목 i와 뒤 항목 j(i < j)의 중복 쌍을 j별 목록으로 반환"""
+        earlier = [[] for _ in titles]
+        title_matrix = _vectorize(titles)
+        if title_matrix is None:
+            return earlier
+        content_matrix = _vectorize(contents)
+
+        size = title_matrix.shape[0]
+        for start in range(0, size, self.chunk_size):
+            end = min(start + self.chunk_size, size)
+            # 묶음 행과 그 이전 행들만 곱해 메모리를 (묶음 크기 x 항목 수) 이내로 제한
+            block = (title_matrix[start:end] @ title_matrix[:end].T).tocoo()
+            rows = block.row + start
+            mask = (block.col < rows) & (block.data >= self.title_floor)
+            rows, cols, title_scores = rows[mask], block.col[mask], block.data[mask]
+            self.stats["candidate_pairs"] += len(rows)
+
+            duplicate = title_scores >= self.title_threshold
+            pending = ~duplicate
+            if content_matrix is not None and pending.any():
+                content_scores = np.asarray(
+                    content_matrix[rows[pending]].multiply(content_matrix[cols[pending]]).sum(axis=1)
+                ).ravel()
+                duplicate[pending] = content_scores >= self.content_threshold
+
+            for row, col in zip(rows[duplicate].tolist(), cols[duplicate].tolist()):
+                earlier[row].append(col)
+            self.stats["duplicate_pairs"] += int(duplicate.sum())
+
+        return earlier
+
+    def deduplicate(self, items):
+        """입력 순서대로 앞서 남긴 항목과 중복인 항목을 제외한 목록"""
+        started = time.perf_counter()
+        titles = [normalize_text(item.get('title', '')) for item in items]
+        contents = [normalize_text(item_content(item)) for item in items]
+        earlier = self._similar_pairs(titles, contents)
+
+        kept = [False] * len(items)
+        urls = set()
+        unique_items = []
+        for index, item in enumerate(items):
+            url = item.get('url')
+            if url in urls:
+                self.stats["url_matches"] += 1
+                continue
+            if any(kept[other] for other in earlier[index]):
+                continue
+            kept[index] = True
+            urls.add(url)
+            unique_items.append(item)
+
+        self.stats["items"] += len(items)
+        self.stats["unique"] += len(unique_items)
+        self.stats["seconds"] += time.perf_counter() - started
+        logger.debug(f"TF-IDF 중복 후보 {self.stats['candidate_pairs']}쌍 중 중복 {self.stats['duplicate_pairs']}쌍")
+        return unique_items
+
+    def get_stats(self):
+        """후보/중복 쌍 수와 소요 시간"""
+        stats = dict(self.stats)
+        stats["seconds"] = round(stats["seconds"], 3)
+        return stats
@@ -0,0 +1,169 @@
+"""
+URL 정규화 (canonical URL)
+같은 글이 PC/모바일 주소, PostView 쿼리 형식, 추적 파라미터가 붙은 주소 등으로 들어오므로
+도메인별 규칙으로 하나의 대표 URL과 해시를 만들고, 유사도 비교 전에 해시 집합으로 정확 중복을 제거
+"""
+
+import re
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import config
+
+BLOG_HOSTS = {"blog.naver.com", "m.blog.naver.com"}
+CAFE_HOSTS = {"cafe.naver.com", "m.cafe.naver.com"}
+NEWS_HOSTS = {"n.news.naver.com", "news.naver.com", "m.news.naver.com", "m.entertain.naver.com", "m.sports.naver.com"}
+YOUTUBE_HOSTS = {"youtube.com", "m.youtube.com", "youtu.be", "music.youtube.com"}
+
+NEWS_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(\d+)/(\d+)')
+CAFE_MOBILE_PATH = re.compile(r'^/ca-fe/web/cafes/([^/]+)/articles/(\d+)')
+YOUTUBE_ID_PATH = re.compile(r'^/(?:shorts|embed|live)/([\w-]{6,})')
+
+
+def _query(parts):
+    return dict(parse_qsl(parts.query, keep_blank_values=True))
+
+
+def _naver_blog(parts, query):
+    """blog.naver.com/{blogId}/{logNo} - PostView/모바일/Redirect 형식 통일"""
+    blog_id, log_no = query.get('blogId'), query.get('logNo')
+    segments = [segment for segment in parts.path.split('/') if segment]
+    if not blog_id and segments and not segments[0].lower().startswith('postview'):
+        blog_id = segments[0]
+        if len(segments) > 1 and segments[1].isdigit():
+            log_no = segments[1]
+    if blog_id and log_no:
+        return f"https://blog.naver.com/{blog_id}/{log_no}"
+    return None
+
+
+def _naver_cafe(parts, query):
+    """cafe.naver.com/{cafe}/{articleId} - 모바일 형식 통일 (clubid 형식은 카페 이름을 알 수 없어 그대로 유지)"""
+    match = CAFE_MOBILE_PATH.match(parts.path)
+    if match:
+        return f"https://cafe.naver.com/{match.group(1)}/{match.group(2)}"
+    segments = [segment for segment in parts.path.split('/') if segment]
+    if len(segments) == 2 and segments[1].isdigit():
+        return f"https://cafe.naver.com/{segments[0]}/{segments[1]}"
+    if query.get('clubid') and query.get('articleid'):
+        return f"https://cafe.naver.com/ArticleRead.nhn?clubid={query['clubid']}&articleid={query['articleid']}"
+    return None
+
+
+def _naver_news(parts, query):
+    """n.news.naver.com/article/{oid}/{aid} - mnews/read.naver/모바일 형식 통일"""
+    match = NEWS_ARTICLE_PATH.match(parts.path)
+    if match:
+        return f"https://n.news.naver.com/article/{match.group(1)}/{match.group(2)}"
+    if query.get('oid') and query.get('aid'):
+        return f"https://n.news.naver.com/article/{query['oid']}/{query['aid']}"
+    return None
+
+
+def _youtube(parts, query):
+    """youtube.com/watch?v={id} - youtu.be/shorts/embed/모바일 형식과 재생 파라미터 통일"""
+    video_id = None
+    if parts.netloc == "youtu.be":
+        video_id = parts.path.strip('/').split('/')[0]
+    elif parts.path == "/watch":
+        video_id = query.get('v')
+    else:
+        match = YOUTUBE_ID_PATH.match(parts.path)
+        if match:
+            video_id = match.group(1)
+    if video_id:
+        return f"https://www.youtube.com/watch?v={video_id}"
+    return None
+
+
+DOMAIN_RULES = [
+    (BLOG_HOSTS, _naver_blog),
+    (CAFE_HOSTS, _naver_cafe),
+    (NEWS_HOSTS, _naver_news),
+    (YOUTUBE_HOSTS, _youtube),
+]
+
+
+def _is_tracking_param(name, host):
+    name = name.lower()
+    if any(name.startswith(prefix) for prefix in config.URL_TRACKING_PARAM_PREFIXES):
+        return True
+    if name in config.URL_TRACKING_PARAMS:
+        return True
+    return any(
+        host == domain or host.endswith("." + domain)
+        for domain, params in config.URL_DOMAIN_TRACKING_PARAMS.items() if name in params
+    )
+
+
+def canonical_url(url):
+    """대표 URL - 도메인별 규칙이 있으면 글 ID 형식으로, 없으면 추적 파라미터 제거/쿼리 정렬/https 통일"""
+    if not url:
+        return ""
+    url = url.strip()
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc.lower().split('@')[-1].split(':')[0]
+    if host.startswith("www."):
+        host = host[4:]
+    parts = parts._replace(netloc=host)
+    query = _query(parts)
+
+    for hosts, rule in DOMAIN_RULES:
+        if host in hosts:
+            canonical = rule(parts, query)
+            if canonical:
+                return canonical
+            break
+
+    params = sorted((name, value) for name, value in query.items() if not _is_tracking_param(name, host))
+    path = re.sub(r'/+$', '', parts.path) or "/"
+    return urlunsplit(("https", host, path, urlencode(params), ""))
+
+
+def _hash(canonical):
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def url_hash(url):
+    """대표 URL의 16자리 해시"""
+    return _hash(canonical_url(url))
+
+
+class UrlCanonicalizer:
+    """대표 URL 해시 집합으로 정확 중복 제거 (항목은 수정하지 않음, 절약한 유사도 비교 수 집계, 스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {"items": 0, "exact_duplicates": 0, "rewritten": 0, "fuzzy_comparisons_saved": 0}
+
+    def deduplicate(self, items):
+        """대표 URL이 같은 항목 중 처음 나온 것만 남김 (URL 없는 항목은 유지)"""
+        unique_items = []
+        seen = set()
+        saved = 0
+        rewritten = 0
+        for item in items:
+            # 대표 URL/해시는 비교에만 쓰고 항목에는 기록하지 않음 (저장 파일/프론트엔드 형식 유지)
+            canonical = canonical_url(item.get('url', ''))
+            if canonical != item.get('url'):
+                rewritten += 1
+            key = _hash(canonical) if canonical else None
+            if key and key in seen:
+                # 전체 쌍 비교였다면 이 항목은 지금까지 남긴 항목 수만큼 비교됐을 것 (최대치)
+                saved += len(unique_items)
+                continue
+            if key:
+                seen.add(key)
+            unique_items.append(item)
+
+        with self.lock:
+            self.stats["rewritten"] += rewritten
+            self.stats["items"] += len(items)
+            self.stats["exact_duplicates"] += len(items) - len(unique_items)
+            self.stats["fuzzy_comparisons_saved"] += saved
+        return unique_items
+
+    def get_stats(self):
+        """대표 URL로 바뀐 항목 수, 정확 중복 수, 절약한 유사도 비교 수"""
+        with self.lock:
+            return dict(self.stats)